@@ -1,180 +1,555 @@
-
-import pandas as pd
-from tabulate import tabulate
-
-
-def load_dataframe(file_path):
-    """
-    Load CSV file into pandas DataFrame.
-    
-    Args:
-        file_path (str): Path to CSV file
-        
-    Returns:
-        DataFrame: Loaded pandas DataFrame
-    """
-    try:
-        df = pd.read_csv(file_path)
-        print(f"\n✓ DataFrame loaded: {len(df)} rows, {len(df.columns)} columns")
-        return df
-    except Exception as e:
-        print(f"Error loading DataFrame: {str(e)}")
-        return None
-
-
-def task_b1_top_species_green(df, green_threshold, season):
-    """
-    Task B1: Find top 3 most frequently sighted species in green zones.
-    Filters by green space threshold and season.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        green_threshold (float): Minimum green space nearby
-        season (str): Season to filter by
-    """
-    print(f"\n=== Task B1: Top 3 Species in Green Zones ===")
-    print(f"Filters: Green Space > {green_threshold}, Season = {season}")
-    
-    # Filter data
-    filtered_df = df[(df['NearbyGreenSpaces'] > green_threshold) & 
-                     (df['Season'].str.lower() == season.lower())]
-    
-    if filtered_df.empty:
-        print("No records found matching criteria.")
-        return
-    
-    # Group by species and sum sightings
-    species_sightings = filtered_df.groupby('WildlifeSpecies')['NumberOfSightings'].sum()
-    top_3_species = species_sightings.nlargest(3)
-    
-    # Display results
-    result_table = []
-    for species, sightings in top_3_species.items():
-        result_table.append([species, sightings])
-    
-    print(tabulate(result_table, 
-                  headers=["WildlifeSpecies", "Total Sightings"],
-                  tablefmt="grid"))
-    print(f"\nTotal records analyzed: {len(filtered_df)}")
-
-
-def task_b2_env_influence_by_city(df, city):
-    """
-    Task B2: Analyze environmental influence on sightings for a specific city.
-    Computes average sightings and duration grouped by weather and TimeOfDay.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        city (str): City name to filter by
-    """
-    print(f"\n=== Task B2: Environmental Influence in {city} ===")
-    
-    # Filter by city
-    city_df = df[df['City'].str.lower() == city.lower()]
-    
-    if city_df.empty:
-        print(f"No records found for city '{city}'.")
-        return
-    
-    # Group by WeatherCondition and TimeOfDay
-    grouped = city_df.groupby(['WeatherCondition', 'TimeOfDay']).agg({
-        'NumberOfSightings': 'mean',
-        'SightingDuration_Min': 'mean'
-    }).round(2)
-    
-    # Display results
-    print("\nAverage Sightings and Duration by Weather & TimeOfDay:")
-    print(grouped.to_string())
-    print(f"\nTotal records analyzed: {len(city_df)}")
-
-
-def task_b3_interaction_analysis(df, interaction_type):
-    """
-    Task B3: Analyze human-wildlife interaction patterns.
-    For specified InteractionType, compute average environmental factors
-    for sightings with duration > average duration for that InteractionType.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        interaction_type (str): Type of interaction to analyze
-    """
-    print(f"\n=== Task B3: Human-Wildlife Interaction Analysis ({interaction_type}) ===")
-    
-    # Filter by InteractionType
-    interaction_df = df[df['InteractionType'].str.lower() == interaction_type.lower()]
-    
-    if interaction_df.empty:
-        print(f"No records found for InteractionType '{interaction_type}'.")
-        return
-    
-    # Calculate average duration for this InteractionType
-    avg_duration = interaction_df['SightingDuration_Min'].mean()
-    print(f"\nAverage sighting duration for '{interaction_type}': {avg_duration:.2f} minutes")
-    
-    # Filter for durations greater than average
-    longer_sightings = interaction_df[interaction_df['SightingDuration_Min'] > avg_duration]
-    
-    if longer_sightings.empty:
-        print("No sightings with duration above average.")
-        return
-    
-    # Group by ResidentialAreaType and compute averages
-    grouped = longer_sightings.groupby('ResidentialAreaType').agg({
-        'NoiseLevel_dB': 'mean',
-        'HumanActivityLevel': lambda x: x.value_counts().index[0] if len(x) > 0 else 'N/A',
-        'LightPollutionLevel': 'mean'
-    }).round(2)
-    
-    grouped.columns = ['Avg NoiseLevel_dB', 'Most Common Activity Level', 'Avg LightPollutionLevel']
-    
-    # Display results
-    print(f"\nAnalysis for sightings with duration > {avg_duration:.2f} min:")
-    print(grouped.to_string())
-    print(f"\nRecords analyzed: {len(longer_sightings)}")
-
-
-def task_b4_custom_endangered_correlation(df):
-    """
-    Task B4 (Custom): Analyze correlation between green space and sightings 
-    for endangered species only.
-    
-    This custom task is unique to Project 1.
-    
-    Args:
-        df (DataFrame): Wildlife data
-    """
-    print(f"\n=== Task B4: Green Space vs Sightings (Endangered Species) ===")
-    
-    # Filter for endangered species
-    endangered_df = df[df['IsEndangeredSpecies'].str.lower() == 'yes']
-    
-    if endangered_df.empty:
-        print("No endangered species found in dataset.")
-        return
-    
-    # Create bins for green space
-    green_bins = [0, 0.2, 0.4, 0.6, 0.8, 1.0]
-    green_labels = ['0-0.2', '0.2-0.4', '0.4-0.6', '0.6-0.8', '0.8-1.0']
-    
-    endangered_df = endangered_df.copy()
-    endangered_df['Green_Space_Range'] = pd.cut(endangered_df['NearbyGreenSpaces'], 
-                                                  bins=green_bins, 
-                                                  labels=green_labels, 
-                                                  include_lowest=True)
-    
-    # Group by green space range
-    grouped = endangered_df.groupby('Green_Space_Range', observed=True).agg({
-        'NumberOfSightings': 'mean',
-        'WildlifeSpecies': 'count'
-    }).round(2)
-    
-    grouped.columns = ['Avg NumberOfSightings', 'Count of Observations']
-    
-    # Display results
-    print("\nCorrelation Analysis (Green Space Ranges):")
-    print(grouped.to_string())
-    print(f"\nTotal endangered species records: {len(endangered_df)}")
-    
-    # Calculate correlation coefficient
-    correlation = endangered_df['NearbyGreenSpaces'].corr(endangered_df['NumberOfSightings'])
-    print(f"\nPearson Correlation Coefficient: {correlation:.4f}")
+
+import sys
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+import column_store
+import cube
+import groupby
+import profiling
+import query
+import result_cache
+import schema
+import streaming
+
+
+def load_dataframe(file_path, tasks=None, optimize=False):
+    """
+    Load CSV file into pandas DataFrame.
+    
+    In optimized mode, categorical columns are read directly as 'category'
+    dtype, integers are downcast to the smallest type that holds them and
+    floats to float32 where every value converts back exactly, and only the
+    columns the selected tasks need are read.
+    
+    Args:
+        file_path (str): Path to CSV file
+        tasks (list): Task ids (e.g. ['B1', 'B3']) whose columns to read;
+                      None reads every column
+        optimize (bool): Use explicit compact dtypes and report memory use
+        
+    Returns:
+        DataFrame: Loaded pandas DataFrame
+    """
+    columns = None
+    if tasks:
+        columns = sorted({column_name for task_id in tasks for column_name in schema.TASK_COLUMNS[task_id]})
+    
+    try:
+        if not optimize:
+            df = pd.read_csv(file_path, usecols=columns)
+            print(f"\n✓ DataFrame loaded: {len(df)} rows, {len(df.columns)} columns")
+            return df
+        
+        dtypes = {column_name: 'category' for column_name in schema.columns_of_type('categorical')
+                  if columns is None or column_name in columns}
+        df = pd.read_csv(file_path, usecols=columns, dtype=dtypes)
+        plain_bytes = estimate_plain_memory(df)
+        downcast_numeric(df)
+        optimized_bytes = df.memory_usage(deep=True).sum()
+        
+        print(f"\n✓ DataFrame loaded: {len(df)} rows, {len(df.columns)} columns")
+        print(f"✓ Memory: {plain_bytes / 1e6:.2f} MB as plain dtypes -> {optimized_bytes / 1e6:.2f} MB optimized "
+              f"({plain_bytes / max(optimized_bytes, 1):.1f}x smaller)")
+        return df
+    except Exception as e:
+        print(f"Error loading DataFrame: {str(e)}")
+        return None
+
+
+def downcast_numeric(df):
+    """
+    Downcast numeric columns in place.
+    
+    Integers go to the smallest integer type that holds their range. Floats
+    go to float32 only when every value converts back exactly, so columns of
+    small whole numbers or binary fractions shrink without changing results.
+    
+    Args:
+        df (DataFrame): Frame to modify
+    """
+    for column_name in df.columns:
+        series = df[column_name]
+        if pd.api.types.is_integer_dtype(series):
+            df[column_name] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True):
+                df[column_name] = narrowed
+
+
+def estimate_plain_memory(df):
+    """
+    Estimate the footprint of a frame loaded with plain pandas dtypes.
+    
+    Numbers count as 64-bit and each categorical value as an 8-byte pointer
+    plus its own Python string object, as pd.read_csv would store it. The
+    estimate comes from category counts, so nothing is materialized.
+    
+    Args:
+        df (DataFrame): Frame with categorical and numeric columns
+        
+    Returns:
+        int: Estimated bytes
+    """
+    total = 0
+    for column_name in df.columns:
+        series = df[column_name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            label_sizes = np.array([sys.getsizeof(label) for label in series.cat.categories], dtype=np.int64)
+            total += 8 * len(series) + int(counts @ label_sizes)
+        else:
+            total += 8 * len(series)
+    return total
+
+
+@profiling.profiled("B1")
+def task_b1_top_species_green(df, green_threshold, season):
+    """
+    Task B1: Find top 3 most frequently sighted species in green zones.
+    Filters by green space threshold and season.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+        green_threshold (float): Minimum green space nearby
+        season (str): Season to filter by
+    """
+    print(f"\n=== Task B1: Top 3 Species in Green Zones ===")
+    print(f"Filters: Green Space > {green_threshold}, Season = {season}")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        result = result_cache.cached(df, 'B1', {'green_threshold': green_threshold, 'season': season},
+                                     lambda: compute_b1_top_species_green(df, green_threshold, season))
+    
+    if result['records_analyzed'] == 0:
+        print("No records found matching criteria.")
+        return
+    
+    # Display results
+    result_table = []
+    for species, sightings in result['top_species'].items():
+        result_table.append([species, sightings])
+    
+    with profiling.stage('format', len(result_table)):
+        print(tabulate(result_table, 
+                      headers=["WildlifeSpecies", "Total Sightings"],
+                      tablefmt="grid"))
+    print(f"\nTotal records analyzed: {result['records_analyzed']}")
+
+
+def compute_b1_top_species_green(df, green_threshold, season):
+    """
+    Compute Task B1 without displaying it.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+        green_threshold (float): Minimum green space nearby
+        season (str): Season to filter by
+        
+    Returns:
+        dict: 'top_species' (Series of total sightings, None if no records)
+              and 'records_analyzed'
+    """
+    filters = [('NearbyGreenSpaces', '>', green_threshold), ('Season', '==', season)]
+    
+    # Total sightings per species
+    sums, _, records_analyzed = cube.grouped_sums(df, ['NumberOfSightings'], ['WildlifeSpecies'], filters)
+    
+    if records_analyzed == 0:
+        return {'top_species': None, 'records_analyzed': 0}
+    return {'top_species': sums['NumberOfSightings'].nlargest(3), 'records_analyzed': records_analyzed}
+
+
+@profiling.profiled("B2")
+def task_b2_env_influence_by_city(df, city):
+    """
+    Task B2: Analyze environmental influence on sightings for a specific city.
+    Computes average sightings and duration grouped by weather and TimeOfDay.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+        city (str): City name to filter by
+    """
+    print(f"\n=== Task B2: Environmental Influence in {city} ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        result = result_cache.cached(df, 'B2', {'city': city}, lambda: compute_b2_env_influence_by_city(df, city))
+    
+    if result['records_analyzed'] == 0:
+        print(f"No records found for city '{city}'.")
+        return
+    
+    # Display results
+    print("\nAverage Sightings and Duration by Weather & TimeOfDay:")
+    with profiling.stage('format', len(result['table'])):
+        print(result['table'].to_string())
+    print(f"\nTotal records analyzed: {result['records_analyzed']}")
+
+
+def compute_b2_env_influence_by_city(df, city):
+    """
+    Compute Task B2 without displaying it.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+        city (str): City name to filter by
+        
+    Returns:
+        dict: 'table' (rounded means by weather and TimeOfDay, None if no
+              records) and 'records_analyzed'
+    """
+    measures = ['NumberOfSightings', 'SightingDuration_Min']
+    group_by = ['WeatherCondition', 'TimeOfDay']
+    
+    # Means by WeatherCondition and TimeOfDay, from sums and counts
+    sums, counts, records_analyzed = cube.grouped_sums(df, measures, group_by, [('City', '==', city)])
+    
+    if records_analyzed == 0:
+        return {'table': None, 'records_analyzed': 0}
+    return {'table': (sums / counts).round(2), 'records_analyzed': records_analyzed}
+
+
+@profiling.profiled("B3")
+def task_b3_interaction_analysis(df, interaction_type):
+    """
+    Task B3: Analyze human-wildlife interaction patterns.
+    For specified InteractionType, compute average environmental factors
+    for sightings with duration > average duration for that InteractionType.
+    
+    Streamed input needs two passes (average duration, then grouping), so
+    it must be a re-iterable chunk source such as streaming.csv_chunk_source.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a chunk source (see streaming.iter_frames)
+        interaction_type (str): Type of interaction to analyze
+    """
+    print(f"\n=== Task B3: Human-Wildlife Interaction Analysis ({interaction_type}) ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        result = result_cache.cached(df, 'B3', {'interaction_type': interaction_type},
+                                     lambda: compute_b3_interaction_analysis(df, interaction_type))
+    
+    if result['records_found'] == 0:
+        print(f"No records found for InteractionType '{interaction_type}'.")
+        return
+    
+    avg_duration = result['avg_duration']
+    print(f"\nAverage sighting duration for '{interaction_type}': {avg_duration:.2f} minutes")
+    
+    if result['records_analyzed'] == 0:
+        print("No sightings with duration above average.")
+        return
+    
+    # Display results
+    print(f"\nAnalysis for sightings with duration > {avg_duration:.2f} min:")
+    with profiling.stage('format', len(result['table'])):
+        print(result['table'].to_string())
+    print(f"\nRecords analyzed: {result['records_analyzed']}")
+
+
+def compute_b3_interaction_analysis(df, interaction_type):
+    """
+    Compute Task B3 without displaying it.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a chunk source (see streaming.iter_frames)
+        interaction_type (str): Type of interaction to analyze
+        
+    Returns:
+        dict: 'records_found', 'avg_duration', 'table' (per
+              ResidentialAreaType, None if no sightings are longer than
+              average) and 'records_analyzed'
+    """
+    # One fused pass over the store's columns when the frame has a store
+    store = column_store.frame_store(df) if isinstance(df, pd.DataFrame) else None
+    if store is not None and all(column_name in store['columns'] for column_name in schema.TASK_COLUMNS['B3']) \
+            and column_store.is_categorical(store, 'ResidentialAreaType'):
+        return fused_b3_interaction_analysis(store, interaction_type)
+    
+    # Pass 1: average duration for this InteractionType
+    duration_sum = 0.0
+    duration_count = 0
+    records_found = 0
+    for frame in streaming.iter_frames(df):
+        durations = frame['SightingDuration_Min'].iloc[column_store.select_rows(frame, 'InteractionType', interaction_type)]
+        duration_sum += durations.sum()
+        duration_count += durations.count()
+        records_found += len(durations)
+    
+    result = {'records_found': records_found, 'avg_duration': None, 'table': None, 'records_analyzed': 0}
+    if records_found == 0:
+        return result
+    
+    avg_duration = duration_sum / duration_count if duration_count else float('nan')
+    result['avg_duration'] = avg_duration
+    
+    # Pass 2: group sightings longer than average by ResidentialAreaType
+    measures = ['NoiseLevel_dB', 'LightPollutionLevel']
+    sums = None
+    counts = None
+    activity_counts = None
+    activity_first_seen = None
+    records_analyzed = 0
+    for frame in streaming.iter_frames(df):
+        longer_sightings = frame.iloc[query.select_frame_rows(frame, [('InteractionType', '==', interaction_type),
+                                                                      ('SightingDuration_Min', '>', avg_duration)])]
+        if longer_sightings.empty:
+            continue
+        
+        grouped = longer_sightings.groupby('ResidentialAreaType', observed=True)
+        sums = streaming.add_partials(sums, grouped[measures].sum())
+        counts = streaming.add_partials(counts, grouped[measures].count())
+        
+        # Activity level counts and first row seen, for the group mode
+        pairs = longer_sightings.assign(_row=longer_sightings.index).groupby(
+            ['ResidentialAreaType', 'HumanActivityLevel'], observed=True)['_row']
+        activity_counts = streaming.add_partials(activity_counts, pairs.count())
+        first_seen = pairs.min()
+        activity_first_seen = first_seen if activity_first_seen is None else \
+            activity_first_seen.combine(first_seen, min, fill_value=float('inf'))
+        records_analyzed += len(longer_sightings)
+    
+    if records_analyzed == 0:
+        return result
+    
+    means = sums / counts
+    grouped = pd.DataFrame({
+        'NoiseLevel_dB': means['NoiseLevel_dB'],
+        'HumanActivityLevel': group_modes(activity_counts, activity_first_seen),
+        'LightPollutionLevel': means['LightPollutionLevel']
+    }).round(2)
+    
+    grouped.columns = ['Avg NoiseLevel_dB', 'Most Common Activity Level', 'Avg LightPollutionLevel']
+    
+    result['table'] = grouped
+    result['records_analyzed'] = records_analyzed
+    return result
+
+
+def fused_b3_interaction_analysis(dataset, interaction_type):
+    """
+    Compute Task B3 from the columnar store in one pass over the matches.
+    
+    The InteractionType rows come from the equality index; the average
+    duration, the longer than average subset and the per-area means and
+    activity mode (see groupby.group_by) are all computed on arrays, with
+    no per-group Python calls.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        interaction_type (str): Type of interaction to analyze
+        
+    Returns:
+        dict: See compute_b3_interaction_analysis
+    """
+    rows = query.run_query(dataset, [('InteractionType', '==', interaction_type)])
+    result = {'records_found': len(rows), 'avg_duration': None, 'table': None, 'records_analyzed': 0}
+    if len(rows) == 0:
+        return result
+    
+    durations = pd.Series(dataset['columns']['SightingDuration_Min'][rows])
+    avg_duration = durations.sum() / durations.count() if durations.count() else float('nan')
+    result['avg_duration'] = avg_duration
+    
+    # NaN durations (and a NaN average) never compare greater
+    longer = rows[durations.to_numpy() > avg_duration]
+    if len(longer) == 0:
+        return result
+    
+    groups = groupby.group_by(dataset, ['ResidentialAreaType'],
+                              [('NoiseLevel_dB', 'mean'), ('HumanActivityLevel', 'mode'),
+                               ('LightPollutionLevel', 'mean')], row_ids=longer)
+    grouped = groups[['NoiseLevel_dB_mean', 'HumanActivityLevel_mode', 'LightPollutionLevel_mean']].round(2)
+    
+    grouped.columns = ['Avg NoiseLevel_dB', 'Most Common Activity Level', 'Avg LightPollutionLevel']
+    
+    result['table'] = grouped
+    result['records_analyzed'] = len(longer)
+    return result
+
+
+def group_modes(value_counts, first_seen):
+    """
+    Pick the most common value per group from merged (group, value) counts.
+    
+    Ties go to the value that appeared first, matching value_counts().
+    
+    Args:
+        value_counts (Series): Counts indexed by (group, value)
+        first_seen (Series): First row number indexed by (group, value)
+        
+    Returns:
+        Series: Most common value per group
+    """
+    ranking = pd.DataFrame({'count': value_counts, 'first': first_seen}).reset_index(level=1)
+    ranking = ranking.sort_values(['count', 'first'], ascending=[False, True], kind='stable')
+    value_column = ranking.columns[0]
+    return ranking[~ranking.index.duplicated(keep='first')][value_column].sort_index()
+
+
+@profiling.profiled("B4")
+def task_b4_custom_endangered_correlation(df):
+    """
+    Task B4 (Custom): Analyze correlation between green space and sightings 
+    for endangered species only.
+    
+    This custom task is unique to Project 1.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+    """
+    print(f"\n=== Task B4: Green Space vs Sightings (Endangered Species) ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        result = result_cache.cached(df, 'B4', {}, lambda: compute_b4_custom_endangered_correlation(df))
+    
+    if result['records_analyzed'] == 0:
+        print("No endangered species found in dataset.")
+        return
+    
+    # Display results
+    print("\nCorrelation Analysis (Green Space Ranges):")
+    with profiling.stage('format', len(result['table'])):
+        print(result['table'].to_string())
+    print(f"\nTotal endangered species records: {result['records_analyzed']}")
+    
+    print(f"\nPearson Correlation Coefficient: {result['correlation']:.4f}")
+
+
+def compute_b4_custom_endangered_correlation(df):
+    """
+    Compute Task B4 without displaying it.
+    
+    Args:
+        df (DataFrame): Wildlife data, or a stream of chunks (see streaming.iter_frames)
+        
+    Returns:
+        dict: 'table' (per green space range, None if there are no
+              endangered records), 'records_analyzed' and 'correlation'
+    """
+    # Create bins for green space
+    green_bins = [0, 0.2, 0.4, 0.6, 0.8, 1.0]
+    green_labels = ['0-0.2', '0.2-0.4', '0.4-0.6', '0.6-0.8', '0.8-1.0']
+    
+    # Per-bin sums/counts and the running moments behind Pearson's r
+    sums = None
+    counts = None
+    moments = chunk_moments(np.empty(0), np.empty(0))
+    records_analyzed = 0
+    for frame in streaming.iter_frames(df):
+        # Filter for endangered species
+        endangered_df = frame.iloc[column_store.select_rows(frame, 'IsEndangeredSpecies', 'yes')]
+        if endangered_df.empty:
+            continue
+        
+        green_ranges = pd.cut(endangered_df['NearbyGreenSpaces'], 
+                              bins=green_bins, 
+                              labels=green_labels, 
+                              include_lowest=True)
+        
+        # Group by green space range (the bins are the group keys)
+        grouped = groupby.group_arrays(
+            {'Green_Space_Range': green_ranges},
+            {'NumberOfSightings': endangered_df['NumberOfSightings'].to_numpy(dtype=float),
+             'WildlifeSpecies': endangered_df['WildlifeSpecies']},
+            [('NumberOfSightings', 'sum'), ('NumberOfSightings', 'count'), ('WildlifeSpecies', 'count')])
+        sums = streaming.add_partials(sums, grouped['NumberOfSightings_sum'])
+        counts = streaming.add_partials(counts, grouped[['NumberOfSightings_count', 'WildlifeSpecies_count']])
+        
+        pairs = endangered_df[['NearbyGreenSpaces', 'NumberOfSightings']].dropna()
+        moments = merge_moments(moments, chunk_moments(pairs['NearbyGreenSpaces'].to_numpy(dtype=float),
+                                                       pairs['NumberOfSightings'].to_numpy(dtype=float)))
+        records_analyzed += len(endangered_df)
+    
+    if records_analyzed == 0:
+        return {'table': None, 'records_analyzed': 0, 'correlation': None}
+    
+    grouped = pd.DataFrame({
+        'NumberOfSightings': sums / counts['NumberOfSightings_count'],
+        'WildlifeSpecies': counts['WildlifeSpecies_count'].astype(int)
+    }).round(2)
+    
+    grouped.columns = ['Avg NumberOfSightings', 'Count of Observations']
+    
+    # Calculate correlation coefficient
+    return {'table': grouped, 'records_analyzed': records_analyzed, 'correlation': pearson_from_moments(moments)}
+
+
+def chunk_moments(x, y):
+    """
+    Compute the centered moments of one chunk of (x, y) pairs.
+    
+    Args:
+        x (ndarray): First variable, without missing values
+        y (ndarray): Second variable, aligned with x
+        
+    Returns:
+        dict: 'n', the means 'mean_x' and 'mean_y', the sums of squared
+              deviations 'm2_x' and 'm2_y', and the sum of co-deviations 'c_xy'
+    """
+    if len(x) == 0:
+        return {'n': 0, 'mean_x': 0.0, 'mean_y': 0.0, 'm2_x': 0.0, 'm2_y': 0.0, 'c_xy': 0.0}
+    mean_x = x.mean()
+    mean_y = y.mean()
+    dx = x - mean_x
+    dy = y - mean_y
+    return {
+        'n': len(x),
+        'mean_x': float(mean_x),
+        'mean_y': float(mean_y),
+        'm2_x': float(np.dot(dx, dx)),
+        'm2_y': float(np.dot(dy, dy)),
+        'c_xy': float(np.dot(dx, dy))
+    }
+
+
+def merge_moments(total, partial):
+    """
+    Merge two sets of centered moments (Chan et al.'s parallel update).
+    
+    Unlike raw sums of x*x and x*y, centered moments do not lose precision
+    to cancellation when the means are large relative to the spread.
+    
+    Args:
+        total (dict): Running moments (see chunk_moments)
+        partial (dict): Moments of one chunk
+        
+    Returns:
+        dict: Moments of both sets of pairs
+    """
+    if partial['n'] == 0:
+        return total
+    if total['n'] == 0:
+        return partial
+    n = total['n'] + partial['n']
+    delta_x = partial['mean_x'] - total['mean_x']
+    delta_y = partial['mean_y'] - total['mean_y']
+    weight = total['n'] * partial['n'] / n
+    return {
+        'n': n,
+        'mean_x': total['mean_x'] + delta_x * partial['n'] / n,
+        'mean_y': total['mean_y'] + delta_y * partial['n'] / n,
+        'm2_x': total['m2_x'] + partial['m2_x'] + delta_x * delta_x * weight,
+        'm2_y': total['m2_y'] + partial['m2_y'] + delta_y * delta_y * weight,
+        'c_xy': total['c_xy'] + partial['c_xy'] + delta_x * delta_y * weight
+    }
+
+
+def pearson_from_moments(moments):
+    """
+    Compute Pearson's r from merged centered moments.
+    
+    Args:
+        moments (dict): Moments of all pairs (see merge_moments)
+        
+    Returns:
+        float: Correlation coefficient, or NaN when undefined
+    """
+    if moments['n'] < 2 or moments['m2_x'] <= 0 or moments['m2_y'] <= 0:
+        return float('nan')
+    return moments['c_xy'] / (moments['m2_x'] * moments['m2_y']) ** 0.5
@@ -0,0 +1,219 @@
+"""
+Append Module for Project 1 (Procedural Style)
+Adds new rows to a loaded in-memory dataset, from a DataFrame or by
+following the end of its CSV file, and keeps the column buffers,
+dictionaries, indexes and aggregate cube up to date in time proportional
+to the new rows instead of reloading the file.
+Variable naming: snake_case
+
+Each append gives the dataset a new fingerprint, so results cached for the
+old rows (see result_cache) are no longer returned. Rows are read up to the
+last complete line; as in ingest.py, quoted fields with embedded newlines
+are not supported.
+"""
+
+import hashlib
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import column_store
+import cube
+import profiling
+import schema
+
+
+# Seconds between checks for new rows in follow_csv
+FOLLOW_INTERVAL_S = 1.0
+
+
+def next_fingerprint(dataset, n_rows, n_bytes=0):
+    """
+    Derive the fingerprint of a dataset after an append.
+    
+    The new hash chains the old one with the appended rows' column
+    buffers, so two different appends never share a version, without
+    rehashing the file.
+    
+    Args:
+        dataset (dict): Dataset after the append
+        n_rows (int): Number of rows before the append
+        n_bytes (int): Bytes of the source file the rows were read from
+        
+    Returns:
+        dict: New fingerprint (see dataset_cache.file_fingerprint), or
+              None if the dataset had none
+    """
+    fingerprint = dataset['fingerprint']
+    if fingerprint is None:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(fingerprint['hash'].encode())
+    for column_name in dataset['header']:
+        values = dataset['columns'][column_name][n_rows:]
+        digest.update(values.tobytes())
+        if column_store.is_categorical(dataset, column_name):
+            # Codes alone do not tell new labels apart
+            labels = dataset['labels'][column_name]
+            digest.update(repr([labels[code] for code in np.unique(values[values >= 0])]).encode())
+    return {
+        'size': fingerprint['size'] + n_bytes,
+        'mtime_ns': fingerprint['mtime_ns'],
+        'hash': digest.hexdigest()
+    }
+
+
+def append_report(dataset, n_rows):
+    """
+    Update the validation report with the rows appended after n_rows.
+    
+    Args:
+        dataset (dict): Dataset after the append
+        n_rows (int): Number of rows before the append
+        
+    Returns:
+        dict: Report over all rows (see schema.make_report)
+    """
+    report = dataset['report']
+    invalid_counts = {}
+    bad_rows = np.zeros(dataset['n_rows'] - n_rows, dtype=bool)
+    for column_name in dataset['header']:
+        values = dataset['columns'][column_name][n_rows:]
+        invalid = ~column_store.values_mask(dataset, column_name, values)
+        invalid_counts[column_name] = report['columns'][column_name]['invalid'] + int(np.count_nonzero(invalid))
+        if column_name in schema.COLUMN_TYPES:
+            bad_rows |= invalid
+    return schema.make_report(dataset['header'], dataset['n_rows'], invalid_counts,
+                              report['bad_rows'] + np.count_nonzero(bad_rows))
+
+
+def append_rows(dataset, rows, n_bytes=0):
+    """
+    Append rows to an in-memory dataset.
+    
+    The column buffers, category dictionaries, the equality and range
+    indexes and the cube cells already built are extended with the new
+    rows only (see column_store.append_columns and cube.append_cube); the
+    validation report, the fingerprint and the frame are updated to match.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        rows (DataFrame): Rows to append, with the dataset's column names
+        n_bytes (int): Bytes of the CSV file the rows came from (0 for rows
+                       that are not in the file)
+        
+    Returns:
+        int: Number of rows appended
+        
+    Raises:
+        ValueError: For a memory-mapped dataset, whose columns are read-only
+    """
+    if dataset['frame'] is None:
+        raise ValueError("Memory-mapped datasets cannot be appended to; reload the file instead.")
+    if len(rows) == 0:
+        return 0
+    
+    with profiling.task('append', len(rows)):
+        with profiling.stage('index', len(rows)):
+            n_rows = column_store.append_columns(dataset, rows)
+        with profiling.stage('aggregate', len(rows)):
+            cube.append_cube(dataset, n_rows)
+        if dataset.get('report') is not None:
+            dataset['report'] = append_report(dataset, n_rows)
+        dataset['fingerprint'] = next_fingerprint(dataset, n_rows, n_bytes)
+        column_store.refresh_frame(dataset)
+    return len(rows)
+
+
+def read_new_rows(dataset, file_path, offset):
+    """
+    Parse the complete lines added to a CSV file after a byte offset.
+    
+    Args:
+        dataset (dict): Dataset the rows will be appended to
+        file_path (str): Path to the CSV file
+        offset (int): End of the data already loaded
+        
+    Returns:
+        tuple: (DataFrame of new rows, or None if there are none, byte
+                offset just past the last complete line read)
+        
+    Raises:
+        ValueError: If the file shrank or its header changed, i.e. it was
+                    rewritten rather than appended to
+    """
+    with open(file_path, 'rb') as file:
+        header = file.readline()
+        file_size = os.fstat(file.fileno()).st_size
+        if file_size < offset:
+            raise ValueError(f"'{file_path}' is shorter than the data already loaded.")
+        file.seek(offset)
+        data = file.read(file_size - offset)
+    
+    data = data[:data.rfind(b"\n") + 1]
+    if not data.strip():
+        return None, offset + len(data)
+    
+    # Categorical columns stay text, so "10" matches the label "10"
+    text_columns = {column_name: str for column_name, labels in dataset['labels'].items()
+                    if all(isinstance(label, str) for label in labels[:1])}
+    rows = pd.read_csv(io.BytesIO(header + data), dtype=text_columns)
+    if list(rows.columns) != dataset['header']:
+        raise ValueError(f"The header of '{file_path}' no longer matches the loaded data.")
+    return rows, offset + len(data)
+
+
+def poll_csv(dataset, state):
+    """
+    Append any rows added to the dataset's CSV file since the last poll.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        state (dict): Follow position; pass {} the first time, and it starts
+                      from the end of the data the dataset was loaded from
+        
+    Returns:
+        int: Number of rows appended (0 if the file did not grow)
+        
+    Raises:
+        ValueError: If the file was rewritten (see read_new_rows) or the
+                    dataset is memory-mapped
+        OSError: If the file cannot be read
+    """
+    if 'offset' not in state:
+        state['file_path'] = dataset['file_path']
+        fingerprint = dataset['fingerprint']
+        state['offset'] = fingerprint['size'] if fingerprint else os.path.getsize(dataset['file_path'])
+    
+    with profiling.stage('parse') as record:
+        rows, offset = read_new_rows(dataset, state['file_path'], state['offset'])
+        record['rows'] = 0 if rows is None else len(rows)
+    appended = 0 if rows is None else append_rows(dataset, rows, offset - state['offset'])
+    state['offset'] = offset
+    return appended
+
+
+def follow_csv(dataset, interval=FOLLOW_INTERVAL_S):
+    """
+    Follow the dataset's CSV file like 'tail -f', appending new rows.
+    
+    Rows are appended in the caller's thread between iterations, so tasks
+    run by the caller never see a half-applied append.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        interval (float): Seconds to wait while the file is unchanged
+        
+    Yields:
+        int: Number of rows appended by each poll that found some
+    """
+    state = {}
+    while True:
+        appended = poll_csv(dataset, state)
+        if appended:
+            yield appended
+        else:
+            time.sleep(interval)
@@ -0,0 +1,277 @@
+"""
+Batch Module for Project 1 (Procedural Style)
+Runs many Task A/B/C invocations from a JSON/YAML job file or the command
+line in one process, against a dataset loaded once, and writes each
+result to a file instead of the terminal. Charts are rendered headless.
+Variable naming: snake_case
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+
+import cube
+import export
+import loader
+import result_cache
+import retriever
+import scheduler
+import visualizer_p1
+
+
+DEFAULT_OUTPUT_DIR = "batch_results"
+SUMMARY_FILE = "batch_summary.json"
+
+
+def read_job_file(path):
+    """
+    Read a batch job file.
+    
+    The file is JSON, or YAML when it ends in .yaml/.yml (needs PyYAML):
+    
+        {"csv": "Urban_wildlife.csv", "output_dir": "batch_results",
+         "jobs": [{"task": "A1", "params": {"city": ["Karachi", "Lahore"]}},
+                  {"task": "B1", "params": {"season": ["Spring", "Summer"],
+                                            "green_threshold": [0.3, 0.5]}}]}
+    
+    Args:
+        path (str): Path to the job file
+        
+    Returns:
+        dict: Parsed job file
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        if path.lower().endswith(('.yaml', '.yml')):
+            import yaml
+            return yaml.safe_load(file)
+        return json.load(file)
+
+
+def parse_job_argument(text):
+    """
+    Parse a --job command-line argument such as "B1 season=Spring,Summer green_threshold=0.3".
+    
+    Args:
+        text (str): Task id followed by name=value[,value...] pairs
+        
+    Returns:
+        dict: Job with 'task' and 'params' (lists of string values)
+    """
+    parts = text.split()
+    params = {}
+    for part in parts[1:]:
+        name, _, values = part.partition('=')
+        params[name] = values.split(',')
+    return {'task': parts[0].upper(), 'params': params}
+
+
+def expand_jobs(job_specs):
+    """
+    Expand job specs into single task invocations.
+    
+    A parameter given as a list runs the task for every value, and several
+    list parameters run it for every combination.
+    
+    Args:
+        job_specs (list): Jobs with 'task' and 'params'
+        
+    Returns:
+        list: (task_id, params) pairs with typed parameter values
+        
+    Raises:
+        ValueError: For an unknown task, a missing or unknown parameter, or
+                    a value that is not a number where one is required
+    """
+    invocations = []
+    for job in job_specs:
+        task_id = str(job['task']).upper()
+        if task_id not in scheduler.TASKS:
+            raise ValueError(f"Unknown task '{task_id}'.")
+        
+        param_types = scheduler.TASKS[task_id][1]
+        given = job.get('params') or {}
+        unknown = set(given) - {name for name, _ in param_types}
+        if unknown:
+            raise ValueError(f"Unknown parameter(s) for {task_id}: {', '.join(sorted(unknown))}")
+        
+        value_lists = []
+        for name, value_type in param_types:
+            if name not in given:
+                raise ValueError(f"Missing parameter '{name}' for {task_id}.")
+            values = given[name] if isinstance(given[name], list) else [given[name]]
+            value_lists.append([value_type(value) for value in values])
+        
+        for combination in itertools.product(*value_lists):
+            invocations.append((task_id, dict(zip([name for name, _ in param_types], combination))))
+    return invocations
+
+
+def job_file_name(index, task_id, params):
+    """
+    Build the output file name of an invocation.
+    
+    Args:
+        index (int): Position of the invocation
+        task_id (str): Task id
+        params (dict): Task parameters
+        
+    Returns:
+        str: File name such as "003_B1_green_threshold-0.3_season-Spring.txt"
+    """
+    parts = [f"{index:03d}", task_id]
+    for name, value in params.items():
+        slug = "".join(char if char.isalnum() or char in '.-' else '-' for char in str(value).strip())
+        parts.append(f"{name}-{slug}")
+    return "_".join(parts) + ".txt"
+
+
+def run_batch(dataset, invocations, output_dir, workers=None, export_format=None):
+    """
+    Run task invocations against a loaded dataset and write their results.
+    
+    Duplicates (equal after result cache key normalization) are computed
+    once and share one output file; the rest run through the scheduler,
+    which spreads them over a process pool for large datasets. Charts from
+    Task C are saved into output_dir. With export_format, every match of a
+    Task A job is also written to a file next to its report (the report
+    itself only shows the first retriever.DISPLAY_LIMIT).
+    
+    Args:
+        dataset (dict): Loaded dataset
+        invocations (list): (task_id, params) pairs (see expand_jobs)
+        output_dir (str): Directory for result files
+        workers (int): Worker processes (None for one per CPU)
+        export_format (str): Key of export.EXPORT_FORMATS, or None
+        
+    Returns:
+        list: Summary entry per invocation, in input order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    version = result_cache.dataset_version(dataset)
+    
+    # First invocation of each distinct key runs; later ones share its output
+    first_index = {}
+    for index, (task_id, params) in enumerate(invocations):
+        first_index.setdefault(result_cache.make_key(task_id, params, version), index)
+    unique = sorted(first_index.values())
+    
+    # Drawing charts is worth a pool whatever the dataset size
+    to_run = [invocations[index] for index in unique]
+    min_rows = 0 if any(task_id.startswith('C') for task_id, _ in to_run) else scheduler.PARALLEL_MIN_ROWS
+    results = scheduler.run_tasks(dataset, to_run, workers, output_dir, min_rows)
+    
+    written = {}
+    for index, result in zip(unique, results):
+        task_id, params = invocations[index]
+        entry = {'task': task_id, 'params': params, 'seconds': round(result['seconds'], 6)}
+        if result['error'] is None:
+            file_name = job_file_name(index, task_id, params)
+            with open(os.path.join(output_dir, file_name), 'w', encoding='utf-8') as file:
+                file.write(result['report'])
+            entry.update(output=file_name, status='ok')
+            if export_format and task_id in retriever.RETRIEVAL_TASKS:
+                export_name = os.path.splitext(file_name)[0] + export.EXPORT_FORMATS[export_format]
+                export.export_retrieval(dataset, task_id, params, os.path.join(output_dir, export_name), export_format)
+                entry['export'] = export_name
+        else:
+            entry.update(output=None, status='error', error=result['error'])
+        written[index] = entry
+    
+    summary = []
+    for task_id, params in invocations:
+        entry = written[first_index[result_cache.make_key(task_id, params, version)]]
+        if entry['params'] is params:
+            summary.append(entry)
+        else:
+            summary.append(dict(entry, params=params, seconds=0.0, shared=True))
+    
+    with open(os.path.join(output_dir, SUMMARY_FILE), 'w', encoding='utf-8') as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+
+def build_argument_parser():
+    """
+    Build the batch command-line parser.
+    
+    Returns:
+        ArgumentParser: Parser for the batch options
+    """
+    parser = argparse.ArgumentParser(description="Run Urban Wildlife tasks in batch.")
+    parser.add_argument('job_file', nargs='?', help="JSON or YAML job file")
+    parser.add_argument('--csv', help="CSV file (overrides the job file)")
+    parser.add_argument('--output-dir', help=f"Result directory (default '{DEFAULT_OUTPUT_DIR}')")
+    parser.add_argument('--job', action='append', default=[],
+                        help='Task invocation, e.g. "A1 city=Karachi,Lahore" (repeatable)')
+    parser.add_argument('--result-cache', help="File to load and save the result cache")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--export', choices=list(export.EXPORT_FORMATS),
+                        help="Also write every Task A match to a file in this format")
+    parser.add_argument('--all-charts', action='store_true',
+                        help="Also render C1 for every season and C2/C3 for every city, plus C4")
+    return parser
+
+
+def main(argv=None):
+    """
+    Batch entry point.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit status
+    """
+    args = build_argument_parser().parse_args(argv)
+    
+    job_file = read_job_file(args.job_file) if args.job_file else {}
+    job_specs = list(job_file.get('jobs', [])) + [parse_job_argument(text) for text in args.job]
+    csv_path = args.csv or job_file.get('csv') or "Urban_wildlife.csv"
+    output_dir = args.output_dir or job_file.get('output_dir') or DEFAULT_OUTPUT_DIR
+    
+    try:
+        invocations = expand_jobs(job_specs)
+    except (KeyError, ValueError) as e:
+        print(f"Error in job list: {str(e)}")
+        return 2
+    if not invocations and not args.all_charts:
+        print("No jobs given.")
+        return 2
+    if args.export and not export.format_available(args.export):
+        print(f"Error: {args.export} export needs pyarrow (pip install pyarrow).")
+        return 2
+    
+    is_valid, message = loader.validate_csv_file(csv_path)
+    if not is_valid:
+        print(message)
+        return 1
+    
+    # Load once; every invocation runs against the same warm store
+    dataset = loader.load_dataset(csv_path)
+    if dataset is None:
+        return 1
+    cube.build_cube(dataset)
+    if args.all_charts:
+        invocations += scheduler.chart_invocations(dataset)
+    
+    # Charts are only saved in batch mode, never shown
+    visualizer_p1.set_headless(True)
+    
+    if args.result_cache:
+        result_cache.load_results(args.result_cache, result_cache.dataset_version(dataset))
+    
+    summary = run_batch(dataset, invocations, output_dir, args.workers, args.export)
+    
+    if args.result_cache:
+        result_cache.save_results(args.result_cache)
+    
+    failed = sum(1 for entry in summary if entry['status'] != 'ok')
+    print(f"\n✓ {len(summary) - failed}/{len(summary)} jobs written to '{output_dir}'")
+    result_cache.print_cache_stats()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
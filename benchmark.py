@@ -0,0 +1,496 @@
+"""
+Benchmark Module for Project 1 (Procedural Style)
+Generates synthetic datasets shaped like Urban_wildlife.csv at several
+sizes, times and memory-profiles loading and every Task A/B/C function on
+each, writes the results as JSON and flags regressions against a stored
+baseline.
+Variable naming: snake_case
+
+Usage:
+    python benchmark.py --sizes 10k 1m --output bench.json
+    python benchmark.py --sizes 10k --compare bench.json
+    python benchmark.py --sizes 1m --tasks B1 C1 --frame-load
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import analyzer
+import column_store
+import groupby
+import loader
+import result_cache
+import scheduler
+import schema
+import visualizer_p1
+
+
+# Benchmark sizes by name
+BENCH_SIZES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000, '50m': 50_000_000}
+DEFAULT_SIZES = ['10k', '1m']
+
+SOURCE_CSV = "Urban_wildlife.csv"
+BENCH_DIR = "bench_data"
+GENERATE_CHUNK_ROWS = 1_000_000
+SEED = 731
+
+# Parameters each task is benchmarked with (labels present in the source data)
+BENCH_PARAMS = {
+    'A1': {'city': "Karachi"},
+    'A2': {'time_of_day': "Morning", 'aqi_threshold': 100.0},
+    'A3': {'min_urban_dev_index': 0.5, 'min_proximity_to_water': 5.0},
+    'A4': {'min_duration': 30.0, 'season': "Spring"},
+    'B1': {'green_threshold': 0.3, 'season': "Spring"},
+    'B2': {'city': "Karachi"},
+    'B3': {'interaction_type': "Fed"},
+    'B4': {},
+    'C1': {'season': "Summer"},
+    'C2': {'city': "Karachi"},
+    'C3': {'city': "Lahore"},
+    'C4': {}
+}
+
+# Group-bys timed on the groupby engine and on pandas: keys and (column, op) aggregations
+GROUPBY_CASES = {
+    'species': (['WildlifeSpecies'], [('NumberOfSightings', 'sum')]),
+    'weather_time': (['WeatherCondition', 'TimeOfDay'],
+                     [('NumberOfSightings', 'mean'), ('SightingDuration_Min', 'mean')]),
+    'area_mode': (['ResidentialAreaType'], [('NoiseLevel_dB', 'mean'), ('HumanActivityLevel', 'mode')]),
+    'city_season_area': (['City', 'Season', 'ResidentialAreaType'],
+                         [('Temperature', 'mean'), ('Temperature', 'var'), ('Humidity', 'min'), ('Humidity', 'max')])
+}
+
+# A stage regresses when it is this much slower than the baseline...
+REGRESSION_TOLERANCE = 0.20
+# ...and slower by at least this many seconds (ignores timer noise)
+REGRESSION_MIN_SECONDS = 0.005
+
+
+def column_profiles(source_csv):
+    """
+    Describe each column of the source data for the generator.
+    
+    Categorical columns keep their label frequencies. Numeric columns keep
+    their sorted values, sampled through the empirical quantile function,
+    and whether they are integral and how many are missing.
+    
+    Args:
+        source_csv (str): Path to the CSV to imitate
+        
+    Returns:
+        dict: column name -> profile dict
+    """
+    source = pd.read_csv(source_csv)
+    profiles = {}
+    for column_name in source.columns:
+        series = source[column_name]
+        missing = float(series.isna().mean())
+        if schema.COLUMN_TYPES.get(column_name) == 'numeric' and pd.api.types.is_numeric_dtype(series):
+            values = np.sort(series.dropna().to_numpy(dtype=float))
+            profiles[column_name] = {'kind': 'numeric', 'values': values, 'missing': missing,
+                                     'integral': bool(np.all(values == np.round(values)))}
+        else:
+            frequencies = series.value_counts(normalize=True, dropna=True)
+            profiles[column_name] = {'kind': 'categorical', 'labels': frequencies.index.to_numpy(dtype=object),
+                                     'p': frequencies.to_numpy(), 'missing': missing}
+    return profiles
+
+
+def generate_chunk(profiles, n_rows, rng):
+    """
+    Generate synthetic rows following the column profiles.
+    
+    Args:
+        profiles (dict): Profiles from column_profiles
+        n_rows (int): Rows to generate
+        rng (Generator): NumPy random generator
+        
+    Returns:
+        DataFrame: Synthetic rows, columns in source order
+    """
+    data = {}
+    for column_name, profile in profiles.items():
+        if profile['kind'] == 'numeric':
+            values = np.quantile(profile['values'], rng.random(n_rows))
+            if profile['integral']:
+                values = np.round(values)
+        else:
+            values = profile['labels'][rng.choice(len(profile['labels']), size=n_rows, p=profile['p'])]
+        if profile['missing']:
+            values = pd.Series(values).where(rng.random(n_rows) >= profile['missing'])
+            if profile['kind'] == 'numeric' and profile['integral']:
+                values = values.astype('Int64')
+        elif profile['kind'] == 'numeric' and profile['integral']:
+            values = values.astype(np.int64)
+        data[column_name] = values
+    return pd.DataFrame(data)
+
+
+def generate_dataset(n_rows, path, source_csv=SOURCE_CSV, seed=SEED):
+    """
+    Write a synthetic CSV, chunk by chunk so memory stays bounded.
+    
+    Args:
+        n_rows (int): Rows to generate
+        path (str): Output CSV path
+        source_csv (str): CSV whose schema and distributions are imitated
+        seed (int): Random seed (the same seed gives the same file)
+    """
+    profiles = column_profiles(source_csv)
+    rng = np.random.default_rng(seed)
+    temp_path = path + ".tmp"
+    written = 0
+    with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+        while written < n_rows:
+            chunk_rows = min(GENERATE_CHUNK_ROWS, n_rows - written)
+            generate_chunk(profiles, chunk_rows, rng).to_csv(file, index=False, header=written == 0)
+            written += chunk_rows
+    os.replace(temp_path, path)
+
+
+def synthetic_path(size_name, seed=SEED):
+    """
+    Get the path of the synthetic CSV for a size, generating it if needed.
+    
+    Args:
+        size_name (str): Key of BENCH_SIZES
+        seed (int): Random seed
+        
+    Returns:
+        str: CSV path
+    """
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    path = os.path.join(BENCH_DIR, f"synthetic_{size_name}_{seed}.csv")
+    if not os.path.isfile(path):
+        print(f"Generating {BENCH_SIZES[size_name]} synthetic rows -> {path}")
+        generate_dataset(BENCH_SIZES[size_name], path, seed=seed)
+    return path
+
+
+def measure(function, trace_memory):
+    """
+    Time a call, optionally tracing its peak Python memory allocation.
+    
+    Args:
+        function (function): Zero-argument function
+        trace_memory (bool): Trace allocations with tracemalloc (slower)
+        
+    Returns:
+        tuple: (return value, seconds, peak bytes or None)
+    """
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        value = function()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return value, seconds, peak
+
+
+def run_stage(function, repeat, trace_memory):
+    """
+    Run a benchmark stage several times and keep the fastest time.
+    
+    Memory is measured on one extra traced run, so tracing does not skew
+    the timings.
+    
+    Args:
+        function (function): Zero-argument function, run fresh each time
+        repeat (int): Timed runs
+        trace_memory (bool): Also measure peak memory
+        
+    Returns:
+        dict: 'seconds' (fastest run), 'peak_bytes' and 'value' (last result)
+    """
+    best = None
+    value = None
+    for _ in range(repeat):
+        value, seconds, _ = measure(function, False)
+        best = seconds if best is None else min(best, seconds)
+    peak = measure(function, True)[2] if trace_memory else None
+    return {'seconds': best, 'peak_bytes': peak, 'value': value}
+
+
+def pandas_group_by(frame, keys, aggregations):
+    """
+    Run a GROUPBY_CASES group-by the way the tasks did before the engine.
+    
+    Args:
+        frame (DataFrame): Wildlife data
+        keys (list): Key columns
+        aggregations (list): (column, op) pairs; 'mode' uses value_counts
+        
+    Returns:
+        DataFrame: One row per group
+    """
+    named = {}
+    for column_name, op in aggregations:
+        named[f"{column_name}_{op}"] = (column_name, (lambda x: x.value_counts().index[0]) if op == 'mode' else op)
+    return frame.groupby(keys, observed=True).agg(**named)
+
+
+def benchmark_groupby(dataset, size_name, repeat=1, trace_memory=True):
+    """
+    Time each GROUPBY_CASES group-by on the groupby engine and on pandas.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        size_name (str): Key of BENCH_SIZES
+        repeat (int): Timed runs per stage
+        trace_memory (bool): Also measure peak memory per stage
+        
+    Returns:
+        list: Result entries with stages 'groupby:<case>:engine' and
+              'groupby:<case>:pandas'
+    """
+    frame = column_store.to_frame(dataset)
+    entries = []
+    for case_name, (keys, aggregations) in GROUPBY_CASES.items():
+        runs = {
+            'engine': lambda: groupby.group_by(dataset, keys, aggregations),
+            'pandas': lambda: pandas_group_by(frame, keys, aggregations)
+        }
+        for engine_name, function in runs.items():
+            stage = run_stage(function, repeat, trace_memory)
+            entries.append({'size': size_name, 'rows': dataset['n_rows'], 'stage': f"groupby:{case_name}:{engine_name}",
+                            'seconds': stage['seconds'], 'peak_bytes': stage['peak_bytes'], 'error': None})
+    return entries
+
+
+def benchmark_frame_load(path, size_name, repeat=1, trace_memory=True, tasks=None):
+    """
+    Time analyzer.load_dataframe with plain and with optimized dtypes.
+    
+    Args:
+        path (str): Synthetic CSV
+        size_name (str): Key of BENCH_SIZES
+        repeat (int): Timed runs per stage
+        trace_memory (bool): Also measure peak memory per stage
+        tasks (list): Task ids whose columns to read (None for every column)
+        
+    Returns:
+        list: Result entries with stages 'load_frame:plain' and
+              'load_frame:optimized'
+    """
+    entries = []
+    for mode_name, optimize in (('plain', False), ('optimized', True)):
+    
+        def load_frame():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return analyzer.load_dataframe(path, tasks, optimize)
+        
+        stage = run_stage(load_frame, repeat, trace_memory)
+        entries.append({'size': size_name, 'rows': BENCH_SIZES[size_name], 'stage': f"load_frame:{mode_name}",
+                        'seconds': stage['seconds'], 'peak_bytes': stage['peak_bytes'],
+                        'error': None if stage['value'] is not None else "load failed"})
+    return entries
+
+
+def benchmark_size(size_name, repeat=1, trace_memory=True, tasks=None, include_groupby=False,
+                   include_frame_load=False):
+    """
+    Benchmark loading and every task on one synthetic dataset.
+    
+    Args:
+        size_name (str): Key of BENCH_SIZES
+        repeat (int): Timed runs per stage
+        trace_memory (bool): Also measure peak memory per stage
+        tasks (list): Task ids to run (None for all of BENCH_PARAMS)
+        include_groupby (bool): Also compare the groupby engine with pandas
+                                (see benchmark_groupby)
+        include_frame_load (bool): Also time plain against optimized
+                                   DataFrame loading (see benchmark_frame_load)
+        
+    Returns:
+        list: Result entries ('size', 'rows', 'stage', 'seconds', 'peak_bytes', 'error')
+    """
+    path = synthetic_path(size_name)
+    rows = BENCH_SIZES[size_name]
+    options = loader.load_options(path)
+    silent = lambda line: None
+    entries = []
+    
+    def load_csv():
+        return loader.load_dataset(path, use_cache=False, log=silent, **options)
+    
+    def load_cache():
+        return loader.load_dataset(path, use_cache=True, log=silent, **options)
+    
+    # Parse from CSV, then (once the cache exists) from the binary cache
+    stage = run_stage(load_csv, repeat, trace_memory) if not options['mmap'] else None
+    if stage is not None:
+        entries.append({'size': size_name, 'rows': rows, 'stage': 'load_csv',
+                        'seconds': stage['seconds'], 'peak_bytes': stage['peak_bytes'], 'error': None})
+    load_cache()
+    stage = run_stage(load_cache, repeat, trace_memory)
+    entries.append({'size': size_name, 'rows': rows, 'stage': 'load_cache',
+                    'seconds': stage['seconds'], 'peak_bytes': stage['peak_bytes'], 'error': None})
+    dataset = stage['value']
+    
+    visualizer_p1.set_headless(True)
+    for task_id in tasks or BENCH_PARAMS:
+        params = BENCH_PARAMS[task_id]
+        
+        def run_task():
+            # Each run starts cold: no memoized result, no up-to-date chart
+            result_cache.clear_results()
+            with tempfile.TemporaryDirectory() as work_dir, contextlib.chdir(work_dir):
+                return scheduler.run_invocation(dataset, task_id, params)
+        
+        stage = run_stage(run_task, repeat, trace_memory)
+        entries.append({'size': size_name, 'rows': rows, 'stage': task_id,
+                        'seconds': stage['seconds'], 'peak_bytes': stage['peak_bytes'],
+                        'error': stage['value']['error']})
+    
+    if include_groupby:
+        entries.extend(benchmark_groupby(dataset, size_name, repeat, trace_memory))
+    if include_frame_load:
+        entries.extend(benchmark_frame_load(path, size_name, repeat, trace_memory, tasks))
+    return entries
+
+
+def compare_results(results, baseline, tolerance=REGRESSION_TOLERANCE, min_seconds=REGRESSION_MIN_SECONDS):
+    """
+    Find stages that got slower than the baseline.
+    
+    Args:
+        results (dict): Benchmark output (see run_benchmarks)
+        baseline (dict): Earlier benchmark output
+        tolerance (float): Allowed relative slowdown
+        min_seconds (float): Smallest absolute slowdown reported
+        
+    Returns:
+        list: Regression entries ('size', 'stage', 'baseline_seconds',
+              'seconds', 'ratio'), slowest first
+    """
+    baseline_seconds = {(entry['size'], entry['stage']): entry['seconds'] for entry in baseline['results']}
+    regressions = []
+    for entry in results['results']:
+        before = baseline_seconds.get((entry['size'], entry['stage']))
+        if before is None or entry['seconds'] is None:
+            continue
+        if entry['seconds'] > before * (1 + tolerance) and entry['seconds'] - before >= min_seconds:
+            regressions.append({'size': entry['size'], 'stage': entry['stage'], 'baseline_seconds': before,
+                                'seconds': entry['seconds'], 'ratio': entry['seconds'] / before if before else float('inf')})
+    return sorted(regressions, key=lambda item: item['ratio'], reverse=True)
+
+
+def run_benchmarks(size_names, repeat=1, trace_memory=True, tasks=None, include_groupby=False,
+                   include_frame_load=False):
+    """
+    Benchmark every requested size.
+    
+    Args:
+        size_names (list): Keys of BENCH_SIZES
+        repeat (int): Timed runs per stage
+        trace_memory (bool): Also measure peak memory per stage
+        tasks (list): Task ids to run (None for all)
+        include_groupby (bool): Also compare the groupby engine with pandas
+        include_frame_load (bool): Also time plain against optimized DataFrame loading
+        
+    Returns:
+        dict: 'meta' (environment and settings) and 'results' (entries from
+              benchmark_size)
+    """
+    results = []
+    for size_name in size_names:
+        print(f"Benchmarking {size_name} ({BENCH_SIZES[size_name]} rows)...")
+        results.extend(benchmark_size(size_name, repeat, trace_memory, tasks, include_groupby,
+                                      include_frame_load))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'seed': SEED,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def print_results(results):
+    """
+    Print benchmark results as a table.
+    
+    Args:
+        results (dict): Output of run_benchmarks
+    """
+    print(f"\n{'size':>5} {'stage':<30} {'seconds':>10} {'peak MB':>9}")
+    for entry in results['results']:
+        peak = f"{entry['peak_bytes'] / 1e6:9.1f}" if entry['peak_bytes'] is not None else f"{'-':>9}"
+        error = f"  error: {entry['error']}" if entry['error'] else ""
+        print(f"{entry['size']:>5} {entry['stage']:<30} {entry['seconds']:10.4f} {peak}{error}")
+
+
+def main(argv=None):
+    """
+    Benchmark entry point.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: 1 if regressions were found against --compare, else 0
+    """
+    parser = argparse.ArgumentParser(description="Benchmark loading and Tasks A/B/C on synthetic data.")
+    parser.add_argument('--sizes', nargs='+', choices=list(BENCH_SIZES), default=DEFAULT_SIZES)
+    parser.add_argument('--tasks', nargs='+', choices=list(BENCH_PARAMS), help="Tasks to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=1, help="Timed runs per stage (fastest is kept)")
+    parser.add_argument('--groupby', action='store_true', help="Also compare the groupby engine with pandas")
+    parser.add_argument('--frame-load', action='store_true',
+                        help="Also time plain against optimized DataFrame loading of the tasks' columns")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peak memory runs")
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    parser.add_argument('--compare', help="Baseline JSON to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="Allowed relative slowdown before a stage counts as a regression")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.sizes, args.repeat, not args.no_memory, args.tasks, args.groupby,
+                             args.frame_load)
+    print_results(results)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"\n✓ Results written to '{args.output}'")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare_results(results, baseline, args.tolerance)
+        results['regressions'] = regressions
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as file:
+                json.dump(results, file, indent=2)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) against '{args.compare}':")
+            for regression in regressions:
+                print(f"  {regression['size']} {regression['stage']}: {regression['baseline_seconds']:.4f}s -> "
+                      f"{regression['seconds']:.4f}s ({regression['ratio']:.2f}x)")
+            return 1
+        print(f"\n✓ No regressions against '{args.compare}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,910 @@
+"""
+Columnar Store Module for Project 1 (Procedural Style)
+Holds the parsed dataset as typed numeric columns and dictionary-encoded
+categorical columns, shared by Tasks A, B and C.
+Variable naming: snake_case
+"""
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+
+# Columns stored as numeric buffers (unparseable values become NaN)
+NUMERIC_COLUMNS = schema.columns_of_type("numeric")
+
+# Columns stored as integer codes into a label dictionary
+CATEGORICAL_COLUMNS = schema.columns_of_type("categorical")
+
+# Low-cardinality columns that get an equality (hash) index at load time
+INDEXED_COLUMNS = ("City", "Season", "TimeOfDay", "InteractionType")
+
+# Numeric columns that get a sorted-permutation (range) index on first use
+RANGE_INDEXED_COLUMNS = (
+    "AirQualityIndex", "UrbanDevelopmentIndex", "ProximityToWaterSource",
+    "SightingDuration_Min", "NearbyGreenSpaces"
+)
+
+# Appended rows grow buffers by this factor (plus a minimum spare), so each
+# value is copied O(1) times however the rows arrive
+BUFFER_GROWTH = 1.5
+MIN_BUFFER_SPARE = 4096
+
+# Appended rows go to small sorted runs beside the main run of a range index,
+# which are merged into it once they hold more than this fraction of it
+RANGE_DELTA_FRACTION = 1 / 16
+
+# Registry of frames built by build_store: id(frame) -> (weakref to frame, store view)
+_frame_stores = {}
+
+
+def normalize_label(value):
+    """
+    Normalize a categorical value for case-insensitive matching.
+    
+    Args:
+        value: Label or user input
+        
+    Returns:
+        str: Stripped, lower-cased string
+    """
+    return str(value).strip().lower()
+
+
+def is_categorical(dataset, column_name):
+    """
+    Check whether a column is dictionary-encoded in the dataset.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        
+    Returns:
+        bool: True if the column holds categorical codes
+    """
+    return column_name in dataset['labels']
+
+
+def new_dataset(header, n_rows, file_path=None, frame=None, fingerprint=None):
+    """
+    Create an empty dataset structure.
+    
+    Args:
+        header (list): Column names in file order
+        n_rows (int): Number of rows
+        file_path (str): Source file path
+        frame (DataFrame): In-memory frame sharing the buffers, or None when
+                           the columns are memory-mapped
+        fingerprint (dict): Source file fingerprint (see
+                            dataset_cache.file_fingerprint)
+        
+    Returns:
+        dict: Dataset with 'header', 'n_rows', 'frame', 'columns', 'labels',
+              'lookup', 'valid', 'indexes', 'range_indexes', 'aggregates',
+              'buffers' (growable storage behind appended rows), 'file_path'
+              and 'fingerprint' keys
+    """
+    return {
+        'header': list(header),
+        'n_rows': n_rows,
+        'frame': frame,
+        'file_path': file_path,
+        'fingerprint': fingerprint,
+        'columns': {},
+        'labels': {},
+        'lookup': {},
+        'valid': {},
+        'indexes': {},
+        'range_indexes': {},
+        'aggregates': {},
+        'buffers': {}
+    }
+
+
+def add_column(dataset, column_name, values, labels=None):
+    """
+    Add a column buffer to a dataset.
+    
+    Args:
+        dataset (dict): Dataset created by new_dataset
+        column_name (str): Column name
+        values (ndarray): Numeric values, or codes for a categorical column
+        labels (list): Category labels indexed by code (categorical only)
+    """
+    dataset['columns'][column_name] = values
+    if labels is not None:
+        dataset['labels'][column_name] = labels
+        dataset['lookup'][column_name] = build_label_lookup(labels)
+
+
+def build_store(frame, file_path=None, eager=True, fingerprint=None):
+    """
+    Build the columnar store from a freshly parsed DataFrame.
+    
+    Numeric columns are coerced to numbers once; categorical columns are
+    converted in place to pandas 'category' dtype so the frame and the store
+    share the same integer codes. A validity mask per column records values
+    that failed to parse, so queries never re-parse or try/except per row.
+    
+    Args:
+        frame (DataFrame): Parsed wildlife data (modified in place)
+        file_path (str): Source file path
+        eager (bool): Build validity masks and equality indexes now rather
+                      than on first use
+        fingerprint (dict): Source file fingerprint
+        
+    Returns:
+        dict: Dataset (see new_dataset)
+    """
+    for column_name in frame.columns:
+        if column_name in NUMERIC_COLUMNS:
+            if not pd.api.types.is_numeric_dtype(frame[column_name]):
+                frame[column_name] = pd.to_numeric(frame[column_name], errors='coerce')
+        elif column_name in CATEGORICAL_COLUMNS or not pd.api.types.is_numeric_dtype(frame[column_name]):
+            frame[column_name] = frame[column_name].astype('category')
+    
+    dataset = new_dataset(frame.columns, len(frame), file_path, frame, fingerprint)
+    
+    for column_name in frame.columns:
+        series = frame[column_name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            add_column(dataset, column_name, series.cat.codes.to_numpy(), list(series.cat.categories))
+        else:
+            add_column(dataset, column_name, series.to_numpy())
+    
+    if eager:
+        build_indexes(dataset)
+    
+    register_frame(frame, dataset)
+    return dataset
+
+
+def build_indexes(dataset):
+    """
+    Build every validity mask and equality index up front.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+    """
+    for column_name in dataset['header']:
+        valid_mask(dataset, column_name)
+    for column_name in INDEXED_COLUMNS:
+        equality_index(dataset, column_name)
+
+
+def validation_report(dataset):
+    """
+    Build the schema validation report from the dataset's validity masks.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        
+    Returns:
+        dict: Report (see schema.make_report)
+    """
+    n_rows = dataset['n_rows']
+    invalid_counts = {}
+    bad_rows = np.zeros(n_rows, dtype=bool)
+    for column_name in dataset['header']:
+        mask = valid_mask(dataset, column_name)
+        invalid_counts[column_name] = n_rows - int(np.count_nonzero(mask))
+        if invalid_counts[column_name] and column_name in schema.COLUMN_TYPES:
+            bad_rows |= ~mask
+    return schema.make_report(dataset['header'], n_rows, invalid_counts, np.count_nonzero(bad_rows))
+
+
+def valid_mask(dataset, column_name):
+    """
+    Get the validity mask of a column, computing it once on first use.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        
+    Returns:
+        ndarray: Boolean mask, False where the value is missing or failed to parse
+    """
+    mask = dataset['valid'].get(column_name)
+    if mask is None:
+        mask = values_mask(dataset, column_name, dataset['columns'][column_name])
+        dataset['valid'][column_name] = mask
+    return mask
+
+
+def values_mask(dataset, column_name, values):
+    """
+    Compute the validity mask of some values of a column.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        values (ndarray): Values (or codes) of the column
+        
+    Returns:
+        ndarray: Boolean mask, False where the value is missing or failed to parse
+    """
+    if is_categorical(dataset, column_name):
+        return values >= 0
+    if values.dtype.kind == 'f':
+        return ~np.isnan(values)
+    return np.ones(len(values), dtype=bool)
+
+
+def equality_index(dataset, column_name):
+    """
+    Get the equality index of a column, building it once on first use.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        
+    Returns:
+        dict: Index (see build_equality_index), or None if the column is not
+              an indexed categorical column
+    """
+    index = dataset['indexes'].get(column_name)
+    if index is None and column_name in INDEXED_COLUMNS and is_categorical(dataset, column_name):
+        index = build_equality_index(dataset['columns'][column_name], dataset['labels'][column_name])
+        dataset['indexes'][column_name] = index
+    return index
+
+
+def to_frame(dataset, column_names=None):
+    """
+    Get a DataFrame over the dataset's columns.
+    
+    For in-memory datasets this is the shared frame itself. For memory-mapped
+    datasets a frame is assembled from only the requested columns, so just
+    those column files are paged in.
+    
+    Args:
+        dataset (dict): Dataset built by build_store or build_mapped_store
+        column_names (list): Columns needed by the caller (None for all)
+        
+    Returns:
+        DataFrame: Wildlife data
+    """
+    if dataset['frame'] is not None:
+        return dataset['frame']
+    
+    if column_names is None:
+        column_names = dataset['header']
+    
+    frame = columns_frame(dataset, column_names)
+    register_frame(frame, dataset)
+    return frame
+
+
+def columns_frame(dataset, column_names, dtypes=None):
+    """
+    Assemble a DataFrame over some of the dataset's column buffers.
+    
+    Numeric buffers and categorical codes are wrapped, not copied.
+    
+    Args:
+        dataset (dict): Dataset built by build_store or build_mapped_store
+        column_names (list): Columns to include, kept in file order
+        dtypes (Series): Column dtypes of an earlier frame; categorical
+                         dtypes whose labels are unchanged are reused
+        
+    Returns:
+        DataFrame: Frame sharing the dataset's buffers
+    """
+    data = {}
+    for column_name in dataset['header']:
+        if column_name not in column_names:
+            continue
+        values = dataset['columns'][column_name]
+        if is_categorical(dataset, column_name):
+            labels = dataset['labels'][column_name]
+            dtype = dtypes.get(column_name) if dtypes is not None else None
+            if not isinstance(dtype, pd.CategoricalDtype) or len(dtype.categories) != len(labels):
+                dtype = pd.CategoricalDtype(labels)
+            # Codes always come from the store's own dictionaries
+            values = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        data[column_name] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def build_mapped_store(columns, labels, header, n_rows, file_path=None, fingerprint=None):
+    """
+    Build a dataset over memory-mapped column buffers.
+    
+    Nothing is read up front: validity masks and indexes are built on first
+    use, and only the pages of the columns a query touches become resident.
+    
+    Args:
+        columns (dict): column name -> memory-mapped ndarray
+        labels (dict): column name -> category labels (categorical columns)
+        header (list): Column names in file order
+        n_rows (int): Number of rows
+        file_path (str): Source file path
+        fingerprint (dict): Source file fingerprint
+        
+    Returns:
+        dict: Dataset (see new_dataset) with 'frame' set to None
+    """
+    dataset = new_dataset(header, n_rows, file_path, fingerprint=fingerprint)
+    for column_name in header:
+        add_column(dataset, column_name, columns[column_name], labels.get(column_name))
+    return dataset
+
+
+def build_label_lookup(labels):
+    """
+    Map normalized labels to the codes that carry them.
+    
+    Args:
+        labels (list): Category labels indexed by code
+        
+    Returns:
+        dict: normalized label -> list of codes
+    """
+    lookup = {}
+    for code, label in enumerate(labels):
+        lookup.setdefault(normalize_label(label), []).append(code)
+    return lookup
+
+
+def match_codes(dataset, column_name, value):
+    """
+    Find the codes of a categorical column equal to value (case-insensitive).
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Categorical column name
+        value (str): Value to match
+        
+    Returns:
+        list: Matching codes (empty if the value does not occur)
+    """
+    return dataset['lookup'][column_name].get(normalize_label(value), [])
+
+
+def equals_mask(dataset, column_name, value):
+    """
+    Boolean row mask for a case-insensitive equality on a categorical column.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Categorical column name
+        value (str): Value to match
+        
+    Returns:
+        ndarray: Boolean mask over all rows
+    """
+    codes = match_codes(dataset, column_name, value)
+    return np.isin(dataset['columns'][column_name], codes)
+
+
+def column_values(dataset, column_name, row_ids):
+    """
+    Decode the values of a column for the selected rows.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        row_ids (ndarray): Row positions to fetch
+        
+    Returns:
+        ndarray: Decoded values (labels for categorical columns), or None if
+                 the column does not exist
+    """
+    if column_name not in dataset['columns']:
+        return None
+    
+    values = dataset['columns'][column_name][row_ids]
+    if not is_categorical(dataset, column_name):
+        return values
+    
+    # Missing categorical values (code -1) decode to an empty string
+    labels = np.array(dataset['labels'][column_name] + [""], dtype=object)
+    return labels[values]
+
+
+def build_equality_index(codes, labels):
+    """
+    Build a hash index from normalized label to matching row positions.
+    
+    Each entry holds the sorted row ids (for O(matches) lookups) and a packed
+    bitmap over all rows (for AND-ing several indexed predicates).
+    
+    Args:
+        codes (ndarray): Categorical codes of the column (-1 for missing)
+        labels (list): Category labels indexed by code
+        
+    Returns:
+        dict: {'rows': {label: ndarray}, 'bitmaps': {label: packed ndarray}}
+    """
+    # Stable sort keeps row ids ascending within each code
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes.astype(np.int64) + 1, minlength=len(labels) + 1)
+    bounds = np.cumsum(counts)
+    
+    index = {'rows': {}, 'bitmaps': {}}
+    for code, label in enumerate(labels):
+        row_ids = order[bounds[code]:bounds[code + 1]]
+        key = normalize_label(label)
+        if key in index['rows']:
+            row_ids = np.sort(np.concatenate([index['rows'][key], row_ids]))
+        index['rows'][key] = row_ids
+        index['bitmaps'][key] = rows_to_bitmap(row_ids, len(codes))
+    return index
+
+
+def rows_to_bitmap(row_ids, n_rows):
+    """
+    Convert row positions to a packed bitmap.
+    
+    Args:
+        row_ids (ndarray): Row positions
+        n_rows (int): Total number of rows
+        
+    Returns:
+        ndarray: Packed uint8 bitmap of n_rows bits
+    """
+    bits = np.zeros(n_rows, dtype=bool)
+    bits[row_ids] = True
+    return np.packbits(bits)
+
+
+def bitmap_to_rows(bitmap, n_rows):
+    """
+    Convert a packed bitmap back to sorted row positions.
+    
+    Args:
+        bitmap (ndarray): Packed uint8 bitmap
+        n_rows (int): Total number of rows
+        
+    Returns:
+        ndarray: Sorted row positions whose bit is set
+    """
+    return np.flatnonzero(np.unpackbits(bitmap, count=n_rows))
+
+
+def index_rows(dataset, column_name, values):
+    """
+    Look up matching rows through the equality index.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        values (list): Values to match (case-insensitive, OR-ed together)
+        
+    Returns:
+        ndarray: Sorted row positions, or None if the column is not indexed
+    """
+    index = equality_index(dataset, column_name)
+    if index is None:
+        return None
+    
+    hits = [index['rows'][key] for key in {normalize_label(value) for value in values} if key in index['rows']]
+    if not hits:
+        return np.empty(0, dtype=np.intp)
+    if len(hits) == 1:
+        return hits[0]
+    return np.sort(np.concatenate(hits))
+
+
+def index_bitmap(dataset, column_name, values):
+    """
+    Look up the packed bitmap of matching rows through the equality index.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        values (list): Values to match (case-insensitive, OR-ed together)
+        
+    Returns:
+        ndarray: Packed bitmap, or None if the column is not indexed
+    """
+    index = equality_index(dataset, column_name)
+    if index is None:
+        return None
+    
+    bitmap = np.zeros((dataset['n_rows'] + 7) // 8, dtype=np.uint8)
+    for key in {normalize_label(value) for value in values}:
+        if key in index['bitmaps']:
+            bitmap |= index['bitmaps'][key]
+    return bitmap
+
+
+def range_index(dataset, column_name):
+    """
+    Get the sorted-permutation index of a numeric column, building it on first use.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Numeric column name
+        
+    Returns:
+        dict: {'values': sorted valid values, 'rows': their row positions,
+              'runs': list of the same for appended rows not merged yet
+              (see append_range_index)}, or None if the column is not
+              range-indexed
+    """
+    if column_name in dataset['range_indexes']:
+        return dataset['range_indexes'][column_name]
+    if column_name not in RANGE_INDEXED_COLUMNS or column_name not in dataset['columns']:
+        return None
+    
+    # Invalid (unparseable) values are left out of the index entirely
+    valid_rows = np.flatnonzero(valid_mask(dataset, column_name))
+    values = dataset['columns'][column_name][valid_rows]
+    order = np.argsort(values, kind='stable')
+    
+    index = {'values': values[order], 'rows': valid_rows[order], 'runs': []}
+    dataset['range_indexes'][column_name] = index
+    return index
+
+
+def range_bounds(dataset, column_name, op, value):
+    """
+    Binary-search the slices of a range index matching a comparison.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Numeric column name
+        op (str): One of "<", "<=", ">", ">=", "=="
+        value (float): Threshold
+        
+    Returns:
+        list: (run, start, stop) for the main run of the index and each
+              run of appended rows, so that run['rows'][start:stop] are the
+              matching rows; None if the column/operator is not indexable
+    """
+    if op not in ("<", "<=", ">", ">=", "=="):
+        return None
+    index = range_index(dataset, column_name)
+    if index is None:
+        return None
+    
+    return [(run,) + search_run(run['values'], op, value) for run in [index] + index['runs']]
+
+
+def search_run(sorted_values, op, value):
+    """
+    Binary-search the slice of sorted values matching a comparison.
+    
+    Args:
+        sorted_values (ndarray): Values in ascending order
+        op (str): One of "<", "<=", ">", ">=", "=="
+        value (float): Threshold
+        
+    Returns:
+        tuple: (start, stop) positions of the matching values
+    """
+    if op == "<":
+        return 0, np.searchsorted(sorted_values, value, side='left')
+    if op == "<=":
+        return 0, np.searchsorted(sorted_values, value, side='right')
+    if op == ">":
+        return np.searchsorted(sorted_values, value, side='right'), len(sorted_values)
+    if op == ">=":
+        return np.searchsorted(sorted_values, value, side='left'), len(sorted_values)
+    return (np.searchsorted(sorted_values, value, side='left'),
+            np.searchsorted(sorted_values, value, side='right'))
+
+
+def register_frame(frame, dataset):
+    """
+    Remember the store behind a frame so pandas-side tasks can use its indexes.
+    
+    The registry keeps a view of the dataset without the frame itself (the
+    column buffers and indexes are shared, not copied), and the entry is
+    dropped automatically when the frame is garbage collected.
+    
+    Args:
+        frame (DataFrame): Frame built by build_store
+        dataset (dict): Dataset wrapping the frame
+    """
+    frame_id = id(frame)
+    store_view = {key: value for key, value in dataset.items() if key != 'frame'}
+    _frame_stores[frame_id] = (weakref.ref(frame), store_view)
+    weakref.finalize(frame, _frame_stores.pop, frame_id, None)
+
+
+def frame_store(frame):
+    """
+    Get the columnar store behind a frame built by build_store.
+    
+    Args:
+        frame (DataFrame): Wildlife data
+        
+    Returns:
+        dict: Store view (dataset without 'frame'), or None for other frames
+    """
+    entry = _frame_stores.get(id(frame))
+    if entry is not None and entry[0]() is frame:
+        return entry[1]
+    return None
+
+
+def select_rows(frame, column_name, value):
+    """
+    Row positions of a frame where column equals value (case-insensitive).
+    
+    Uses the equality index when the frame came from build_store, the
+    category codes for categorical columns, and a string scan otherwise.
+    
+    Args:
+        frame (DataFrame): Wildlife data
+        column_name (str): Column to filter
+        value (str): Value to match
+        
+    Returns:
+        ndarray: Sorted row positions, suitable for frame.iloc
+    """
+    store = frame_store(frame)
+    if store is not None and equality_index(store, column_name) is not None:
+        return index_rows(store, column_name, [value])
+    
+    series = frame[column_name]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = [code for code, label in enumerate(series.cat.categories)
+                 if normalize_label(label) == normalize_label(value)]
+        return np.flatnonzero(np.isin(series.cat.codes.to_numpy(), codes))
+    
+    return np.flatnonzero((series.astype(str).str.strip().str.lower() == normalize_label(value)).to_numpy())
+
+
+def codes_dtype(n_labels):
+    """
+    Get the integer type pandas uses for the codes of a categorical.
+    
+    Args:
+        n_labels (int): Number of category labels
+        
+    Returns:
+        dtype: Smallest of int8/int16/int32/int64 that pandas keeps as is
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_labels < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def extend_buffer(dataset, key, array, tail, keep=None):
+    """
+    Append values to an array through a growable buffer.
+    
+    The result is a view of a buffer with spare capacity, so appending to
+    it again only copies the new values. The array is copied into a new,
+    larger buffer when it is not the current view of its buffer, the
+    buffer is full or the dtype changed.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        key (tuple): Name of the buffer in dataset['buffers']
+        array (ndarray): Current values
+        tail (ndarray): Values to append (cast to array's dtype)
+        keep (int): Keep only this many leading values of array before
+                    appending (None to keep all of them)
+        
+    Returns:
+        ndarray: View of array[:keep] followed by tail
+    """
+    keep = len(array) if keep is None else keep
+    size = keep + len(tail)
+    entry = dataset['buffers'].get(key)
+    if (entry is None or entry[1] != len(array) or array.base is not entry[0]
+            or len(entry[0]) < size or entry[0].dtype != array.dtype):
+        buffer = np.empty(max(size + MIN_BUFFER_SPARE, int(size * BUFFER_GROWTH)), dtype=array.dtype)
+        buffer[:keep] = array[:keep]
+    else:
+        buffer = entry[0]
+    buffer[keep:size] = tail
+    dataset['buffers'][key] = (buffer, size)
+    return buffer[:size]
+
+
+def encode_appended(dataset, column_name, series, n_rows):
+    """
+    Convert appended values of a column to the store's representation.
+    
+    Numeric values are coerced to numbers like build_store does. Categorical
+    values are looked up in the column's dictionary, and values not seen
+    before are added to the end of it (existing codes never change).
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Column name
+        series (Series): Appended values, or None if the rows lack the column
+        n_rows (int): Number of appended rows
+        
+    Returns:
+        ndarray: Numeric values, or codes (-1 for missing) for a categorical column
+    """
+    if not is_categorical(dataset, column_name):
+        if series is None:
+            return np.full(n_rows, np.nan)
+        return pd.to_numeric(series, errors='coerce').to_numpy()
+    
+    if series is None:
+        return np.full(n_rows, -1, dtype=np.intp)
+    
+    labels = dataset['labels'][column_name]
+    entry = dataset['buffers'].get(('label_codes', column_name))
+    if entry is None or len(entry) != len(labels):
+        entry = {label: code for code, label in enumerate(labels)}
+        dataset['buffers'][('label_codes', column_name)] = entry
+    
+    as_text = all(isinstance(label, str) for label in labels[:1])
+    positions, uniques = pd.factorize(series)
+    unique_codes = np.empty(len(uniques), dtype=np.intp)
+    for position, value in enumerate(uniques):
+        label = str(value) if as_text else value
+        if label not in entry:
+            entry[label] = len(labels)
+            labels.append(label)
+            dataset['lookup'][column_name].setdefault(normalize_label(label), []).append(entry[label])
+        unique_codes[position] = entry[label]
+    return np.where(positions >= 0, unique_codes[positions] if len(uniques) else -1, -1)
+
+
+def append_equality_index(dataset, column_name, index, codes, n_rows):
+    """
+    Add appended rows to an equality index.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        column_name (str): Indexed categorical column
+        index (dict): Index over the first n_rows rows (see build_equality_index)
+        codes (ndarray): Codes of the appended rows
+        n_rows (int): Number of rows before the append
+        
+    Returns:
+        dict: New index over all rows; its arrays extend the old ones'
+              buffers, so the cost is proportional to the appended rows
+    """
+    labels = dataset['labels'][column_name]
+    order = np.argsort(codes, kind='stable')
+    bounds = np.cumsum(np.bincount(codes.astype(np.int64) + 1, minlength=len(labels) + 1))
+    
+    added = {}
+    for code in np.flatnonzero(bounds[1:] - bounds[:-1]):
+        key = normalize_label(labels[code])
+        row_ids = order[bounds[code]:bounds[code + 1]] + n_rows
+        added[key] = np.sort(np.concatenate([added[key], row_ids])) if key in added else row_ids
+    
+    # The last byte of each bitmap may be shared with the appended rows
+    total_rows = n_rows + len(codes)
+    kept_bytes = n_rows // 8
+    new_index = {'rows': {}, 'bitmaps': {}}
+    for key in set(index['rows']) | set(added):
+        row_ids = index['rows'].get(key, np.empty(0, dtype=np.intp))
+        bitmap = index['bitmaps'].get(key)
+        if bitmap is None:
+            bitmap = np.zeros((n_rows + 7) // 8, dtype=np.uint8)
+        
+        bits = np.zeros(total_rows - kept_bytes * 8, dtype=bool)
+        if key in added:
+            bits[added[key] - kept_bytes * 8] = True
+            row_ids = extend_buffer(dataset, ('rows', column_name, key), row_ids, added[key])
+        tail = np.packbits(bits)
+        if len(bitmap) > kept_bytes:
+            tail[0] |= bitmap[kept_bytes]
+        
+        new_index['rows'][key] = row_ids
+        new_index['bitmaps'][key] = extend_buffer(dataset, ('bitmap', column_name, key), bitmap, tail, kept_bytes)
+    return new_index
+
+
+def merge_runs(runs):
+    """
+    Merge sorted runs of a range index.
+    
+    Args:
+        runs (list): Runs ({'values', 'rows'}) in row order, each holding
+                     later rows than the one before
+        
+    Returns:
+        dict: One sorted run; equal values stay in row order, as a rebuild
+              would keep them
+    """
+    values = np.concatenate([run['values'] for run in runs])
+    order = np.argsort(values, kind='stable')
+    return {'values': values[order], 'rows': np.concatenate([run['rows'] for run in runs])[order]}
+
+
+def append_range_index(index, values, n_rows):
+    """
+    Add appended rows to a range index.
+    
+    The appended rows become a new sorted run of their own. Runs are
+    merged while the one before is no larger than the newest, so there are
+    O(log n) runs and each row is merged O(log n) times; once the runs hold
+    more than RANGE_DELTA_FRACTION of the main run, they are folded into it.
+    Appending k rows therefore costs O(k log n) amortized, however small
+    the batches.
+    
+    Args:
+        index (dict): Index over the first n_rows rows (see range_index)
+        values (ndarray): Values of the appended rows
+        n_rows (int): Number of rows before the append
+        
+    Returns:
+        dict: New index over all rows
+    """
+    valid_rows = np.flatnonzero(~np.isnan(values)) if values.dtype.kind == 'f' else np.arange(len(values))
+    order = np.argsort(values[valid_rows], kind='stable')
+    runs = list(index['runs'])
+    runs.append({'values': values[valid_rows][order], 'rows': valid_rows[order] + n_rows})
+    while len(runs) > 1 and len(runs[-2]['values']) <= len(runs[-1]['values']):
+        newer = runs.pop()
+        runs.append(merge_runs([runs.pop(), newer]))
+    
+    if sum(len(run['values']) for run in runs) <= len(index['values']) * RANGE_DELTA_FRACTION:
+        return {'values': index['values'], 'rows': index['rows'], 'runs': runs}
+    
+    merged = merge_runs([index] + runs)
+    merged['runs'] = []
+    return merged
+
+
+def append_columns(dataset, rows):
+    """
+    Append rows to an in-memory store and maintain its indexes.
+    
+    Column buffers, validity masks and the equality and range indexes
+    already built are extended in time proportional to the appended rows;
+    structures not built yet are left to be built on first use. Frames and
+    store views handed out earlier keep seeing the rows they had; call
+    refresh_frame once the rest of the dataset is updated.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        rows (DataFrame): Rows to append; columns are matched by name and
+                          columns the rows lack are missing values
+        
+    Returns:
+        int: Number of rows before the append
+    """
+    n_rows = dataset['n_rows']
+    columns = dict(dataset['columns'])
+    valid = dict(dataset['valid'])
+    
+    for column_name in dataset['header']:
+        series = rows[column_name] if column_name in rows.columns else None
+        tail = encode_appended(dataset, column_name, series, len(rows))
+        values = columns[column_name]
+        if is_categorical(dataset, column_name):
+            dtype = np.promote_types(values.dtype, codes_dtype(len(dataset['labels'][column_name])))
+        else:
+            dtype = np.result_type(values.dtype, tail.dtype)
+        columns[column_name] = extend_buffer(dataset, ('columns', column_name), values.astype(dtype, copy=False),
+                                             tail.astype(dtype, copy=False))
+        if column_name in valid:
+            valid[column_name] = extend_buffer(dataset, ('valid', column_name), valid[column_name],
+                                               values_mask(dataset, column_name, tail))
+    
+    indexes = {}
+    for column_name, index in dataset['indexes'].items():
+        indexes[column_name] = append_equality_index(dataset, column_name, index, columns[column_name][n_rows:], n_rows)
+    range_indexes = {}
+    for column_name, index in dataset['range_indexes'].items():
+        range_indexes[column_name] = append_range_index(index, columns[column_name][n_rows:], n_rows)
+    
+    dataset.update(columns=columns, valid=valid, indexes=indexes, range_indexes=range_indexes,
+                   n_rows=n_rows + len(rows))
+    return n_rows
+
+
+def refresh_frame(dataset):
+    """
+    Rebuild the frame of an in-memory dataset over its current buffers.
+    
+    Args:
+        dataset (dict): Dataset built by build_store
+        
+    Returns:
+        DataFrame: New frame, registered for frame_store
+    """
+    previous = dataset['frame']
+    frame = columns_frame(dataset, dataset['header'], previous.dtypes if previous is not None else None)
+    dataset['frame'] = frame
+    register_frame(frame, dataset)
+    return frame
@@ -0,0 +1,85 @@
+"""
+Test Fixtures Module for Project 1 (Procedural Style)
+Shared pytest fixtures: small synthetic wildlife datasets generated from
+the profiles of Urban_wildlife.csv (see benchmark.py), with missing values
+mixed in, as plain frames, CSV files and columnar stores.
+Variable naming: snake_case
+"""
+
+import os
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import benchmark
+import column_store
+import dataset_cache
+import result_cache
+
+
+# Rows in the default synthetic dataset
+TEST_ROWS = 3000
+
+# Share of values blanked in each MISSING_COLUMNS column
+MISSING_FRACTION = 0.03
+
+# Columns that get extra missing values (numeric and categorical)
+MISSING_COLUMNS = ("AirQualityIndex", "NoiseLevel_dB", "City", "TimeOfDay")
+
+
+@pytest.fixture(scope="session")
+def profiles():
+    """Column profiles of the bundled Urban_wildlife.csv."""
+    return benchmark.column_profiles(os.path.join(os.path.dirname(__file__), benchmark.SOURCE_CSV))
+
+
+def make_frame(profiles, n_rows, seed):
+    """
+    Generate a synthetic wildlife frame with missing values mixed in.
+    
+    Args:
+        profiles (dict): Profiles from benchmark.column_profiles
+        n_rows (int): Rows to generate
+        seed (int): Random seed
+        
+    Returns:
+        DataFrame: Rows as pd.read_csv would return them
+    """
+    rng = np.random.default_rng(seed)
+    frame = benchmark.generate_chunk(profiles, n_rows, rng)
+    for column_name in MISSING_COLUMNS:
+        frame[column_name] = frame[column_name].where(rng.random(n_rows) >= MISSING_FRACTION)
+    return frame
+
+
+@pytest.fixture(scope="session")
+def wildlife_csv(profiles, tmp_path_factory):
+    """Path to a synthetic CSV of TEST_ROWS rows (tests must not modify it)."""
+    path = str(tmp_path_factory.mktemp("data") / "wildlife.csv")
+    make_frame(profiles, TEST_ROWS, seed=7).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def wildlife_frame(wildlife_csv):
+    """The synthetic CSV parsed by plain pandas, with no store behind it."""
+    return pd.read_csv(wildlife_csv)
+
+
+@pytest.fixture
+def dataset(wildlife_csv):
+    """Columnar store built from the synthetic CSV."""
+    return column_store.build_store(pd.read_csv(wildlife_csv), wildlife_csv,
+                                    fingerprint=dataset_cache.file_fingerprint(wildlife_csv))
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    """Start every test with an empty result cache."""
+    result_cache.clear_results()
+    yield
+    result_cache.clear_results()
@@ -0,0 +1,373 @@
+"""
+Aggregate Cube Module for Project 1 (Procedural Style)
+Materializes sum, count and sum-of-squares measures over dictionary-encoded
+dimensions once, so Task B/C group-bys are answered by slicing and rolling
+up the cube instead of scanning rows.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+
+import column_store
+import groupby
+import query
+import streaming
+
+
+# Cuboids kept per dataset: dimensions and the measures aggregated over them
+CUBOIDS = {
+    'B1': {'dims': ['Season', 'NearbyGreenSpaces', 'WildlifeSpecies'],
+           'measures': ['NumberOfSightings']},
+    'B2': {'dims': ['City', 'WeatherCondition', 'TimeOfDay'],
+           'measures': ['NumberOfSightings', 'SightingDuration_Min']},
+    'C1': {'dims': ['Season', 'City'],
+           'measures': ['Temperature', 'Humidity']},
+    'C3': {'dims': ['City', 'ResidentialAreaType'],
+           'measures': ['PublicAwarenessLevel']}
+}
+
+# Numeric columns can be cube dimensions only up to this many distinct values
+MAX_NUMERIC_DIM_VALUES = 64
+
+
+def encode_dimension(dataset, column_name):
+    """
+    Encode a column as dense dimension codes.
+    
+    The last code of every dimension is reserved for missing values, so
+    roll-ups over the whole dimension still count those rows.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        column_name (str): Categorical or low-cardinality numeric column
+        
+    Returns:
+        tuple: (codes, dimension values), or None if a numeric column has
+               too many distinct values to be a dimension
+    """
+    return groupby.encode_key(dataset, column_name, MAX_NUMERIC_DIM_VALUES)
+
+
+def build_cuboid(dataset, dims, measures):
+    """
+    Aggregate the dataset over a set of dimensions.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        dims (list): Dimension columns
+        measures (list): Numeric columns to aggregate
+        
+    Returns:
+        dict: Cuboid with 'dims', 'dim_values', 'measures' and 'cells'
+              (arrays shaped by the dimension sizes), or None if a column is
+              missing or cannot be a dimension
+    """
+    if any(column_name not in dataset['columns'] for column_name in dims + measures):
+        return None
+    
+    dim_codes = []
+    dim_values = []
+    for column_name in dims:
+        encoded = encode_dimension(dataset, column_name)
+        if encoded is None:
+            return None
+        dim_codes.append(encoded[0])
+        dim_values.append(encoded[1])
+    
+    shape = tuple(len(values) + 1 for values in dim_values)
+    size = int(np.prod(shape))
+    group_ids = groupby.group_ids(dim_codes, shape)
+    
+    cells = {'rows': np.bincount(group_ids, minlength=size).reshape(shape)}
+    for column_name in measures:
+        valid = column_store.valid_mask(dataset, column_name)
+        values = dataset['columns'][column_name][valid]
+        valid_ids = group_ids[valid]
+        for statistic in ('sum', 'count', 'sumsq'):
+            cells[(column_name, statistic)] = groupby.aggregate(valid_ids, values, size, statistic).reshape(shape)
+    
+    return {'dims': list(dims), 'dim_values': dim_values, 'measures': list(measures), 'cells': cells}
+
+
+def build_cube(dataset):
+    """
+    Materialize every cuboid in CUBOIDS for a dataset.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+    """
+    for cuboid_id in CUBOIDS:
+        get_cuboid(dataset, cuboid_id)
+
+
+def get_cuboid(dataset, cuboid_id):
+    """
+    Get a cuboid, building it on first use.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        cuboid_id (str): Key of CUBOIDS
+        
+    Returns:
+        dict: Cuboid (see build_cuboid), or None if it cannot be built
+    """
+    cuboids = dataset['aggregates'].setdefault('cube', {})
+    if cuboid_id not in cuboids:
+        spec = CUBOIDS[cuboid_id]
+        cuboids[cuboid_id] = build_cuboid(dataset, spec['dims'], spec['measures'])
+    return cuboids[cuboid_id]
+
+
+def append_cube(dataset, n_rows):
+    """
+    Add the rows appended after the first n_rows to every cuboid built.
+    
+    Args:
+        dataset (dict): Dataset whose columns were extended by
+                        column_store.append_columns
+        n_rows (int): Number of rows before the append
+    """
+    cuboids = dataset['aggregates'].get('cube')
+    if not cuboids:
+        return
+    updated = {}
+    for cuboid_id, cuboid in cuboids.items():
+        updated[cuboid_id] = append_cuboid(dataset, cuboid, n_rows) if cuboid is not None else None
+    dataset['aggregates'] = dict(dataset['aggregates'], cube=updated)
+
+
+def append_cuboid(dataset, cuboid, n_rows):
+    """
+    Add appended rows to a cuboid.
+    
+    Dimension values not seen before get new (empty) slots first: new
+    labels after the existing ones, like their codes, and new numeric
+    values at their sorted position. The appended rows are then aggregated
+    on their own and added cell by cell, so the cost depends on the
+    appended rows and the cube size, not on the rows already counted.
+    
+    Args:
+        dataset (dict): Dataset whose columns were extended by
+                        column_store.append_columns
+        cuboid (dict): Cuboid over the first n_rows rows (see build_cuboid)
+        n_rows (int): Number of rows before the append
+        
+    Returns:
+        dict: New cuboid over all rows, or None if a numeric dimension now
+              has too many distinct values (as build_cuboid would find)
+    """
+    cells = dict(cuboid['cells'])
+    dim_codes = []
+    dim_values = []
+    for axis, column_name in enumerate(cuboid['dims']):
+        values = dataset['columns'][column_name][n_rows:]
+        valid = column_store.values_mask(dataset, column_name, values)
+        old_values = cuboid['dim_values'][axis]
+        
+        if column_store.is_categorical(dataset, column_name):
+            new_values = np.array(dataset['labels'][column_name], dtype=object)
+            slots = np.full(len(new_values) - len(old_values), len(old_values))
+            codes = np.where(valid, values, len(new_values))
+        else:
+            added = np.setdiff1d(values[valid], old_values)
+            new_values = np.union1d(old_values, added)
+            if len(new_values) > MAX_NUMERIC_DIM_VALUES:
+                return None
+            slots = np.searchsorted(old_values, added)
+            codes = np.where(valid, np.searchsorted(new_values, values), len(new_values))
+        
+        if len(slots):
+            cells = {key: np.insert(array, slots, 0, axis=axis) for key, array in cells.items()}
+        dim_codes.append(codes.astype(np.intp))
+        dim_values.append(new_values)
+    
+    shape = tuple(len(values) + 1 for values in dim_values)
+    size = int(np.prod(shape))
+    group_ids = groupby.group_ids(dim_codes, shape)
+    
+    cells['rows'] = cells['rows'] + np.bincount(group_ids, minlength=size).reshape(shape)
+    for column_name in cuboid['measures']:
+        values = dataset['columns'][column_name][n_rows:]
+        valid = column_store.values_mask(dataset, column_name, values)
+        for statistic in ('sum', 'count', 'sumsq'):
+            added = groupby.aggregate(group_ids[valid], values[valid], size, statistic).reshape(shape)
+            cells[(column_name, statistic)] = cells[(column_name, statistic)] + added
+    
+    return {'dims': cuboid['dims'], 'dim_values': dim_values, 'measures': cuboid['measures'], 'cells': cells}
+
+
+def dimension_selector(cuboid, position, filters):
+    """
+    Select the slots of one dimension that pass the filters on it.
+    
+    Args:
+        cuboid (dict): Cuboid (see build_cuboid)
+        position (int): Index of the dimension in the cuboid
+        filters (list): (column, op, value) filters on this dimension
+        
+    Returns:
+        ndarray: Boolean selector over the dimension's slots (the trailing
+                 missing-value slot never matches a filter), or None if a
+                 filter cannot be evaluated on the cube
+    """
+    dim_values = cuboid['dim_values'][position]
+    selector = np.ones(len(dim_values) + 1, dtype=bool)
+    
+    for _, op, value in filters:
+        if dim_values.dtype == object:
+            if op not in ("==", "in"):
+                return None
+            wanted = {column_store.normalize_label(item) for item in query.filter_values(op, value)}
+            matched = np.array([column_store.normalize_label(label) in wanted for label in dim_values], dtype=bool)
+        else:
+            if op not in query.NUMERIC_OPERATORS:
+                return None
+            matched = query.NUMERIC_OPERATORS[op](dim_values, value)
+        selector &= np.append(matched, False)
+    return selector
+
+
+def rollup(dataset, measures, group_by, filters):
+    """
+    Answer a filtered group-by from the cube.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        measures (list): Measure columns needed
+        group_by (list): Dimension columns to group by
+        filters (list): (column, op, value) filters, combined with AND
+        
+    Returns:
+        tuple: (DataFrame indexed by the group labels with '<measure>_sum',
+                '<measure>_count', '<measure>_sumsq' and 'rows' columns,
+                total number of rows passing the filters), or None when no
+                cuboid holds the needed dimensions and measures
+    """
+    needed_dims = set(group_by) | {column_name for column_name, _, _ in filters}
+    for cuboid_id, spec in CUBOIDS.items():
+        if needed_dims <= set(spec['dims']) and set(measures) <= set(spec['measures']):
+            cuboid = get_cuboid(dataset, cuboid_id)
+            if cuboid is not None:
+                result = rollup_cuboid(cuboid, measures, group_by, filters)
+                if result is not None:
+                    return result
+    return None
+
+
+def rollup_cuboid(cuboid, measures, group_by, filters):
+    """
+    Slice a cuboid by the filters and sum out the non-grouped dimensions.
+    
+    Args:
+        cuboid (dict): Cuboid (see build_cuboid)
+        measures (list): Measure columns needed
+        group_by (list): Dimension columns to group by
+        filters (list): (column, op, value) filters, combined with AND
+        
+    Returns:
+        tuple: See rollup, or None if a filter cannot be evaluated on the cube
+    """
+    selectors = []
+    for position, column_name in enumerate(cuboid['dims']):
+        selector = dimension_selector(cuboid, position, [f for f in filters if f[0] == column_name])
+        if selector is None:
+            return None
+        selectors.append(selector)
+    
+    group_axes = [cuboid['dims'].index(column_name) for column_name in group_by]
+    other_axes = tuple(axis for axis in range(len(cuboid['dims'])) if axis not in group_axes)
+    
+    def rolled(cells):
+        sliced = cells[np.ix_(*selectors)]
+        # Sum out the other dimensions, then order axes as in group_by
+        summed = sliced.sum(axis=other_axes)
+        remaining_axes = [axis for axis in range(len(cuboid['dims'])) if axis in group_axes]
+        return np.transpose(summed, [remaining_axes.index(axis) for axis in group_axes])
+    
+    rows = rolled(cuboid['cells']['rows'])
+    total_rows = int(rows.sum())
+    
+    # Groups are the selected, non-missing slots that hold at least one row
+    group_values = [cuboid['dim_values'][axis][selectors[axis][:-1]] for axis in group_axes]
+    keep = tuple(slice(0, len(values)) for values in group_values)
+    rows = rows[keep]
+    present = np.nonzero(rows > 0)
+    
+    data = {}
+    for column_name in measures:
+        for statistic in ('sum', 'count', 'sumsq'):
+            data[f"{column_name}_{statistic}"] = rolled(cuboid['cells'][(column_name, statistic)])[keep][present]
+    data['rows'] = rows[present]
+    
+    labels = [values[positions] for values, positions in zip(group_values, present)]
+    if len(group_by) == 1:
+        index = pd.Index(labels[0], name=group_by[0])
+    else:
+        index = pd.MultiIndex.from_arrays(labels, names=group_by)
+    return pd.DataFrame(data, index=index), total_rows
+
+
+def rollup_frame(df, measures, group_by, filters):
+    """
+    Answer a filtered group-by from the cube of the store behind a frame.
+    
+    Args:
+        df: Task input (a frame built by column_store.build_store, or any
+            other frame or chunk stream, which always falls back)
+        measures (list): Measure columns needed
+        group_by (list): Dimension columns to group by
+        filters (list): (column, op, value) filters, combined with AND
+        
+    Returns:
+        tuple: See rollup, or None when the caller must scan rows instead
+    """
+    if not isinstance(df, pd.DataFrame):
+        return None
+    store = column_store.frame_store(df)
+    if store is None:
+        return None
+    return rollup(store, measures, group_by, filters)
+
+
+def grouped_sums(df, measures, group_by, filters):
+    """
+    Per-group sums and counts of measures over the rows passing filters.
+    
+    Rolls up the cube when the store behind the frame has one (see
+    rollup_frame); otherwise scans the rows, merging partial sums and counts
+    across chunks, so every Task B/C caller gets the same result either way.
+    
+    Args:
+        df: Task input (a frame, or a stream of chunks, see streaming.iter_frames)
+        measures (list): Numeric columns to aggregate
+        group_by (list): Columns to group by
+        filters (list): (column, op, value) filters, combined with AND
+        
+    Returns:
+        tuple: (sums, counts, rows passing the filters); sums and counts are
+               DataFrames indexed by the groups with one column per measure,
+               None when no row passes the filters
+    """
+    rolled = rollup_frame(df, measures, group_by, filters)
+    if rolled is not None:
+        groups, total_rows = rolled
+        if total_rows == 0:
+            return None, None, 0
+        sums = groups[[f"{measure}_sum" for measure in measures]].set_axis(measures, axis=1)
+        counts = groups[[f"{measure}_count" for measure in measures]].set_axis(measures, axis=1)
+        return sums, counts, total_rows
+    
+    sums = None
+    counts = None
+    total_rows = 0
+    for frame in streaming.iter_frames(df):
+        # The planner starts from the most selective index when the frame has a store
+        selected = frame.iloc[query.select_frame_rows(frame, filters)]
+        if selected.empty:
+            continue
+        grouped = selected.groupby(group_by, observed=True)[measures]
+        sums = streaming.add_partials(sums, grouped.sum())
+        counts = streaming.add_partials(counts, grouped.count())
+        total_rows += len(selected)
+    return sums, counts, total_rows
@@ -0,0 +1,474 @@
+"""
+Dataset Cache Module for Project 1 (Procedural Style)
+Stores the parsed dataset next to the CSV as a directory of raw binary
+column files, and reuses (or memory-maps) it while the CSV is unchanged.
+Variable naming: snake_case
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+import column_store
+import schema
+
+
+CACHE_VERSION = 3
+CACHE_SUFFIX = ".cache"
+
+# Rows per chunk when building the cache without loading the whole CSV
+CACHE_CHUNK_ROWS = 500_000
+
+# Files up to this size are hashed in full; larger ones are hashed by sampling
+FULL_HASH_LIMIT = 8 * 1024 * 1024
+SAMPLE_BLOCKS = 64
+SAMPLE_BLOCK_SIZE = 64 * 1024
+
+
+def get_cache_dir(file_path):
+    """
+    Get the cache directory used for a CSV file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        str: Path of the cache directory next to the CSV
+    """
+    return file_path + CACHE_SUFFIX
+
+
+def content_digest(file_path, file_size):
+    """
+    Hash the content of a file.
+    
+    Small files are hashed in full. Large files are hashed from evenly
+    spaced blocks (always including the first and last), which detects
+    in-place edits without reading multi-GB exports end to end.
+    
+    Args:
+        file_path (str): Path to the file
+        file_size (int): Size of the file in bytes
+        
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as file:
+        if file_size <= FULL_HASH_LIMIT:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        else:
+            step = (file_size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCKS - 1)
+            for i in range(SAMPLE_BLOCKS):
+                file.seek(i * step)
+                digest.update(file.read(SAMPLE_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def file_fingerprint(file_path):
+    """
+    Compute the fingerprint used to decide whether the cache is stale.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        dict: {'size', 'mtime_ns', 'hash'}
+    """
+    stat = os.stat(file_path)
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': content_digest(file_path, stat.st_size)
+    }
+
+
+def read_cache_meta(file_path):
+    """
+    Read the metadata of the cache for a CSV file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        dict: Cache metadata, or None if there is no readable cache
+    """
+    meta_path = os.path.join(get_cache_dir(file_path), "meta.json")
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+    
+    if meta.get('version') != CACHE_VERSION:
+        return None
+    return meta
+
+
+def is_cache_fresh(meta, fingerprint):
+    """
+    Check whether cache metadata matches the current CSV fingerprint.
+    
+    Args:
+        meta (dict): Cache metadata (see read_cache_meta)
+        fingerprint (dict): Current fingerprint (see file_fingerprint)
+        
+    Returns:
+        bool: True if size, mtime and content hash are all unchanged
+    """
+    return meta is not None and meta.get('fingerprint') == fingerprint
+
+
+def start_cache_dir(file_path):
+    """
+    Create an empty temporary directory for a cache being written.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        str: Path of the temporary directory
+    """
+    tmp_dir = get_cache_dir(file_path) + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    return tmp_dir
+
+
+def plain_value(value):
+    """
+    Convert metadata to plain Python types for JSON.
+    
+    Labels and report counts may come out of pandas/numpy as numpy scalars
+    or arrays, which json cannot write.
+    
+    Args:
+        value: Metadata value (dict, list, tuple, numpy scalar or array, ...)
+        
+    Returns:
+        Same value with numpy scalars and arrays replaced by Python ones
+    """
+    if isinstance(value, dict):
+        return {key: plain_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [plain_value(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def finish_cache_dir(file_path, tmp_dir, meta):
+    """
+    Write the metadata and swap a fully written cache into place.
+    
+    Writing to a temporary directory first means an interrupted write never
+    leaves a half-built cache behind.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        tmp_dir (str): Temporary directory holding the column files
+        meta (dict): Cache metadata
+        
+    Raises:
+        TypeError: If the metadata holds values JSON cannot represent (the
+                   temporary directory is removed first)
+    """
+    try:
+        with open(os.path.join(tmp_dir, "meta.json"), 'w', encoding='utf-8') as file:
+            json.dump(plain_value(meta), file)
+    except (TypeError, ValueError):
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    
+    cache_dir = get_cache_dir(file_path)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+
+
+def save_cache(dataset, fingerprint):
+    """
+    Write the dataset's columns to the binary cache next to its CSV.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        fingerprint (dict): Fingerprint of the CSV the dataset was parsed from
+        
+    Returns:
+        dict: Metadata of the written cache
+    """
+    tmp_dir = start_cache_dir(dataset['file_path'])
+    
+    columns = []
+    for position, column_name in enumerate(dataset['header']):
+        values = dataset['columns'][column_name]
+        file_name = f"col_{position:03d}.bin"
+        values.tofile(os.path.join(tmp_dir, file_name))
+        columns.append({
+            'name': column_name,
+            'file': file_name,
+            'dtype': values.dtype.str,
+            'labels': dataset['labels'].get(column_name)
+        })
+    
+    meta = {
+        'version': CACHE_VERSION,
+        'fingerprint': fingerprint,
+        'n_rows': dataset['n_rows'],
+        'columns': columns,
+        'report': dataset.get('report')
+    }
+    finish_cache_dir(dataset['file_path'], tmp_dir, meta)
+    return meta
+
+
+def build_cache_chunked(file_path, fingerprint, chunk_rows=CACHE_CHUNK_ROWS):
+    """
+    Build the binary cache by streaming the CSV in chunks.
+    
+    Used for files larger than RAM: each chunk is parsed, its categorical
+    values are mapped onto a growing label dictionary, and every column is
+    appended to its file, so memory stays bounded by one chunk. Numeric
+    columns are written as float64 (a later chunk may hold values that do
+    not parse) and narrowed to int64 at the end when every value was a
+    whole number, matching the dtypes of a regular in-memory load. Columns
+    the schema does not declare are numeric when every value in the file
+    parses as a number, as column_store.build_store infers them.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        fingerprint (dict): Fingerprint of the CSV
+        chunk_rows (int): Rows parsed per chunk
+        
+    Returns:
+        dict: Metadata of the written cache
+    """
+    tmp_dir = start_cache_dir(file_path)
+    
+    header = list(pd.read_csv(file_path, nrows=0).columns)
+    numeric_names = set(column_store.NUMERIC_COLUMNS) | inferred_numeric_columns(file_path, header, chunk_rows)
+    label_codes = {}
+    integral = {column_name: True for column_name in header}
+    invalid_counts = {column_name: 0 for column_name in header}
+    bad_rows = 0
+    n_rows = 0
+    files = {}
+    try:
+        for position, column_name in enumerate(header):
+            files[column_name] = open(os.path.join(tmp_dir, f"col_{position:03d}.bin"), 'wb')
+        
+        for chunk in pd.read_csv(file_path, chunksize=chunk_rows, dtype=str):
+            chunk_bad = np.zeros(len(chunk), dtype=bool)
+            for column_name in header:
+                values = encode_chunk_column(column_name, chunk[column_name], label_codes, numeric_names)
+                invalid = np.isnan(values) if values.dtype.kind == 'f' else values < 0
+                invalid_counts[column_name] += int(np.count_nonzero(invalid))
+                if column_name in schema.COLUMN_TYPES:
+                    chunk_bad |= invalid
+                if integral[column_name] and values.dtype.kind == 'f':
+                    integral[column_name] = bool(np.all(values == np.trunc(values)))
+                values.tofile(files[column_name])
+            bad_rows += int(np.count_nonzero(chunk_bad))
+            n_rows += len(chunk)
+    finally:
+        for file in files.values():
+            file.close()
+    
+    columns = []
+    for position, column_name in enumerate(header):
+        file_name = f"col_{position:03d}.bin"
+        labels = None
+        dtype = np.float64
+        if column_name in label_codes:
+            labels = sort_chunked_labels(os.path.join(tmp_dir, file_name), n_rows,
+                                         label_codes[column_name], chunk_rows)
+            dtype = np.int32
+        elif integral[column_name]:
+            narrow_to_int64(os.path.join(tmp_dir, file_name), n_rows, chunk_rows)
+            dtype = np.int64
+        columns.append({
+            'name': column_name,
+            'file': file_name,
+            'dtype': np.dtype(dtype).str,
+            'labels': labels
+        })
+    
+    meta = {
+        'version': CACHE_VERSION,
+        'fingerprint': fingerprint,
+        'n_rows': n_rows,
+        'columns': columns,
+        'report': schema.make_report(header, n_rows, invalid_counts, bad_rows)
+    }
+    finish_cache_dir(file_path, tmp_dir, meta)
+    return meta
+
+
+def inferred_numeric_columns(file_path, header, chunk_rows):
+    """
+    Find the undeclared columns a regular load would parse as numbers.
+    
+    pd.read_csv makes a column numeric only if all of its values parse, so
+    the undeclared columns are scanned once before any of them is written.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        header (list): Column names of the file
+        chunk_rows (int): Rows parsed per chunk
+        
+    Returns:
+        set: Names of the undeclared columns whose non-missing values are all
+             numeric
+    """
+    undeclared = [column_name for column_name in header
+                  if column_name not in column_store.NUMERIC_COLUMNS
+                  and column_name not in column_store.CATEGORICAL_COLUMNS]
+    numeric_names = set(undeclared)
+    if not undeclared:
+        return numeric_names
+    
+    for chunk in pd.read_csv(file_path, usecols=undeclared, chunksize=chunk_rows, dtype=str):
+        for column_name in list(numeric_names):
+            present = chunk[column_name].dropna()
+            if pd.to_numeric(present, errors='coerce').isna().any():
+                numeric_names.discard(column_name)
+        if not numeric_names:
+            break
+    return numeric_names
+
+
+def sort_chunked_labels(path, n_rows, codes_by_label, chunk_rows):
+    """
+    Renumber a chunk-built code file so labels are in sorted order.
+    
+    Labels are assigned codes in first-seen order while streaming; sorting
+    them afterwards gives the same dictionary (and groupby order) as a
+    regular in-memory load.
+    
+    Args:
+        path (str): Column file of int32 codes
+        n_rows (int): Number of rows in the file
+        codes_by_label (dict): label -> first-seen code
+        chunk_rows (int): Rows rewritten per block
+        
+    Returns:
+        list: Sorted labels
+    """
+    labels = sorted(codes_by_label)
+    translate = np.empty(len(labels) + 1, dtype=np.int32)
+    translate[-1] = -1
+    for new_code, label in enumerate(labels):
+        translate[codes_by_label[label]] = new_code
+    
+    if n_rows > 0:
+        codes = np.memmap(path, dtype=np.int32, mode='r+', shape=(n_rows,))
+        for start in range(0, n_rows, chunk_rows):
+            codes[start:start + chunk_rows] = translate[codes[start:start + chunk_rows]]
+        codes.flush()
+        del codes
+    return labels
+
+
+def narrow_to_int64(path, n_rows, chunk_rows):
+    """
+    Rewrite a float64 column file of whole numbers as int64, in place.
+    
+    Args:
+        path (str): Column file of float64 values
+        n_rows (int): Number of rows in the file
+        chunk_rows (int): Rows rewritten per block
+    """
+    if n_rows == 0:
+        return
+    values = np.memmap(path, dtype=np.float64, mode='r+', shape=(n_rows,))
+    for start in range(0, n_rows, chunk_rows):
+        block = values[start:start + chunk_rows]
+        block[:] = block.astype(np.int64).view(np.float64)
+    values.flush()
+    del values
+
+
+def encode_chunk_column(column_name, series, label_codes, numeric_names):
+    """
+    Convert one column of a raw string chunk to its cached buffer.
+    
+    Args:
+        column_name (str): Column name
+        series (Series): Raw string values of the chunk
+        label_codes (dict): column name -> {label: code}, extended in place
+        numeric_names (set): Columns stored as numbers
+        
+    Returns:
+        ndarray: float64 values or int32 codes (-1 for missing values)
+    """
+    if column_name in numeric_names:
+        return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64)
+    
+    codes_by_label = label_codes.setdefault(column_name, {})
+    chunk_codes, uniques = pd.factorize(series)
+    translate = np.empty(len(uniques) + 1, dtype=np.int32)
+    translate[-1] = -1
+    for position, label in enumerate(uniques):
+        translate[position] = codes_by_label.setdefault(label, len(codes_by_label))
+    return translate[chunk_codes]
+
+
+def open_columns(file_path, meta, mmap=False):
+    """
+    Open the column buffers of a fresh binary cache.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        meta (dict): Cache metadata (see read_cache_meta)
+        mmap (bool): Memory-map the files read-only instead of reading them
+        
+    Returns:
+        dict: column name -> ndarray, or None if a column file is unreadable
+    """
+    cache_dir = get_cache_dir(file_path)
+    n_rows = meta['n_rows']
+    columns = {}
+    try:
+        for column in meta['columns']:
+            path = os.path.join(cache_dir, column['file'])
+            dtype = np.dtype(column['dtype'])
+            if mmap and n_rows > 0:
+                values = np.memmap(path, dtype=dtype, mode='r', shape=(n_rows,))
+            else:
+                values = np.fromfile(path, dtype=dtype)
+            if len(values) != n_rows:
+                return None
+            columns[column['name']] = values
+    except (OSError, ValueError):
+        return None
+    return columns
+
+
+def load_cache(file_path, meta):
+    """
+    Rebuild the typed DataFrame from a fresh binary cache.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        meta (dict): Cache metadata (see read_cache_meta)
+        
+    Returns:
+        DataFrame: Frame with numeric and categorical columns, or None if a
+                   column file could not be read
+    """
+    columns = open_columns(file_path, meta)
+    if columns is None:
+        return None
+    
+    data = {}
+    for column in meta['columns']:
+        values = columns[column['name']]
+        if column['labels'] is not None:
+            values = pd.Categorical.from_codes(values, categories=column['labels'])
+        data[column['name']] = values
+    
+    return pd.DataFrame(data, copy=False)
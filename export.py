@@ -0,0 +1,247 @@
+"""
+Export Module for Project 1 (Procedural Style)
+Writes Task A retrieval results to CSV, JSON Lines, Parquet or Arrow IPC
+files with bulk columnar writers, a chunk of rows at a time, instead of
+formatting them for the terminal.
+Variable naming: snake_case
+
+Usage:
+    python export.py A1 city=Karachi --output karachi.csv
+    python export.py A3 min_urban_dev_index=0.5 min_proximity_to_water=5 --output a3.parquet
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+import column_store
+import loader
+import retriever
+
+
+# Export format -> file extension
+EXPORT_FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet', 'arrow': '.arrow'}
+
+# Rows decoded and written per chunk, so memory stays bounded
+EXPORT_CHUNK_ROWS = 500_000
+
+
+def export_format(path, fmt=None):
+    """
+    Work out the export format of a file.
+    
+    Args:
+        path (str): Output path
+        fmt (str): Key of EXPORT_FORMATS, or None to use the extension
+        
+    Returns:
+        str: Key of EXPORT_FORMATS
+        
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lower()
+        fmt = {'.feather': 'arrow', '.ipc': 'arrow'}.get(extension)
+        fmt = fmt or next((name for name, suffix in EXPORT_FORMATS.items() if suffix == extension), None)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format for '{path}' (use one of: {', '.join(EXPORT_FORMATS)}).")
+    return fmt
+
+
+def format_available(fmt):
+    """
+    Check that the libraries an export format needs are installed.
+    
+    Args:
+        fmt (str): Key of EXPORT_FORMATS
+        
+    Returns:
+        bool: True for CSV and JSON Lines, and for Parquet/Arrow when
+              pyarrow can be imported
+    """
+    if fmt in ('csv', 'jsonl'):
+        return True
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+    return True
+
+
+def result_frame(dataset, row_ids, column_names):
+    """
+    Decode the selected rows of some columns into a DataFrame.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        row_ids (ndarray): Row positions
+        column_names (list): Columns to include; missing ones hold "N/A"
+        
+    Returns:
+        DataFrame: One column per name, one row per position
+    """
+    data = {}
+    for column_name in column_names:
+        values = column_store.column_values(dataset, column_name, row_ids)
+        data[column_name] = values if values is not None else ["N/A"] * len(row_ids)
+    return pd.DataFrame(data)
+
+
+def write_rows(dataset, row_ids, column_names, path, fmt=None):
+    """
+    Write the selected rows to a file in chunks.
+    
+    Parquet and Arrow IPC need pyarrow. The file is written under a
+    temporary name and renamed when complete.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        row_ids (ndarray): Row positions to write
+        column_names (list): Columns to write, in order
+        path (str): Output file
+        fmt (str): Key of EXPORT_FORMATS, or None to use the extension
+        
+    Returns:
+        int: Number of rows written
+    """
+    fmt = export_format(path, fmt)
+    temp_path = path + ".tmp"
+    starts = range(0, max(len(row_ids), 1), EXPORT_CHUNK_ROWS)
+    chunks = (result_frame(dataset, row_ids[start:start + EXPORT_CHUNK_ROWS], column_names) for start in starts)
+    
+    if fmt in ('csv', 'jsonl'):
+        with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+            for index, chunk in enumerate(chunks):
+                if fmt == 'csv':
+                    chunk.to_csv(file, index=False, header=index == 0, lineterminator='\n')
+                elif len(chunk):
+                    file.write(chunk.to_json(orient='records', lines=True, force_ascii=False).rstrip('\n') + '\n')
+    else:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+        
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    if fmt == 'parquet':
+                        writer = pyarrow.parquet.ParquetWriter(temp_path, table.schema)
+                    else:
+                        writer = pyarrow.ipc.new_file(temp_path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    os.replace(temp_path, path)
+    return len(row_ids)
+
+
+def export_retrieval(dataset, task_id, params, path, fmt=None):
+    """
+    Run a Task A retrieval and write every match to a file.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        task_id (str): Key of retriever.RETRIEVAL_TASKS (e.g. "A1")
+        params (dict): Values for the task's "$name" placeholders
+        path (str): Output file
+        fmt (str): Key of EXPORT_FORMATS, or None to use the extension
+        
+    Returns:
+        int: Number of rows written, or None if a filter column is missing
+    """
+    row_ids = retriever.retrieve_ids(dataset, task_id, **params)
+    if row_ids is None:
+        return None
+    return write_rows(dataset, row_ids, retriever.RETRIEVAL_TASKS[task_id]['columns'], path, fmt)
+
+
+def parse_params(task_id, pairs):
+    """
+    Parse name=value arguments into typed task parameters.
+    
+    Args:
+        task_id (str): Key of retriever.RETRIEVAL_TASKS
+        pairs (list): "name=value" strings
+        
+    Returns:
+        dict: Parameter values, numbers converted to float
+        
+    Raises:
+        ValueError: For a malformed pair, an unknown or missing parameter,
+                    or a threshold that is not a number
+    """
+    expected = []
+    for _, op, value in retriever.RETRIEVAL_TASKS[task_id]['filters']:
+        expected.append((value[1:], op != '=='))
+    
+    given = {}
+    for pair in pairs:
+        name, separator, value = pair.partition('=')
+        if not separator:
+            raise ValueError(f"Expected name=value, got '{pair}'.")
+        given[name] = value
+    
+    unknown = set(given) - {name for name, _ in expected}
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) for {task_id}: {', '.join(sorted(unknown))}")
+    params = {}
+    for name, numeric in expected:
+        if name not in given:
+            raise ValueError(f"Missing parameter '{name}' for {task_id}.")
+        params[name] = float(given[name]) if numeric else given[name]
+    return params
+
+
+def main(argv=None):
+    """
+    Export entry point.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Export a Task A retrieval to a file.")
+    parser.add_argument('task', type=str.upper, choices=list(retriever.RETRIEVAL_TASKS))
+    parser.add_argument('params', nargs='*', help="Task parameters as name=value")
+    parser.add_argument('--output', required=True, help="Output file (.csv, .jsonl, .parquet or .arrow)")
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), help="Output format (default: from extension)")
+    parser.add_argument('--csv', default="Urban_wildlife.csv", help="CSV file to query")
+    args = parser.parse_args(argv)
+    
+    try:
+        params = parse_params(args.task, args.params)
+        fmt = export_format(args.output, args.format)
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        return 2
+    if not format_available(fmt):
+        print(f"Error: {fmt} export needs pyarrow (pip install pyarrow).")
+        return 2
+    
+    is_valid, message = loader.validate_csv_file(args.csv)
+    if not is_valid:
+        print(message)
+        return 1
+    dataset = loader.load_dataset(args.csv, **loader.load_options(args.csv))
+    if dataset is None:
+        return 1
+    
+    written = export_retrieval(dataset, args.task, params, args.output, fmt)
+    if written is None:
+        print("Error: Required columns not found.")
+        return 1
+    print(f"✓ {written} records written to '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
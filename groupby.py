@@ -0,0 +1,356 @@
+"""
+Group-By Module for Project 1 (Procedural Style)
+Groups rows by one or more dictionary-encoded key columns through a single
+dense integer group id (mixed-radix over the key codes) and computes sum,
+count, mean, min, max, variance and mode per group with np.bincount and
+ufunc.at, without a per-group Python loop.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+
+import column_store
+
+
+# Aggregations understood by aggregate()
+AGGREGATIONS = ('count', 'sum', 'sumsq', 'mean', 'min', 'max', 'var', 'mode')
+
+# Above this many possible key combinations, group ids are compacted to the
+# combinations that occur, so the per-group arrays stay small
+MAX_DENSE_GROUPS = 1 << 24
+
+# Whole-number values spanning fewer than this many integers are encoded
+# with a bincount rather than a sort
+MAX_LEVEL_RANGE = 1 << 16
+
+
+def encode_key(dataset, column_name, max_values=None):
+    """
+    Encode a column as dense key codes.
+    
+    Categorical columns use their dictionary codes; numeric columns are
+    encoded by their sorted distinct values. The last code of every key is
+    reserved for missing values.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        column_name (str): Key column
+        max_values (int): Give up on numeric columns with more distinct
+                          values than this (None for no limit)
+        
+    Returns:
+        tuple: (codes, key values), or None if a numeric column has more
+               than max_values distinct values
+    """
+    values = dataset['columns'][column_name]
+    valid = column_store.valid_mask(dataset, column_name)
+    
+    if column_store.is_categorical(dataset, column_name):
+        key_values = np.array(dataset['labels'][column_name], dtype=object)
+        codes = np.where(valid, values, len(key_values)).astype(np.intp)
+        return codes, key_values
+    
+    key_values = np.unique(values[valid])
+    if max_values is not None and len(key_values) > max_values:
+        return None
+    codes = np.where(valid, np.searchsorted(key_values, values), len(key_values)).astype(np.intp)
+    return codes, key_values
+
+
+def group_ids(codes, shape):
+    """
+    Combine per-key codes into one mixed-radix group id.
+    
+    Args:
+        codes (list): Code array per key, all the same length
+        shape (tuple): Number of codes per key (the radixes)
+        
+    Returns:
+        ndarray: Group id of each row, in range(prod(shape))
+    """
+    if len(codes) == 1:
+        return codes[0].astype(np.int64)
+    return np.ravel_multi_index(codes, shape).astype(np.int64)
+
+
+def compact_ids(ids, size):
+    """
+    Renumber group ids to the ones that occur when the id space is large.
+    
+    Args:
+        ids (ndarray): Group id per row
+        size (int): Size of the id space
+        
+    Returns:
+        tuple: (ids in range(n_groups), n_groups, original id of each
+               group, or None when the ids were left dense)
+    """
+    if size <= MAX_DENSE_GROUPS:
+        return ids, size, None
+    occurring, compacted = np.unique(ids, return_inverse=True)
+    return compacted, len(occurring), occurring
+
+
+def exact_sums(ids, values, size, counts=None):
+    """
+    Sum values per group, corrected for floating-point rounding.
+    
+    A plain np.bincount sum is refined with a second bincount over the
+    residuals from the group means, so the result matches a compensated
+    sum (as pandas computes) to well below display precision.
+    
+    Args:
+        ids (ndarray): Group id per value
+        values (ndarray): float64 values
+        size (int): Number of groups
+        counts (ndarray): Values per group, if already counted
+        
+    Returns:
+        ndarray: Sum per group (0 for empty groups)
+    """
+    if counts is None:
+        counts = np.bincount(ids, minlength=size)
+    sums = np.bincount(ids, weights=values, minlength=size)
+    means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0)
+    return sums + np.bincount(ids, weights=values - means[ids], minlength=size)
+
+
+def encode_levels(values):
+    """
+    Encode values by their sorted distinct values.
+    
+    Whole numbers in a small range (codes, counts, scores) are encoded with
+    a bincount instead of a sort.
+    
+    Args:
+        values (ndarray): Values
+        
+    Returns:
+        tuple: (sorted distinct values, code of each value)
+    """
+    if len(values) and values.dtype.kind in 'iuf':
+        low, high = values.min(), values.max()
+        if high - low < MAX_LEVEL_RANGE:
+            offsets = values - low
+            if values.dtype.kind != 'f' or np.array_equal(offsets, offsets.astype(np.int64)):
+                offsets = offsets.astype(np.intp)
+                seen = np.bincount(offsets) > 0
+                codes = np.cumsum(seen) - 1
+                return (np.flatnonzero(seen) + low).astype(values.dtype), codes[offsets]
+    return np.unique(values, return_inverse=True)
+
+
+def group_modes(ids, values, size):
+    """
+    Most common value per group; ties go to the value seen first.
+    
+    Args:
+        ids (ndarray): Group id per value, in row order
+        values (ndarray): Values
+        size (int): Number of groups
+        
+    Returns:
+        tuple: (mode per group, boolean mask of groups that have one)
+    """
+    levels, level_codes = encode_levels(values)
+    radix = max(len(levels), 1)
+    pair_ids = ids * radix + level_codes
+    
+    if size * radix <= MAX_DENSE_GROUPS:
+        # Dense (group, level) counts and first positions
+        counts = np.bincount(pair_ids, minlength=size * radix).reshape(size, radix)
+        first_seen = np.full(size * radix, len(pair_ids))
+        np.minimum.at(first_seen, pair_ids, np.arange(len(pair_ids)))
+        first_seen = first_seen.reshape(size, radix)
+        
+        best = counts.max(axis=1)
+        winners = np.where(counts == best[:, None], first_seen, len(pair_ids) + 1).argmin(axis=1)
+        return levels[winners] if len(levels) else np.zeros(size, dtype=levels.dtype), best > 0
+    
+    pairs, first_seen, pair_counts = np.unique(pair_ids, return_index=True, return_counts=True)
+    pair_groups = pairs // radix
+    
+    # Per group: highest count first, then earliest first occurrence
+    order = np.lexsort((first_seen, -pair_counts, pair_groups))
+    winners = order[np.r_[True, pair_groups[order][1:] != pair_groups[order][:-1]]] if len(order) else order
+    
+    has_mode = np.zeros(size, dtype=bool)
+    has_mode[pair_groups[winners]] = True
+    modes = np.zeros(size, dtype=levels.dtype)
+    modes[pair_groups[winners]] = levels[pairs[winners] % radix]
+    return modes, has_mode
+
+
+def aggregate(ids, values, size, op):
+    """
+    Compute one aggregation per group.
+    
+    Args:
+        ids (ndarray): Group id per value (missing values already removed)
+        values (ndarray): Values
+        size (int): Number of groups
+        op (str): One of AGGREGATIONS
+        
+    Returns:
+        ndarray: Value per group. Groups without values get 0 for 'count',
+                 'sum' and 'sumsq' and NaN otherwise; 'var' is the sample
+                 variance (NaN below two values); 'mode' keeps the values'
+                 dtype, as a float array with NaN gaps when some groups
+                 have no value
+        
+    Raises:
+        ValueError: For an unknown aggregation
+    """
+    if op not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{op}' (use one of: {', '.join(AGGREGATIONS)}).")
+    
+    if op == 'count':
+        return np.bincount(ids, minlength=size)
+    if op == 'mode':
+        modes, has_mode = group_modes(ids, values, size)
+        return modes if has_mode.all() else np.where(has_mode, modes, np.nan)
+    
+    values = values.astype(np.float64)
+    if op == 'sum':
+        return exact_sums(ids, values, size)
+    if op == 'sumsq':
+        return exact_sums(ids, values * values, size)
+    
+    counts = np.bincount(ids, minlength=size)
+    if op in ('min', 'max'):
+        result = np.full(size, np.inf if op == 'min' else -np.inf)
+        (np.minimum if op == 'min' else np.maximum).at(result, ids, values)
+        result[counts == 0] = np.nan
+        return result
+    
+    means = np.full(size, np.nan)
+    np.divide(exact_sums(ids, values, size, counts), counts, out=means, where=counts > 0)
+    if op == 'mean':
+        return means
+    squares = np.bincount(ids, weights=(values - means[ids]) ** 2, minlength=size)
+    variances = np.full(size, np.nan)
+    np.divide(squares, counts - 1, out=variances, where=counts > 1)
+    return variances
+
+
+def group_by(dataset, keys, aggregations, row_ids=None, dropna=True):
+    """
+    Group rows of the store by key columns and aggregate other columns.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        keys (list): Key columns (categorical, or numeric of any cardinality)
+        aggregations (list): (column, op) pairs, op from AGGREGATIONS;
+                             missing values of the column are skipped
+        row_ids (ndarray): Sorted row positions to group (None for all rows)
+        dropna (bool): Drop rows with a missing key, like pandas' groupby
+        
+    Returns:
+        DataFrame: One row per group that has rows, indexed by the key
+                   values in key order, with a column per aggregation named
+                   '<column>_<op>' and a 'rows' column
+    """
+    # rows stays None while every row takes part, so no column is gathered
+    rows = row_ids
+    codes = []
+    key_values = []
+    for column_name in keys:
+        column_codes, values = encode_key(dataset, column_name)
+        codes.append(column_codes if rows is None else column_codes[rows])
+        key_values.append(values)
+    shape = tuple(len(values) + 1 for values in key_values)
+    
+    if dropna:
+        has_keys = np.logical_and.reduce([column_codes < len(values) for column_codes, values in zip(codes, key_values)])
+        if not has_keys.all():
+            rows = np.flatnonzero(has_keys) if rows is None else rows[has_keys]
+            codes = [column_codes[has_keys] for column_codes in codes]
+    
+    ids, size, occurring = compact_ids(group_ids(codes, shape), int(np.prod(shape)))
+    row_counts = np.bincount(ids, minlength=size)
+    present = np.flatnonzero(row_counts)
+    
+    data = {}
+    for column_name, op in aggregations:
+        valid = column_store.valid_mask(dataset, column_name)
+        values = dataset['columns'][column_name]
+        if rows is not None:
+            valid = valid[rows]
+            values = values[rows]
+        value_ids = ids
+        if not valid.all():
+            value_ids = ids[valid]
+            values = values[valid]
+        if op == 'mode':
+            # Only gaps among the present groups turn the modes into floats
+            modes, has_mode = group_modes(value_ids, values, size)
+            modes, has_mode = modes[present], has_mode[present]
+            if column_store.is_categorical(dataset, column_name):
+                labels = np.append(np.array(dataset['labels'][column_name], dtype=object), np.nan)
+                result = labels[np.where(has_mode, modes, -1)]
+            else:
+                result = modes if has_mode.all() else np.where(has_mode, modes, np.nan)
+        else:
+            result = aggregate(value_ids, values, size, op)[present]
+        data[f"{column_name}_{op}"] = result
+    data['rows'] = row_counts[present]
+    
+    # Decode the present group ids back to key values, with NaN for the missing slot
+    dense_ids = present if occurring is None else occurring[present]
+    labels = []
+    for values, positions in zip(key_values, np.unravel_index(dense_ids, shape)):
+        padded = values if dropna else np.append(values.astype(object), np.nan)
+        labels.append(padded[positions])
+    if len(keys) == 1:
+        index = pd.Index(labels[0], name=keys[0])
+    else:
+        index = pd.MultiIndex.from_arrays(labels, names=keys)
+    return pd.DataFrame(data, index=index)
+
+
+def group_arrays(keys, columns, aggregations):
+    """
+    Group plain arrays by one or more key arrays and aggregate.
+    
+    For derived keys (bins, years) and chunks that have no columnar store
+    behind them. Keys are encoded by their sorted distinct values (category
+    order for categoricals), then grouped like group_by.
+    
+    Args:
+        keys (dict): Key name -> values (missing values drop the row)
+        columns (dict): Column name -> values to aggregate (missing values
+                        are skipped)
+        aggregations (list): (column, op) pairs, op from AGGREGATIONS
+        
+    Returns:
+        DataFrame: See group_by
+    """
+    codes = []
+    key_values = []
+    for values in keys.values():
+        key_codes, uniques = pd.factorize(values, sort=True)
+        codes.append(key_codes)
+        key_values.append(uniques)
+    
+    has_keys = np.logical_and.reduce([key_codes >= 0 for key_codes in codes])
+    codes = [key_codes[has_keys].astype(np.intp) for key_codes in codes]
+    shape = tuple(max(len(uniques), 1) for uniques in key_values)
+    ids, size, occurring = compact_ids(group_ids(codes, shape), int(np.prod(shape)))
+    row_counts = np.bincount(ids, minlength=size)
+    present = np.flatnonzero(row_counts)
+    
+    data = {}
+    for column_name, op in aggregations:
+        values = np.asarray(columns[column_name])[has_keys]
+        valid = ~pd.isna(values)
+        data[f"{column_name}_{op}"] = aggregate(ids[valid], values[valid], size, op)[present]
+    data['rows'] = row_counts[present]
+    
+    dense_ids = present if occurring is None else occurring[present]
+    labels = [uniques[positions] for uniques, positions in zip(key_values, np.unravel_index(dense_ids, shape))]
+    if len(keys) == 1:
+        index = pd.Index(labels[0], name=list(keys)[0])
+    else:
+        index = pd.MultiIndex.from_arrays(labels, names=list(keys))
+    return pd.DataFrame(data, index=index)
@@ -0,0 +1,105 @@
+"""
+Import Budget Module for Project 1 (Procedural Style)
+Measures what the menu's startup path imports, using the interpreter's
+-X importtime instrumentation, and checks it against a time budget and a
+list of heavy modules that must stay deferred.
+Variable naming: snake_case
+
+Usage: python import_budget.py [--budget-ms N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+# Modules imported before the first prompt of main_p1
+STARTUP_MODULES = ['main_p1', 'loader']
+
+# Most milliseconds the startup modules may take to import
+IMPORT_BUDGET_MS = 100
+
+# Heavy packages that must not be imported before a task needs them
+DEFERRED_MODULES = ['pandas', 'numpy', 'matplotlib', 'tabulate']
+
+
+def measure_imports(module_names):
+    """
+    Import modules in a fresh interpreter with -X importtime.
+    
+    Args:
+        module_names (list): Modules to import, in order
+        
+    Returns:
+        list: (module name, self microseconds, cumulative microseconds,
+               nesting depth) per import, in the order reported
+    """
+    code = "; ".join(f"import {module_name}" for module_name in module_names)
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               capture_output=True, text=True, check=True)
+    
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def check_budget(module_names=STARTUP_MODULES, budget_ms=IMPORT_BUDGET_MS):
+    """
+    Check the startup imports against the budget.
+    
+    Args:
+        module_names (list): Modules imported on the startup path
+        budget_ms (float): Time budget in milliseconds
+        
+    Returns:
+        dict: 'total_ms' (cumulative time of the startup modules),
+              'deferred_loaded' (heavy packages that were imported),
+              'slowest' (five slowest imports by self time) and 'ok'
+    """
+    imports = measure_imports(module_names)
+    total_ms = sum(cumulative for name, _, cumulative, depth in imports
+                   if depth == 0 and name in module_names) / 1000
+    deferred_loaded = sorted({name.split('.')[0] for name, _, _, _ in imports
+                              if name.split('.')[0] in DEFERRED_MODULES})
+    slowest = sorted(imports, key=lambda item: item[1], reverse=True)[:5]
+    return {
+        'total_ms': total_ms,
+        'deferred_loaded': deferred_loaded,
+        'slowest': [(name, self_us / 1000) for name, self_us, _, _ in slowest],
+        'ok': total_ms <= budget_ms and not deferred_loaded
+    }
+
+
+def main(argv=None):
+    """
+    Print the startup import report.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: 0 if the budget is met, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Check the menu's startup import time.")
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args(argv)
+    
+    result = check_budget(budget_ms=args.budget_ms)
+    
+    print(f"Startup imports ({', '.join(STARTUP_MODULES)}): {result['total_ms']:.1f} ms "
+          f"(budget {args.budget_ms:.0f} ms)")
+    for name, self_ms in result['slowest']:
+        print(f"  {self_ms:7.2f} ms  {name}")
+    if result['deferred_loaded']:
+        print(f"Imported before a task needs them: {', '.join(result['deferred_loaded'])}")
+    print("✓ Within budget" if result['ok'] else "✗ Over budget")
+    return 0 if result['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
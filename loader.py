@@ -1,117 +1,408 @@
-
-
-import csv
-import os
-
-# Global variable to store the file path for reuse in Task B
-csv_file_path = None
-
-
-def prompt_file_path():
-    """
-    Prompt user to input CSV file path or use default.
-    
-    Returns:
-        str: The file path entered by user or default path
-    """
-    default_path = "Urban_wildlife.csv"
-    print("\n=== CSV File Loader ===")
-    user_input = input(f"Enter CSV file path (or press Enter for default '{default_path}'): ").strip()
-    
-    if user_input == "":
-        return default_path
-    return user_input
-
-
-def validate_csv_file(file_path):
-    """
-    Validate that the CSV file exists and has expected number of columns.
-    
-    Args:
-        file_path (str): Path to the CSV file
-        
-    Returns:
-        tuple: (is_valid, error_message)
-    """
-    # Check if file exists
-    if not os.path.exists(file_path):
-        return False, f"Error: File '{file_path}' does not exist."
-    
-    # Check if file has correct number of columns
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.reader(file)
-            header = next(csv_reader)
-            
-            if len(header) != 23:  # Expected 23 columns
-                return False, f"Error: Expected 23 columns, found {len(header)} columns."
-                
-        return True, "File validated successfully."
-    
-    except Exception as e:
-        return False, f"Error reading file: {str(e)}"
-
-
-def load_csv_as_list(file_path):
-    """
-    Load CSV file using csv.reader() into a list of rows.
-    
-    Args:
-        file_path (str): Path to the CSV file
-        
-    Returns:
-        tuple: (header_row, data_rows) where header_row is list and data_rows is list of lists
-    """
-    global csv_file_path
-    csv_file_path = file_path  # Store for Task B reuse
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.reader(file)
-            header_row = next(csv_reader)
-            data_rows = list(csv_reader)
-            
-        print(f"\n✓ Successfully loaded {len(data_rows)} records from CSV file.")
-        print(f"✓ Columns: {len(header_row)}")
-        
-        return header_row, data_rows
-    
-    except Exception as e:
-        print(f"Error loading CSV: {str(e)}")
-        return None, None
-
-
-def get_csv_file_path():
-    """
-    Returns the stored CSV file path for reuse in Task B.
-    
-    Returns:
-        str: The stored CSV file path
-    """
-    return csv_file_path
-
-
-def initialize_data():
-    """
-    Complete data initialization workflow.
-    Prompts for file, validates, and loads data.
-    
-    Returns:
-        tuple: (header_row, data_rows, file_path) or (None, None, None) on failure
-    """
-    file_path = prompt_file_path()
-    
-    # Validate file
-    is_valid, message = validate_csv_file(file_path)
-    print(message)
-    
-    if not is_valid:
-        return None, None, None
-    
-    # Load data
-    header_row, data_rows = load_csv_as_list(file_path)
-    
-    if header_row is None:
-        return None, None, None
-    
-    return header_row, data_rows, file_path
+
+
+import csv
+import os
+import threading
+import time
+
+import profiling
+import schema
+
+# pandas and the store modules are imported when a dataset is first loaded,
+# so the file prompt appears before they are paid for
+
+# Global variable to store the file path for reuse in Task B
+csv_file_path = None
+
+# CSV files larger than this are opened memory-mapped by default
+MMAP_THRESHOLD_BYTES = 1024 * 1024 * 1024
+
+# Seconds between progress updates while a task waits for a background load
+PROGRESS_INTERVAL_S = 0.5
+
+
+def prompt_file_path():
+    """
+    Prompt user to input CSV file path or use default.
+    
+    Returns:
+        str: The file path entered by user or default path
+    """
+    default_path = "Urban_wildlife.csv"
+    print("\n=== CSV File Loader ===")
+    user_input = input(f"Enter CSV file path (or press Enter for default '{default_path}'): ").strip()
+    
+    if user_input == "":
+        return default_path
+    return user_input
+
+
+def validate_csv_file(file_path):
+    """
+    Validate that the CSV file exists.
+    
+    The header and column types are checked against the declared schema
+    while the file is parsed (see schema.make_report), so the file is not
+    opened here.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        tuple: (is_valid, error_message)
+    """
+    # Check if file exists
+    if not os.path.isfile(file_path):
+        return False, f"Error: File '{file_path}' does not exist."
+    
+    return True, "File found."
+
+
+def load_dataset(file_path, use_cache=True, mmap=False, workers=1, eager=True, log=print):
+    """
+    Load CSV file once into a typed columnar dataset shared by all tasks.
+    
+    The file is parsed a single time with pandas and turned into a typed
+    columnar store (see column_store.build_store), and the schema validation
+    report is built from that same parse and stored as dataset['report']. Task A retrievals read the
+    store's columns and Tasks B/C use its frame, which shares the same
+    buffers, so no second parse or duplicate copy of the data is made. The
+    aggregate cube behind Tasks B1/B2/C1/C3 is built from the same store
+    (see cube.build_cube).
+    
+    After the first parse the columns are written to a binary cache next to
+    the CSV; later loads reuse it while the CSV's size, mtime and content
+    hash are unchanged, and rebuild it automatically otherwise.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        use_cache (bool): Read and write the binary column cache
+        mmap (bool): Memory-map the cached columns instead of loading them
+                     (see load_mapped_dataset)
+        workers (int): Worker processes used to parse the CSV (see
+                       ingest.parallel_read_csv); 1 parses in this process
+        eager (bool): Build indexes and the aggregate cube before returning;
+                      otherwise they are built on first use (or by
+                      build_derived_structures)
+        log (function): Called with each progress line (defaults to print)
+        
+    Returns:
+        dict: Dataset built by column_store.build_store, or None on failure
+    """
+    with profiling.task('load'):
+        if mmap:
+            return load_mapped_dataset(file_path, log)
+        return read_dataset(file_path, use_cache, workers, eager, log)
+
+
+def read_dataset(file_path, use_cache, workers, eager, log):
+    """
+    Parse (or read from the binary cache) and build an in-memory dataset.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        use_cache (bool): Read and write the binary column cache
+        workers (int): Worker processes used to parse the CSV
+        eager (bool): Build indexes and the aggregate cube before returning
+        log (function): Called with each progress line
+        
+    Returns:
+        dict: See load_dataset
+    """
+    import pandas as pd
+    import column_store
+    import cube
+    import dataset_cache
+    import ingest
+    
+    global csv_file_path
+    csv_file_path = file_path  # Store for Task B reuse
+    
+    try:
+        fingerprint = dataset_cache.file_fingerprint(file_path)
+        
+        frame = None
+        meta = None
+        with profiling.stage('parse') as record:
+            if use_cache:
+                meta = dataset_cache.read_cache_meta(file_path)
+                if dataset_cache.is_cache_fresh(meta, fingerprint):
+                    frame = dataset_cache.load_cache(file_path, meta)
+            
+            from_cache = frame is not None
+            if not from_cache:
+                if workers > 1:
+                    frame = ingest.parallel_read_csv(file_path, workers)
+                else:
+                    frame = pd.read_csv(file_path)
+            record['rows'] = len(frame)
+        
+        source = "binary cache" if from_cache else "CSV file"
+        log(f"\n✓ Successfully loaded {len(frame)} records from {source}.")
+        log(f"✓ Columns: {len(frame.columns)}")
+        
+        with profiling.stage('build', len(frame)):
+            dataset = column_store.build_store(frame, file_path, eager=eager, fingerprint=fingerprint)
+            if eager:
+                cube.build_cube(dataset)
+        
+        # Validation report comes from the parsed buffers (or the cache), never a rescan
+        cached_report = meta.get('report') if from_cache else None
+        dataset['report'] = cached_report or column_store.validation_report(dataset)
+        schema.print_report(dataset['report'], log)
+    
+    except Exception as e:
+        log(f"Error loading CSV: {str(e)}")
+        return None
+    
+    if use_cache and not from_cache:
+        try:
+            dataset_cache.save_cache(dataset, fingerprint)
+        except (OSError, TypeError, ValueError) as e:
+            # The cache is best effort; the dataset itself loaded fine
+            log(f"Warning: could not write dataset cache: {str(e)}")
+    
+    return dataset
+
+
+def load_mapped_dataset(file_path, log=print):
+    """
+    Open the dataset memory-mapped, for files larger than RAM.
+    
+    The binary cache is (re)built by streaming the CSV in chunks when it is
+    missing or stale, then its column files are memory-mapped read-only.
+    Tasks page in only the columns (and pages) they touch, so resident
+    memory scales with the query rather than the file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        log (function): Called with each progress line (defaults to print)
+        
+    Returns:
+        dict: Dataset built by column_store.build_mapped_store, or None on failure
+    """
+    import column_store
+    import dataset_cache
+    
+    global csv_file_path
+    csv_file_path = file_path  # Store for Task B reuse
+    
+    try:
+        fingerprint = dataset_cache.file_fingerprint(file_path)
+        meta = dataset_cache.read_cache_meta(file_path)
+        
+        if not dataset_cache.is_cache_fresh(meta, fingerprint):
+            log("\nBuilding binary column cache (streaming the CSV)...")
+            with profiling.stage('parse') as record:
+                meta = dataset_cache.build_cache_chunked(file_path, fingerprint)
+                record['rows'] = meta['n_rows']
+        
+        with profiling.stage('map', meta['n_rows']):
+            columns = dataset_cache.open_columns(file_path, meta, mmap=True)
+        if columns is None:
+            log("Error: dataset cache is unreadable.")
+            return None
+        
+        labels = {column['name']: column['labels'] for column in meta['columns'] if column['labels'] is not None}
+        header = [column['name'] for column in meta['columns']]
+        
+        log(f"\n✓ Memory-mapped {meta['n_rows']} records from binary cache.")
+        log(f"✓ Columns: {len(header)}")
+        
+        dataset = column_store.build_mapped_store(columns, labels, header, meta['n_rows'], file_path, fingerprint)
+        dataset['report'] = meta.get('report') or column_store.validation_report(dataset)
+        schema.print_report(dataset['report'], log)
+        return dataset
+    
+    except Exception as e:
+        log(f"Error loading CSV: {str(e)}")
+        return None
+
+
+def get_csv_file_path():
+    """
+    Returns the stored CSV file path for reuse in Task B.
+    
+    Returns:
+        str: The stored CSV file path
+    """
+    return csv_file_path
+
+
+def initialize_data(mmap=None):
+    """
+    Complete data initialization workflow.
+    Prompts for file, validates, and loads data.
+    
+    Args:
+        mmap (bool): Memory-map the dataset; None chooses automatically for
+                     files larger than MMAP_THRESHOLD_BYTES
+        
+    Returns:
+        dict: Loaded dataset (see load_dataset), or None on failure
+    """
+    file_path = prompt_file_path()
+    
+    # Validate file
+    is_valid, message = validate_csv_file(file_path)
+    print(message)
+    
+    if not is_valid:
+        return None
+    
+    # Load data
+    return load_dataset(file_path, **load_options(file_path, mmap))
+
+
+def load_options(file_path, mmap=None):
+    """
+    Choose how to load a CSV file from its size.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        mmap (bool): Memory-map the dataset; None chooses automatically for
+                     files larger than MMAP_THRESHOLD_BYTES
+        
+    Returns:
+        dict: 'mmap' and 'workers' arguments for load_dataset
+    """
+    import ingest
+    
+    file_size = os.path.getsize(file_path)
+    if mmap is None:
+        mmap = file_size > MMAP_THRESHOLD_BYTES
+    
+    # Large files are parsed on all cores
+    workers = (os.cpu_count() or 1) if file_size > ingest.PARALLEL_THRESHOLD_BYTES else 1
+    return {'mmap': mmap, 'workers': workers}
+
+
+def read_header(file_path):
+    """
+    Read just the header row of a CSV file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        list: Column names (empty if the file has no rows)
+    """
+    with open(file_path, 'r', newline='', encoding='utf-8') as file:
+        return next(csv.reader(file), [])
+
+
+def build_derived_structures(dataset):
+    """
+    Build the validity masks, equality indexes and aggregate cube of a
+    dataset loaded with eager=False.
+    
+    Each structure is also built on first use, so tasks that run before
+    this finishes still work; they just build what they need themselves.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+    """
+    import column_store
+    import cube
+    
+    with profiling.task('load'), profiling.stage('index', dataset['n_rows']):
+        column_store.build_indexes(dataset)
+        cube.build_cube(dataset)
+
+
+def start_background_load(file_path, mmap=None):
+    """
+    Start loading a dataset on a background thread.
+    
+    The header is read before returning, so the column list is available
+    at once. The thread then parses the CSV and builds the store
+    (load_dataset with eager=False), publishes the dataset, and goes on to
+    build the indexes and cube for in-memory datasets.
+    
+    Args:
+        file_path (str): Path to a validated CSV file
+        mmap (bool): Memory-map the dataset; None chooses automatically
+        
+    Returns:
+        dict: Load handle with 'file_path', 'header', 'stage', 'messages'
+              (progress lines not yet shown), 'dataset', 'ready' and
+              'indexed' (threading.Event) and 'started' keys
+    """
+    handle = {
+        'file_path': file_path,
+        'header': read_header(file_path),
+        'stage': "starting",
+        'messages': [],
+        'dataset': None,
+        'ready': threading.Event(),
+        'indexed': threading.Event(),
+        'started': time.perf_counter()
+    }
+    
+    def run():
+        try:
+            handle['stage'] = "parsing CSV"
+            options = load_options(file_path, mmap)
+            dataset = load_dataset(file_path, eager=False, log=handle['messages'].append, **options)
+            handle['dataset'] = dataset
+            handle['ready'].set()
+            
+            if dataset is not None and not options['mmap']:
+                handle['stage'] = "building indexes and cube"
+                build_derived_structures(dataset)
+            handle['stage'] = "ready" if dataset is not None else "failed"
+        except Exception as e:
+            handle['messages'].append(f"Error loading CSV: {str(e)}")
+            handle['stage'] = "failed"
+        finally:
+            handle['ready'].set()
+            handle['indexed'].set()
+    
+    threading.Thread(target=run, name="dataset-loader", daemon=True).start()
+    return handle
+
+
+def load_status(handle):
+    """
+    Describe the state of a background load for the menu.
+    
+    Args:
+        handle (dict): Handle from start_background_load
+        
+    Returns:
+        str: One-line status
+    """
+    elapsed = time.perf_counter() - handle['started']
+    if handle['indexed'].is_set():
+        if handle['dataset'] is None:
+            return "Dataset: failed to load"
+        return f"Dataset: ready ({handle['dataset']['n_rows']} records)"
+    if handle['ready'].is_set():
+        return f"Dataset: ready, {handle['stage']} ({elapsed:.1f}s)"
+    return f"Dataset: loading, {handle['stage']} ({elapsed:.1f}s)"
+
+
+def wait_for_dataset(handle):
+    """
+    Wait for a background load, showing progress, and return its dataset.
+    
+    Progress lines the loader produced are printed once, when a task
+    first gets the dataset.
+    
+    Args:
+        handle (dict): Handle from start_background_load
+        
+    Returns:
+        dict: Loaded dataset, or None if loading failed
+    """
+    waited = False
+    while not handle['ready'].wait(PROGRESS_INTERVAL_S):
+        waited = True
+        elapsed = time.perf_counter() - handle['started']
+        print(f"\r⏳ Loading dataset: {handle['stage']}... {elapsed:.1f}s", end="", flush=True)
+    if waited:
+        print()
+    
+    while handle['messages']:
+        print(handle['messages'].pop(0))
+    return handle['dataset']
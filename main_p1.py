@@ -1,245 +1,427 @@
-
-import loader_p1
-import retriever_p1
-import analyzer_p1
-import visualizer_p1
-
-
-def display_main_menu():
-    """Display the main menu options."""
-    print("\n" + "="*60)
-    print("     URBAN WILDLIFE ANALYSIS - PROJECT 1")
-    print("="*60)
-    print("1. Task A - CSV Retrieval Tasks (A1-A4)")
-    print("2. Task B - Pandas Analysis Tasks (B1-B4)")
-    print("3. Task C - Visualization Tasks (C1-C4)")
-    print("4. Run Full Pipeline (All Tasks)")
-    print("5. Exit")
-    print("="*60)
-
-
-def run_task_a_menu(rows_list, header):
-    """
-    Run Task A sub-menu for retrieval tasks.
-    
-    Args:
-        rows_list (list): List of data rows from CSV
-        header (list): Header row
-    """
-    while True:
-        print("\n" + "-"*60)
-        print("  TASK A - CSV RETRIEVAL TASKS")
-        print("-"*60)
-        print("1. A1 - Wildlife Sightings by City")
-        print("2. A2 - Environmental Context")
-        print("3. A3 - Human Impact Indicators")
-        print("4. A4 - Custom Filter (Duration & Season)")
-        print("5. Show Available Columns")
-        print("6. Back to Main Menu")
-        print("-"*60)
-        
-        choice = input("Enter your choice (1-6): ").strip()
-        
-        if choice == '1':
-            city = input("Enter city name: ").strip()
-            retriever_p1.task_a1_wildlife_by_city(rows_list, header, city)
-        
-        elif choice == '2':
-            time_of_day = input("Enter TimeOfDay (e.g., Morning, Afternoon, Night): ").strip()
-            try:
-                aqi_threshold = float(input("Enter maximum AQI threshold: ").strip())
-                retriever_p1.task_a2_environmental_context(rows_list, header, time_of_day, aqi_threshold)
-            except ValueError:
-                print("Error: Please enter a valid number for AQI threshold.")
-        
-        elif choice == '3':
-            try:
-                min_urban_dev = float(input("Enter minimum UrbanDevelopmentIndex: ").strip())
-                min_proximity = float(input("Enter minimum Proximity to Water: ").strip())
-                retriever_p1.task_a3_human_impact(rows_list, header, min_urban_dev, min_proximity)
-            except ValueError:
-                print("Error: Please enter valid numbers.")
-        
-        elif choice == '4':
-            try:
-                min_duration = float(input("Enter minimum sighting duration (minutes): ").strip())
-                season = input("Enter season (Spring, Summer, Fall, Winter): ").strip()
-                retriever_p1.task_a4_custom_duration_season(rows_list, header, min_duration, season)
-            except ValueError:
-                print("Error: Please enter a valid number for duration.")
-        
-        elif choice == '5':
-            retriever_p1.display_available_columns(header)
-        
-        elif choice == '6':
-            break
-        
-        else:
-            print("Invalid choice. Please try again.")
-
-
-def run_task_b_menu(df):
-    """
-    Run Task B sub-menu for pandas analysis tasks.
-    
-    Args:
-        df (DataFrame): Pandas DataFrame with wildlife data
-    """
-    while True:
-        print("\n" + "-"*60)
-        print("  TASK B - PANDAS ANALYSIS TASKS")
-        print("-"*60)
-        print("1. B1 - Top Species in Green Zones")
-        print("2. B2 - Environmental Influence by City")
-        print("3. B3 - Human-Wildlife Interaction Analysis")
-        print("4. B4 - Green Space vs Sightings (Endangered)")
-        print("5. Back to Main Menu")
-        print("-"*60)
-        
-        choice = input("Enter your choice (1-5): ").strip()
-        
-        if choice == '1':
-            try:
-                green_threshold = float(input("Enter minimum green space threshold: ").strip())
-                season = input("Enter season: ").strip()
-                analyzer_p1.task_b1_top_species_green(df, green_threshold, season)
-            except ValueError:
-                print("Error: Please enter a valid number for threshold.")
-        
-        elif choice == '2':
-            city = input("Enter city name: ").strip()
-            analyzer_p1.task_b2_env_influence_by_city(df, city)
-        
-        elif choice == '3':
-            interaction_type = input("Enter InteractionType (e.g., Observation, Feeding, Conflict): ").strip()
-            analyzer_p1.task_b3_interaction_analysis(df, interaction_type)
-        
-        elif choice == '4':
-            analyzer_p1.task_b4_custom_endangered_correlation(df)
-        
-        elif choice == '5':
-            break
-        
-        else:
-            print("Invalid choice. Please try again.")
-
-
-def run_task_c_menu(df):
-    """
-    Run Task C sub-menu for visualization tasks.
-    
-    Args:
-        df (DataFrame): Pandas DataFrame with wildlife data
-    """
-    while True:
-        print("\n" + "-"*60)
-        print("  TASK C - VISUALIZATION TASKS")
-        print("-"*60)
-        print("1. C1 - Temperature & Humidity by City")
-        print("2. C2 - SpeciesCategory Trends")
-        print("3. C3 - Public Awareness Distribution")
-        print("4. C4 - Noise vs Sightings (Endangered)")
-        print("5. Back to Main Menu")
-        print("-"*60)
-        
-        choice = input("Enter your choice (1-5): ").strip()
-        
-        if choice == '1':
-            season = input("Enter season: ").strip()
-            visualizer_p1.task_c1_temp_humidity_by_city(df, season)
-        
-        elif choice == '2':
-            city = input("Enter city name: ").strip()
-            visualizer_p1.task_c2_species_trends(df, city)
-        
-        elif choice == '3':
-            city = input("Enter city name: ").strip()
-            visualizer_p1.task_c3_awareness_pie(df, city)
-        
-        elif choice == '4':
-            visualizer_p1.task_c4_custom_noise_scatter(df)
-        
-        elif choice == '5':
-            break
-        
-        else:
-            print("Invalid choice. Please try again.")
-
-
-def run_full_pipeline(rows_list, header, df):
-    """
-    Run a sample of all tasks in sequence.
-    
-    Args:
-        rows_list (list): List data for Task A
-        header (list): Header row
-        df (DataFrame): DataFrame for Tasks B and C
-    """
-    print("\n" + "="*60)
-    print("  RUNNING FULL PIPELINE (SAMPLE TASKS)")
-    print("="*60)
-    
-    # Sample Task A
-    print("\n[Running Sample Task A1]")
-    retriever_p1.task_a1_wildlife_by_city(rows_list, header, "New York")
-    
-    # Sample Task B
-    print("\n[Running Sample Task B1]")
-    analyzer_p1.task_b1_top_species_green(df, 0.3, "Spring")
-    
-    # Sample Task C
-    print("\n[Running Sample Task C1]")
-    visualizer_p1.task_c1_temp_humidity_by_city(df, "Summer")
-    
-    print("\n" + "="*60)
-    print("  FULL PIPELINE COMPLETED")
-    print("="*60)
-
-
-def main():
-    """Main entry point for the application."""
-    print("\nWelcome to Urban Wildlife Analysis System (Project 1)")
-    print("Coding Style: Procedural | Naming Convention: snake_case")
-    
-    # Initialize data (Task A0)
-    header, rows_list, file_path = loader_p1.initialize_data()
-    
-    if header is None or rows_list is None:
-        print("Failed to load data. Exiting.")
-        return
-    
-    # Load DataFrame for Tasks B and C
-    df = analyzer_p1.load_dataframe(file_path)
-    
-    if df is None:
-        print("Failed to load DataFrame. Exiting.")
-        return
-    
-    # Main menu loop
-    while True:
-        display_main_menu()
-        choice = input("Enter your choice (1-5): ").strip()
-        
-        if choice == '1':
-            run_task_a_menu(rows_list, header)
-        
-        elif choice == '2':
-            run_task_b_menu(df)
-        
-        elif choice == '3':
-            run_task_c_menu(df)
-        
-        elif choice == '4':
-            run_full_pipeline(rows_list, header, df)
-        
-        elif choice == '5':
-            print("\nThank you for using Urban Wildlife Analysis System!")
-            print("Goodbye!")
-            break
-        
-        else:
-            print("Invalid choice. Please enter a number between 1 and 5.")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Main Module for Project 1 (Procedural Style)
+Menu-driven entry point for Tasks A, B and C.
+Variable naming: snake_case
+
+Only standard-library work happens before the first prompt: pandas,
+matplotlib and the task modules are imported when a menu that needs them
+is first opened, and the dataset loads on a background thread while the
+menu is already interactive. The startup cost is tracked by
+import_budget.py.
+"""
+
+import sys
+
+
+def parse_arguments(argv):
+    """
+    Parse the command-line switches.
+    
+    Args:
+        argv (list): Command-line arguments, without the program name
+        
+    Returns:
+        Namespace: 'profile', 'profile_memory', 'cprofile', 'profile_dir'
+                   and 'follow'
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Urban Wildlife Analysis System (Project 1)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-stage timings and write a JSON summary on exit")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="With --profile, also trace peak allocations per stage (slower)")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="With --profile, also write a cProfile dump of each task")
+    parser.add_argument('--profile-dir', default="profiles",
+                        help="Directory for profile summaries and dumps (default: profiles)")
+    parser.add_argument('--follow', action='store_true',
+                        help="Pick up rows appended to the CSV before each task, without reloading")
+    return parser.parse_args(argv)
+
+
+def start_profiling(args):
+    """
+    Start recording stages and write the session summary when Python exits.
+    
+    Args:
+        args (Namespace): Parsed command-line switches
+    """
+    import atexit
+    import profiling
+    
+    profiling.enable(trace_memory=args.profile_memory,
+                     cprofile_dir=args.profile_dir if args.cprofile else None)
+    
+    def finish():
+        profiling.print_summary()
+        print(f"✓ Profile summary written to '{profiling.write_summary(args.profile_dir)}'")
+    
+    atexit.register(finish)
+
+
+def display_main_menu(status=None):
+    """
+    Display the main menu options.
+    
+    Args:
+        status (str): Dataset load status line, shown under the title
+    """
+    print("\n" + "="*60)
+    print("     URBAN WILDLIFE ANALYSIS - PROJECT 1")
+    if status:
+        print(f"     {status}")
+    print("="*60)
+    print("1. Task A - CSV Retrieval Tasks (A1-A4)")
+    print("2. Task B - Pandas Analysis Tasks (B1-B4)")
+    print("3. Task C - Visualization Tasks (C1-C4)")
+    print("4. Run Full Pipeline (All Tasks)")
+    print("5. Exit")
+    print("="*60)
+
+
+def run_task_a_menu(session):
+    """
+    Run Task A sub-menu for retrieval tasks.
+    
+    "Show Available Columns" only needs the header, so it works while the
+    dataset is still loading; the retrievals wait for it.
+    
+    Args:
+        session (dict): Load handle (see loader.start_background_load)
+    """
+    import retriever
+    
+    while True:
+        print("\n" + "-"*60)
+        print("  TASK A - CSV RETRIEVAL TASKS")
+        print("-"*60)
+        print("1. A1 - Wildlife Sightings by City")
+        print("2. A2 - Environmental Context")
+        print("3. A3 - Human Impact Indicators")
+        print("4. A4 - Custom Filter (Duration & Season)")
+        print("5. Show Available Columns")
+        print("6. Back to Main Menu")
+        print("-"*60)
+        
+        choice = input("Enter your choice (1-6): ").strip()
+        
+        if choice in ('1', '2', '3', '4'):
+            dataset = open_dataset(session)
+            if dataset is None:
+                print("Failed to load data.")
+                continue
+        
+        if choice == '1':
+            city = input("Enter city name: ").strip()
+            retriever.task_a1_wildlife_by_city(dataset, city)
+        
+        elif choice == '2':
+            time_of_day = input("Enter TimeOfDay (e.g., Morning, Afternoon, Night): ").strip()
+            try:
+                aqi_threshold = float(input("Enter maximum AQI threshold: ").strip())
+                retriever.task_a2_environmental_context(dataset, time_of_day, aqi_threshold)
+            except ValueError:
+                print("Error: Please enter a valid number for AQI threshold.")
+        
+        elif choice == '3':
+            try:
+                min_urban_dev = float(input("Enter minimum UrbanDevelopmentIndex: ").strip())
+                min_proximity = float(input("Enter minimum Proximity to Water: ").strip())
+                retriever.task_a3_human_impact(dataset, min_urban_dev, min_proximity)
+            except ValueError:
+                print("Error: Please enter valid numbers.")
+        
+        elif choice == '4':
+            try:
+                min_duration = float(input("Enter minimum sighting duration (minutes): ").strip())
+                season = input("Enter season (Spring, Summer, Fall, Winter): ").strip()
+                retriever.task_a4_custom_duration_season(dataset, min_duration, season)
+            except ValueError:
+                print("Error: Please enter a valid number for duration.")
+        
+        elif choice == '5':
+            retriever.display_available_columns(session['header'])
+        
+        elif choice == '6':
+            break
+        
+        else:
+            print("Invalid choice. Please try again.")
+
+
+def task_frame(dataset, columns):
+    """
+    Get the DataFrame a Task B/C function should run on.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        columns (list): Columns the task reads
+        
+    Returns:
+        DataFrame: The shared frame, or a frame over just these columns when
+                   the dataset is memory-mapped
+    """
+    import column_store
+    return column_store.to_frame(dataset, columns)
+
+
+def run_task_b_menu(session):
+    """
+    Run Task B sub-menu for pandas analysis tasks.
+    
+    Args:
+        session (dict): Load handle (see loader.start_background_load)
+    """
+    import analyzer
+    import schema
+    
+    while True:
+        print("\n" + "-"*60)
+        print("  TASK B - PANDAS ANALYSIS TASKS")
+        print("-"*60)
+        print("1. B1 - Top Species in Green Zones")
+        print("2. B2 - Environmental Influence by City")
+        print("3. B3 - Human-Wildlife Interaction Analysis")
+        print("4. B4 - Green Space vs Sightings (Endangered)")
+        print("5. Back to Main Menu")
+        print("-"*60)
+        
+        choice = input("Enter your choice (1-5): ").strip()
+        
+        if choice in ('1', '2', '3', '4'):
+            dataset = open_dataset(session)
+            if dataset is None:
+                print("Failed to load data.")
+                continue
+        
+        if choice == '1':
+            try:
+                green_threshold = float(input("Enter minimum green space threshold: ").strip())
+                season = input("Enter season: ").strip()
+                df = task_frame(dataset, schema.TASK_COLUMNS['B1'])
+                analyzer.task_b1_top_species_green(df, green_threshold, season)
+            except ValueError:
+                print("Error: Please enter a valid number for threshold.")
+        
+        elif choice == '2':
+            city = input("Enter city name: ").strip()
+            df = task_frame(dataset, schema.TASK_COLUMNS['B2'])
+            analyzer.task_b2_env_influence_by_city(df, city)
+        
+        elif choice == '3':
+            interaction_type = input("Enter InteractionType (e.g., Observation, Feeding, Conflict): ").strip()
+            df = task_frame(dataset, schema.TASK_COLUMNS['B3'])
+            analyzer.task_b3_interaction_analysis(df, interaction_type)
+        
+        elif choice == '4':
+            df = task_frame(dataset, schema.TASK_COLUMNS['B4'])
+            analyzer.task_b4_custom_endangered_correlation(df)
+        
+        elif choice == '5':
+            break
+        
+        else:
+            print("Invalid choice. Please try again.")
+
+
+def run_task_c_menu(session):
+    """
+    Run Task C sub-menu for visualization tasks.
+    
+    Args:
+        session (dict): Load handle (see loader.start_background_load)
+    """
+    import schema
+    import visualizer_p1
+    
+    while True:
+        print("\n" + "-"*60)
+        print("  TASK C - VISUALIZATION TASKS")
+        print("-"*60)
+        print("1. C1 - Temperature & Humidity by City")
+        print("2. C2 - SpeciesCategory Trends")
+        print("3. C3 - Public Awareness Distribution")
+        print("4. C4 - Noise vs Sightings (Endangered)")
+        print("5. Back to Main Menu")
+        print("-"*60)
+        
+        choice = input("Enter your choice (1-5): ").strip()
+        
+        if choice in ('1', '2', '3', '4'):
+            dataset = open_dataset(session)
+            if dataset is None:
+                print("Failed to load data.")
+                continue
+        
+        if choice == '1':
+            season = input("Enter season: ").strip()
+            df = task_frame(dataset, schema.TASK_COLUMNS['C1'])
+            visualizer_p1.task_c1_temp_humidity_by_city(df, season)
+        
+        elif choice == '2':
+            city = input("Enter city name: ").strip()
+            df = task_frame(dataset, schema.TASK_COLUMNS['C2'])
+            visualizer_p1.task_c2_species_trends(df, city)
+        
+        elif choice == '3':
+            city = input("Enter city name: ").strip()
+            df = task_frame(dataset, schema.TASK_COLUMNS['C3'])
+            visualizer_p1.task_c3_awareness_pie(df, city)
+        
+        elif choice == '4':
+            df = task_frame(dataset, schema.TASK_COLUMNS['C4'])
+            visualizer_p1.task_c4_custom_noise_scatter(df)
+        
+        elif choice == '5':
+            break
+        
+        else:
+            print("Invalid choice. Please try again.")
+
+
+def run_full_pipeline(dataset):
+    """
+    Run a sample of all tasks.
+    
+    The samples are independent, so they run concurrently on a process
+    pool for large datasets (see scheduler.run_tasks); reports are printed
+    in task order either way.
+    
+    Args:
+        dataset (dict): Dataset shared by Tasks A, B and C
+    """
+    import scheduler
+    
+    print("\n" + "="*60)
+    print("  RUNNING FULL PIPELINE (SAMPLE TASKS)")
+    print("="*60)
+    
+    samples = [
+        ("A1", {'city': "New York"}),
+        ("B1", {'green_threshold': 0.3, 'season': "Spring"}),
+        ("C1", {'season': "Summer"})
+    ]
+    results = scheduler.run_tasks(dataset, samples)
+    
+    for (task_id, _), result in zip(samples, results):
+        print(f"\n[Running Sample Task {task_id}]")
+        print(result['report'], end="")
+        if result['error'] is not None:
+            print(f"Error: {result['error']}")
+    
+    print("\n" + "="*60)
+    print("  FULL PIPELINE COMPLETED")
+    print("="*60)
+
+
+def open_dataset(session):
+    """
+    Get the session's dataset, waiting for the background load if needed.
+    
+    With --follow, rows appended to the CSV since the last task are added
+    to the dataset first.
+    
+    Args:
+        session (dict): Load handle (see loader.start_background_load)
+        
+    Returns:
+        dict: Loaded dataset, or None if loading failed
+    """
+    import loader
+    
+    dataset = loader.wait_for_dataset(session)
+    if dataset is not None and session.get('follow') is not None:
+        follow_new_rows(session, dataset)
+    return dataset
+
+
+def follow_new_rows(session, dataset):
+    """
+    Append the rows added to the session's CSV file since the last check.
+    
+    Following stops, with a warning, if the file was rewritten rather than
+    appended to.
+    
+    Args:
+        session (dict): Load handle with a 'follow' position (see append.poll_csv)
+        dataset (dict): Loaded dataset
+    """
+    import append
+    
+    # The loader thread may still be building indexes the append maintains
+    session['indexed'].wait()
+    try:
+        appended = append.poll_csv(dataset, session['follow'])
+    except (OSError, ValueError) as e:
+        print(f"Warning: no longer following '{session['file_path']}': {str(e)}")
+        session['follow'] = None
+        return
+    if appended:
+        print(f"✓ {appended} new records appended ({dataset['n_rows']} total)")
+
+
+def main(argv=None):
+    """
+    Main entry point for the application.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+    """
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if args.profile or args.cprofile:
+        start_profiling(args)
+    
+    print("\nWelcome to Urban Wildlife Analysis System (Project 1)")
+    print("Coding Style: Procedural | Naming Convention: snake_case")
+    
+    import loader
+    
+    file_path = loader.prompt_file_path()
+    is_valid, message = loader.validate_csv_file(file_path)
+    print(message)
+    
+    if not is_valid:
+        print("Failed to load data. Exiting.")
+        return
+    
+    # Parse (Task A0) in the background; the menu is usable at once and the
+    # dataset is shared by Tasks A, B and C once loaded
+    session = loader.start_background_load(file_path)
+    session['follow'] = {} if args.follow else None
+    
+    # Main menu loop
+    while True:
+        display_main_menu(loader.load_status(session))
+        choice = input("Enter your choice (1-5): ").strip()
+        
+        if choice == '1':
+            run_task_a_menu(session)
+        
+        elif choice == '2':
+            run_task_b_menu(session)
+        
+        elif choice == '3':
+            run_task_c_menu(session)
+        
+        elif choice == '4':
+            dataset = open_dataset(session)
+            if dataset is None:
+                print("Failed to load data.")
+                continue
+            run_full_pipeline(dataset)
+        
+        elif choice == '5':
+            # Only report the result cache if a task actually imported it
+            if 'result_cache' in sys.modules:
+                sys.modules['result_cache'].print_cache_stats()
+            print("\nThank you for using Urban Wildlife Analysis System!")
+            print("Goodbye!")
+            break
+        
+        else:
+            print("Invalid choice. Please enter a number between 1 and 5.")
+
+
+if __name__ == "__main__":
+    main()
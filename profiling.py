@@ -0,0 +1,350 @@
+"""
+Profiling Module for Project 1 (Procedural Style)
+Records wall time, CPU time, memory and rows scanned for each stage of each
+task (load, filter, aggregate, format, render), writes per-session JSON
+summaries and, on demand, cProfile dumps per task.
+Variable naming: snake_case
+
+Recording is off until enable() is called (main_p1.py --profile); while
+off, stage() and task() cost a function call and nothing else. Stages run
+inside pool workers (see scheduler.run_tasks) are not recorded.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+# Default directory for session summaries and cProfile dumps
+PROFILE_DIR = "profiles"
+
+# Recording state (see enable)
+_settings = {'enabled': False, 'trace_memory': False, 'cprofile_dir': None}
+_records = []
+_hooks = []
+_session = {'started': None, 'wall_start': None, 'cpu_start': None, 'dumps': []}
+
+# Per-thread stack of open task ids and stage records
+_local = threading.local()
+
+
+def enable(trace_memory=False, cprofile_dir=None):
+    """
+    Start recording stages for a new session.
+    
+    Args:
+        trace_memory (bool): Trace Python allocations with tracemalloc to
+                             get each stage's peak (slows allocation-heavy
+                             code noticeably)
+        cprofile_dir (str): Write a cProfile dump of each task here; None
+                            for no dumps
+    """
+    _records.clear()
+    _session.update(started=time.strftime('%Y-%m-%dT%H:%M:%S'), wall_start=time.perf_counter(),
+                    cpu_start=time.process_time(), dumps=[])
+    _settings.update(enabled=True, trace_memory=trace_memory, cprofile_dir=cprofile_dir)
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if cprofile_dir:
+        os.makedirs(cprofile_dir, exist_ok=True)
+
+
+def disable():
+    """Stop recording; recorded stages are kept until the next enable()."""
+    if _settings['trace_memory'] and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _settings.update(enabled=False, trace_memory=False, cprofile_dir=None)
+
+
+def is_enabled():
+    """
+    Check whether stages are being recorded.
+    
+    Returns:
+        bool: True between enable() and disable()
+    """
+    return _settings['enabled']
+
+
+def add_hook(hook):
+    """
+    Register a function called with each finished stage record.
+    
+    Args:
+        hook (function): Called with the record dict (see stage)
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Unregister a hook added with add_hook.
+    
+    Args:
+        hook (function): Hook to remove
+    """
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def peak_rss_kb():
+    """
+    Get the peak resident set size of this process.
+    
+    Returns:
+        int: Peak RSS in kilobytes, or None where resource is unavailable
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def input_rows(data):
+    """
+    Count the rows a task is given, for the 'rows' of a stage.
+    
+    Args:
+        data: Dataset dict, DataFrame or chunk source
+        
+    Returns:
+        int: Row count, or None for chunk sources (unknown until read)
+    """
+    if isinstance(data, dict):
+        return data.get('n_rows')
+    return len(data) if hasattr(data, '__len__') else None
+
+
+def open_stack():
+    """
+    Get this thread's stack of open task ids and stage records.
+    
+    Returns:
+        dict: 'tasks' (list of task ids) and 'stages' (list of records)
+    """
+    if not hasattr(_local, 'stack'):
+        _local.stack = {'tasks': [], 'stages': []}
+    return _local.stack
+
+
+@contextlib.contextmanager
+def stage(name, rows=None):
+    """
+    Record one stage of the current task.
+    
+    The record is yielded so code that only learns the row count later can
+    set record['rows'] itself.
+    
+    Args:
+        name (str): Stage name ('load', 'filter', 'aggregate', 'format', 'render', ...)
+        rows (int): Rows the stage scans, if known
+        
+    Yields:
+        dict: Stage record with 'task', 'stage', 'rows', 'wall_seconds',
+              'cpu_seconds', 'alloc_peak_bytes' and 'peak_rss_kb' (times and
+              memory are filled in when the stage ends)
+    """
+    stack = open_stack()
+    record = {'task': stack['tasks'][-1] if stack['tasks'] else 'session', 'stage': name, 'rows': rows,
+              'wall_seconds': None, 'cpu_seconds': None, 'alloc_peak_bytes': None, 'peak_rss_kb': None}
+    if not _settings['enabled']:
+        yield record
+        return
+    
+    tracing = _settings['trace_memory'] and tracemalloc.is_tracing()
+    if tracing:
+        # The peak is reset per stage, so carry the outer stage's peak so far
+        current, peak = tracemalloc.get_traced_memory()
+        if stack['stages']:
+            outer = stack['stages'][-1]
+            outer['_peak'] = max(outer['_peak'], peak)
+        record['_base'] = current
+        record['_peak'] = 0
+        tracemalloc.reset_peak()
+    
+    stack['stages'].append(record)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield record
+    finally:
+        record['wall_seconds'] = time.perf_counter() - wall_start
+        record['cpu_seconds'] = time.thread_time() - cpu_start
+        record['peak_rss_kb'] = peak_rss_kb()
+        stack['stages'].pop()
+        if tracing:
+            peak = max(record.pop('_peak'), tracemalloc.get_traced_memory()[1])
+            record['alloc_peak_bytes'] = peak - record.pop('_base')
+            if stack['stages']:
+                outer = stack['stages'][-1]
+                outer['_peak'] = max(outer['_peak'], peak)
+        _records.append(record)
+        for hook in _hooks:
+            hook(record)
+
+
+@contextlib.contextmanager
+def task(task_id, rows=None):
+    """
+    Attribute the stages run inside to a task, and time the whole task.
+    
+    The task itself is recorded as its 'total' stage. When cProfile dumps
+    are enabled, the outermost task on the thread is profiled and written
+    to '<cprofile_dir>/<task_id>_<n>.prof' (readable with pstats or
+    snakeviz).
+    
+    Args:
+        task_id (str): Task id (e.g. "A1", or "load")
+        rows (int): Rows the task is given, if known
+    """
+    stack = open_stack()
+    if not _settings['enabled']:
+        yield
+        return
+    
+    profiler = None
+    if _settings['cprofile_dir'] and not stack['tasks']:
+        import cProfile
+        profiler = cProfile.Profile()
+    
+    stack['tasks'].append(task_id)
+    try:
+        with stage('total', rows):
+            if profiler is not None:
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # Python 3.12+ allows one active profiler per process
+                    profiler = None
+            try:
+                yield
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+    finally:
+        stack['tasks'].pop()
+        if profiler is not None:
+            dump_path = os.path.join(_settings['cprofile_dir'], f"{task_id}_{len(_session['dumps']) + 1}.prof")
+            profiler.dump_stats(dump_path)
+            _session['dumps'].append(dump_path)
+
+
+def profiled(task_id):
+    """
+    Decorate a task function so each call runs inside task(task_id).
+    
+    The task's first argument (its dataset or frame) gives the row count.
+    
+    Args:
+        task_id (str): Task id (e.g. "A1")
+        
+    Returns:
+        function: Decorator
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(data, *args, **kwargs):
+            with task(task_id, input_rows(data)):
+                return function(data, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def stage_records():
+    """
+    Get the stages recorded this session.
+    
+    Returns:
+        list: Stage records in completion order (see stage)
+    """
+    return list(_records)
+
+
+def summarize(records=None):
+    """
+    Total the recorded stages per task and stage.
+    
+    Args:
+        records (list): Stage records (defaults to this session's)
+        
+    Returns:
+        list: One dict per (task, stage) with 'task', 'stage', 'calls',
+              'wall_seconds', 'cpu_seconds', 'rows' (summed) and
+              'alloc_peak_bytes' (largest), in first-seen order
+    """
+    totals = {}
+    for record in _records if records is None else records:
+        key = (record['task'], record['stage'])
+        if key not in totals:
+            totals[key] = {'task': record['task'], 'stage': record['stage'], 'calls': 0,
+                           'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows': 0, 'alloc_peak_bytes': None}
+        total = totals[key]
+        total['calls'] += 1
+        total['wall_seconds'] += record['wall_seconds']
+        total['cpu_seconds'] += record['cpu_seconds']
+        total['rows'] += record['rows'] or 0
+        if record['alloc_peak_bytes'] is not None:
+            total['alloc_peak_bytes'] = max(total['alloc_peak_bytes'] or 0, record['alloc_peak_bytes'])
+    return list(totals.values())
+
+
+def session_summary():
+    """
+    Build the JSON-ready summary of this session.
+    
+    Returns:
+        dict: 'started', 'wall_seconds', 'cpu_seconds', 'peak_rss_kb',
+              'trace_memory', 'totals' (see summarize), 'stages' (see
+              stage_records) and 'cprofile_dumps'
+    """
+    return {
+        'started': _session['started'],
+        'wall_seconds': time.perf_counter() - _session['wall_start'] if _session['wall_start'] else 0.0,
+        'cpu_seconds': time.process_time() - _session['cpu_start'] if _session['cpu_start'] else 0.0,
+        'peak_rss_kb': peak_rss_kb(),
+        'trace_memory': _settings['trace_memory'],
+        'totals': summarize(),
+        'stages': stage_records(),
+        'cprofile_dumps': list(_session['dumps'])
+    }
+
+
+def write_summary(directory=None):
+    """
+    Write the session summary as JSON.
+    
+    Args:
+        directory (str): Output directory (defaults to PROFILE_DIR)
+        
+    Returns:
+        str: Path written ('<directory>/session_<time>.json')
+    """
+    directory = directory or PROFILE_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"session_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(session_summary(), file, indent=2)
+    return path
+
+
+def print_summary():
+    """Print the per-task, per-stage totals of this session."""
+    print(f"\n{'task':<8} {'stage':<10} {'calls':>5} {'wall s':>9} {'cpu s':>9} {'rows':>11} {'peak MB':>8}")
+    for total in summarize():
+        peak = f"{total['alloc_peak_bytes'] / 1e6:8.1f}" if total['alloc_peak_bytes'] is not None else f"{'-':>8}"
+        print(f"{total['task']:<8} {total['stage']:<10} {total['calls']:>5} {total['wall_seconds']:9.4f} "
+              f"{total['cpu_seconds']:9.4f} {total['rows']:>11} {peak}")
+    rss = peak_rss_kb()
+    if rss is not None:
+        print(f"Peak RSS: {rss / 1024:.1f} MB")
@@ -0,0 +1,260 @@
+"""
+Query Engine Module for Project 1 (Procedural Style)
+Compiles declarative filter specs such as ("AirQualityIndex", "<", 100)
+into vectorized NumPy mask operations over the columnar store.
+Variable naming: snake_case
+"""
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+import column_store
+
+
+# Comparison operators supported on numeric columns
+NUMERIC_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+
+# Operators supported on categorical columns (case-insensitive)
+CATEGORICAL_OPERATORS = ("==", "!=", "in")
+
+
+def missing_columns(dataset, filters):
+    """
+    List the filter columns that are not present in the dataset.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        filters (list): List of (column, op, value) tuples
+        
+    Returns:
+        list: Names of missing columns
+    """
+    return [column_name for column_name, _, _ in filters if column_name not in dataset['columns']]
+
+
+def bind_filters(filter_spec, params):
+    """
+    Substitute parameter names in a filter spec with their values.
+    
+    A spec value written as "$name" is replaced with params["name"], so a
+    retrieval task can be declared once and run with different inputs.
+    
+    Args:
+        filter_spec (list): List of (column, op, value) tuples
+        params (dict): Parameter values by name
+        
+    Returns:
+        list: Bound (column, op, value) tuples
+    """
+    filters = []
+    for column_name, op, value in filter_spec:
+        if isinstance(value, str) and value.startswith("$"):
+            value = params[value[1:]]
+        filters.append((column_name, op, value))
+    return filters
+
+
+def compile_predicate(dataset, column_name, op, value):
+    """
+    Compile a single filter into a function returning a boolean row mask.
+    
+    Column lookup, code matching and operator dispatch happen once here;
+    the returned function only performs the vectorized comparison, either
+    over all rows or over a subset of candidate row positions.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        column_name (str): Column to filter
+        op (str): Comparison operator
+        value: Value (or list of values for "in") to compare against
+        
+    Returns:
+        function: predicate(row_ids=None) returning an ndarray of bools
+        
+    Raises:
+        ValueError: If the operator is not supported for the column type
+    """
+    values = dataset['columns'][column_name]
+    valid = column_store.valid_mask(dataset, column_name)
+    
+    if column_store.is_categorical(dataset, column_name):
+        if op not in CATEGORICAL_OPERATORS:
+            raise ValueError(f"Operator '{op}' not supported on categorical column '{column_name}'.")
+        
+        codes = []
+        for item in filter_values(op, value):
+            codes.extend(column_store.match_codes(dataset, column_name, item))
+        negate = op == "!="
+        
+        def predicate(row_ids=None):
+            column = values if row_ids is None else values[row_ids]
+            matched = np.isin(column, codes)
+            if negate:
+                column_valid = valid if row_ids is None else valid[row_ids]
+                return column_valid & ~matched
+            return matched
+        
+        return predicate
+    
+    if op not in NUMERIC_OPERATORS:
+        raise ValueError(f"Operator '{op}' not supported on numeric column '{column_name}'.")
+    
+    compare = NUMERIC_OPERATORS[op]
+    
+    def predicate(row_ids=None):
+        if row_ids is None:
+            return valid & compare(values, value)
+        return valid[row_ids] & compare(values[row_ids], value)
+    
+    return predicate
+
+
+def filter_values(op, value):
+    """
+    List the values an equality-style filter matches.
+    
+    Args:
+        op (str): Comparison operator
+        value: Filter value (a list for "in")
+        
+    Returns:
+        list: Values to match
+    """
+    return list(value) if op == "in" else [value]
+
+
+def compile_query(dataset, filters):
+    """
+    Compile a conjunction of filters.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        filters (list): List of (column, op, value) tuples, combined with AND
+        
+    Returns:
+        list: Compiled predicate functions
+    """
+    return [compile_predicate(dataset, column_name, op, value) for column_name, op, value in filters]
+
+
+def plan_query(dataset, filters):
+    """
+    Choose the most selective index access path for a query.
+    
+    Indexed equality filters are sized from their row-id lists and range
+    filters from a binary search over their sorted index. The planner starts
+    from whichever is smallest: a range slice, a single row-id list, or the
+    bitmap AND of several indexed equality filters.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        filters (list): List of (column, op, value) tuples
+        
+    Returns:
+        tuple: (sorted candidate row positions or None if no filter is
+                indexed, list of filters still to evaluate)
+    """
+    equality = []
+    best_range = None
+    for position, (column_name, op, value) in enumerate(filters):
+        if op in ("==", "in") and column_store.equality_index(dataset, column_name) is not None:
+            rows = column_store.index_rows(dataset, column_name, filter_values(op, value))
+            equality.append((position, column_name, filter_values(op, value), rows))
+        elif not column_store.is_categorical(dataset, column_name) and column_name in dataset['columns']:
+            bounds = column_store.range_bounds(dataset, column_name, op, value)
+            if bounds is not None:
+                size = sum(max(stop - start, 0) for _, start, stop in bounds)
+                if best_range is None or size < best_range[1]:
+                    best_range = (position, size, bounds)
+    
+    smallest_equality = min((len(rows) for _, _, _, rows in equality), default=None)
+    
+    if best_range is not None and (smallest_equality is None or best_range[1] < smallest_equality):
+        position, _, bounds = best_range
+        remaining = [f for i, f in enumerate(filters) if i != position]
+        rows = [run['rows'][start:stop] for run, start, stop in bounds]
+        return np.sort(rows[0] if len(rows) == 1 else np.concatenate(rows)), remaining
+    
+    if not equality:
+        return None, list(filters)
+    
+    used = {position for position, _, _, _ in equality}
+    remaining = [f for i, f in enumerate(filters) if i not in used]
+    
+    if len(equality) == 1:
+        return equality[0][3], remaining
+    
+    bitmap = None
+    for _, column_name, values, _ in equality:
+        column_bitmap = column_store.index_bitmap(dataset, column_name, values)
+        bitmap = column_bitmap if bitmap is None else bitmap & column_bitmap
+    return column_store.bitmap_to_rows(bitmap, dataset['n_rows']), remaining
+
+
+def run_query(dataset, filters):
+    """
+    Evaluate a conjunction of filters and return the matching row positions.
+    
+    The planner narrows the candidate rows through an index first; the
+    remaining filters are then evaluated only over those candidates.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        filters (list): List of (column, op, value) tuples, combined with AND
+        
+    Returns:
+        ndarray: Sorted row positions that satisfy every filter
+    """
+    candidates, remaining = plan_query(dataset, filters)
+    
+    if candidates is None:
+        mask = np.ones(dataset['n_rows'], dtype=bool)
+        for predicate in compile_query(dataset, remaining):
+            mask &= predicate()
+        return np.flatnonzero(mask)
+    
+    for predicate in compile_query(dataset, remaining):
+        if len(candidates) == 0:
+            break
+        candidates = candidates[predicate(candidates)]
+    return candidates
+
+
+def select_frame_rows(frame, filters):
+    """
+    Row positions of a frame matching a conjunction of filters.
+    
+    Frames built by column_store.build_store are answered through the store's
+    indexes; any other frame falls back to a vectorized pandas evaluation.
+    
+    Args:
+        frame (DataFrame): Wildlife data
+        filters (list): List of (column, op, value) tuples, combined with AND
+        
+    Returns:
+        ndarray: Sorted row positions, suitable for frame.iloc
+    """
+    store = column_store.frame_store(frame)
+    if store is not None:
+        return run_query(store, filters)
+    
+    mask = np.ones(len(frame), dtype=bool)
+    for column_name, op, value in filters:
+        series = frame[column_name]
+        if op in NUMERIC_OPERATORS and pd.api.types.is_numeric_dtype(series):
+            mask &= NUMERIC_OPERATORS[op](series.to_numpy(), value)
+            continue
+        
+        normalized = series.astype(str).str.strip().str.lower().to_numpy()
+        matched = np.isin(normalized, [column_store.normalize_label(item) for item in filter_values(op, value)])
+        mask &= ~matched if op == "!=" else matched
+    return np.flatnonzero(mask)
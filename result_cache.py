@@ -0,0 +1,202 @@
+"""
+Result Cache Module for Project 1 (Procedural Style)
+Memoizes Task A/B/C computations in a bounded LRU keyed on the task, its
+normalized parameters and the dataset fingerprint.
+Variable naming: snake_case
+"""
+
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import column_store
+
+
+# Most results kept before the least recently used one is evicted
+MAX_ENTRIES = 256
+
+# Results with more rows than this are recomputed rather than kept
+MAX_RESULT_ROWS = 100_000
+
+# (task_id, params, version) -> result, least recently used first
+_results = OrderedDict()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def normalize_param(value):
+    """
+    Normalize a task parameter for use in a cache key.
+    
+    Strings are matched case-insensitively by every task, so they are
+    case-folded. Numbers are keyed on their exact float value: tasks compare
+    against the raw threshold, so even nearby thresholds (60.0 and
+    60.0000001) can select different rows and must not share an entry.
+    
+    Args:
+        value: Parameter value
+        
+    Returns:
+        Hashable normalized value
+    """
+    if isinstance(value, str):
+        return column_store.normalize_label(value)
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_)):
+        return float(value)
+    return value
+
+
+def dataset_version(source):
+    """
+    Get the fingerprint identifying the data behind a task input.
+    
+    Args:
+        source: Dataset dict, or a frame built by column_store.build_store
+        
+    Returns:
+        tuple: (size, mtime_ns, hash) of the source file, or None when the
+               input has no fingerprint (plain frames, chunk streams)
+    """
+    if isinstance(source, pd.DataFrame):
+        source = column_store.frame_store(source)
+    if not isinstance(source, dict) or not source.get('fingerprint'):
+        return None
+    fingerprint = source['fingerprint']
+    return (fingerprint['size'], fingerprint['mtime_ns'], fingerprint['hash'])
+
+
+def make_key(task_id, params, version):
+    """
+    Build the cache key of a task invocation.
+    
+    Args:
+        task_id (str): Task id (e.g. "A1", "B2")
+        params (dict): Task parameters
+        version (tuple): Dataset version (see dataset_version)
+        
+    Returns:
+        tuple: Hashable key
+    """
+    normalized = tuple(sorted((name, normalize_param(value)) for name, value in params.items()))
+    return (task_id, normalized, version)
+
+
+def result_rows(result):
+    """
+    Count the rows held by a result, to keep large ones out of the cache.
+    
+    Args:
+        result: Task result (list, array, DataFrame, Series, dict of these, or None)
+        
+    Returns:
+        int: Number of rows
+    """
+    if isinstance(result, dict):
+        return sum(result_rows(value) for value in result.values())
+    if isinstance(result, (list, np.ndarray, pd.DataFrame, pd.Series)):
+        return len(result)
+    return 0
+
+
+def cached(source, task_id, params, compute):
+    """
+    Return a memoized task result, computing it on a miss.
+    
+    Keys include the source file's fingerprint, so results are invalidated
+    automatically when the file changes and is reloaded.
+    
+    Args:
+        source: Task input the result depends on (see dataset_version)
+        task_id (str): Task id (e.g. "A1", "B2")
+        params (dict): Task parameters
+        compute (function): Zero-argument function computing the result
+        
+    Returns:
+        Task result
+    """
+    version = dataset_version(source)
+    if version is None:
+        return compute()
+    
+    key = make_key(task_id, params, version)
+    if key in _results:
+        _stats['hits'] += 1
+        _results.move_to_end(key)
+        return _results[key]
+    
+    _stats['misses'] += 1
+    result = compute()
+    if result_rows(result) <= MAX_RESULT_ROWS:
+        _results[key] = result
+        while len(_results) > MAX_ENTRIES:
+            _results.popitem(last=False)
+            _stats['evictions'] += 1
+    return result
+
+
+def clear_results():
+    """Drop every cached result and reset the statistics."""
+    _results.clear()
+    for name in _stats:
+        _stats[name] = 0
+
+
+def cache_stats():
+    """
+    Get result cache statistics.
+    
+    Returns:
+        dict: 'hits', 'misses', 'evictions', 'entries' and 'hit_rate'
+    """
+    lookups = _stats['hits'] + _stats['misses']
+    return dict(_stats, entries=len(_results), hit_rate=_stats['hits'] / lookups if lookups else 0.0)
+
+
+def print_cache_stats():
+    """Print result cache statistics."""
+    stats = cache_stats()
+    print(f"Result cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries, {stats['evictions']} evictions")
+
+
+def save_results(path):
+    """
+    Persist the cached results to disk.
+    
+    Args:
+        path (str): File to write (replaced atomically)
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as file:
+        pickle.dump(list(_results.items()), file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def load_results(path, version=None):
+    """
+    Load results persisted by save_results.
+    
+    Args:
+        path (str): File written by save_results
+        version (tuple): Keep only entries for this dataset version (see
+                         dataset_version); None keeps all of them
+        
+    Returns:
+        int: Number of entries loaded (0 if the file is missing or unreadable)
+    """
+    try:
+        with open(path, 'rb') as file:
+            entries = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return 0
+    
+    loaded = 0
+    for key, result in entries:
+        if version is None or key[2] == version:
+            _results[key] = result
+            loaded += 1
+    while len(_results) > MAX_ENTRIES:
+        _results.popitem(last=False)
+    return loaded
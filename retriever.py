@@ -1,235 +1,270 @@
-
-
-from tabulate import tabulate
-
-
-def find_column_index(header, column_name):
-    """
-    Find the index of a column by its name.
-    
-    Args:
-        header (list): Header row from CSV
-        column_name (str): Name of the column to find
-        
-    Returns:
-        int: Index of the column, or -1 if not found
-    """
-    try:
-        return header.index(column_name)
-    except ValueError:
-        return -1
-
-
-def task_a1_wildlife_by_city(rows_list, header, city):
-    """
-    Task A1: Retrieve wildlife sighting details for a specified city.
-    Displays: WildlifeSpecies, SpeciesCategory, NumberOfSightings, IsEndangeredSpecies
-    
-    Args:
-        rows_list (list): List of data rows from CSV
-        header (list): Header row
-        city (str): City name to filter by
-    """
-    print(f"\n=== Task A1: Wildlife Sightings in {city} ===")
-    
-    # Find column indices
-    city_idx = find_column_index(header, "City")
-    species_idx = find_column_index(header, "WildlifeSpecies")
-    category_idx = find_column_index(header, "SpeciesCategory")
-    sightings_idx = find_column_index(header, "NumberOfSightings")
-    endangered_idx = find_column_index(header, "IsEndangeredSpecies")
-    
-    if city_idx == -1:
-        print("Error: Column 'City' not found.")
-        return
-    
-    # Filter rows by city
-    results = []
-    for row in rows_list:
-        if len(row) > city_idx and row[city_idx].strip().lower() == city.strip().lower():
-            results.append([
-                row[species_idx] if species_idx >= 0 else "N/A",
-                row[category_idx] if category_idx >= 0 else "N/A",
-                row[sightings_idx] if sightings_idx >= 0 else "N/A",
-                row[endangered_idx] if endangered_idx >= 0 else "N/A"
-            ])
-    
-    # Display results
-    if results:
-        print(tabulate(results, 
-                      headers=["WildlifeSpecies", "SpeciesCategory", "NumberOfSightings", "IsEndangeredSpecies"],
-                      tablefmt="grid"))
-        print(f"\nTotal records found: {len(results)}")
-    else:
-        print(f"No wildlife sightings found for city '{city}'.")
-
-
-def task_a2_environmental_context(rows_list, header, time_of_day, aqi_threshold):
-    """
-    Task A2: Retrieve environmental context based on TimeOfDay and AQI threshold.
-    Displays: Temperature, Humidity, AirQualityIndex, WeatherCondition
-    
-    Args:
-        rows_list (list): List of data rows
-        header (list): Header row
-        time_of_day (str): TimeOfDay to filter (e.g., 'Morning', 'Night')
-        aqi_threshold (float): Maximum AQI value
-    """
-    print(f"\n=== Task A2: Environmental Context ({time_of_day}, AQI < {aqi_threshold}) ===")
-    
-    # Find column indices
-    time_idx = find_column_index(header, "TimeOfDay")
-    aqi_idx = find_column_index(header, "AirQualityIndex")
-    temp_idx = find_column_index(header, "Temperature")
-    humidity_idx = find_column_index(header, "Humidity")
-    weather_idx = find_column_index(header, "WeatherCondition")
-    
-    if time_idx == -1 or aqi_idx == -1:
-        print("Error: Required columns not found.")
-        return
-    
-    # Filter rows
-    results = []
-    for row in rows_list:
-        if len(row) > max(time_idx, aqi_idx):
-            try:
-                row_time = row[time_idx].strip()
-                row_aqi = float(row[aqi_idx])
-                
-                if row_time.lower() == time_of_day.strip().lower() and row_aqi < aqi_threshold:
-                    results.append([
-                        row[temp_idx] if temp_idx >= 0 else "N/A",
-                        row[humidity_idx] if humidity_idx >= 0 else "N/A",
-                        row[aqi_idx],
-                        row[weather_idx] if weather_idx >= 0 else "N/A"
-                    ])
-            except (ValueError, IndexError):
-                continue
-    
-    # Display results
-    if results:
-        print(tabulate(results,
-                      headers=["Temperature", "Humidity", "AirQualityIndex", "WeatherCondition"],
-                      tablefmt="grid"))
-        print(f"\nTotal records found: {len(results)}")
-    else:
-        print(f"No records found matching criteria.")
-
-
-def task_a3_human_impact(rows_list, header, min_urban_dev_index, min_proximity_to_water):
-    """
-    Task A3: Retrieve human impact indicators based on thresholds.
-    Displays: HumanActivityLevel, NoiseLevel_dB, LightPollutionLevel, GarbageManagementScore
-    
-    Args:
-        rows_list (list): List of data rows
-        header (list): Header row
-        min_urban_dev_index (float): Minimum UrbanDevelopmentIndex
-        min_proximity_to_water (float): Minimum ProximityToWaterSource
-    """
-    print(f"\n=== Task A3: Human Impact Indicators ===")
-    print(f"Filters: Urban Dev Index >= {min_urban_dev_index}, Proximity to Water >= {min_proximity_to_water}")
-    
-    # Find column indices
-    urban_dev_idx = find_column_index(header, "UrbanDevelopmentIndex")
-    proximity_idx = find_column_index(header, "ProximityToWaterSource")
-    activity_idx = find_column_index(header, "HumanActivityLevel")
-    noise_idx = find_column_index(header, "NoiseLevel_dB")
-    light_idx = find_column_index(header, "LightPollutionLevel")
-    garbage_idx = find_column_index(header, "GarbageManagementScore")
-    
-    if urban_dev_idx == -1 or proximity_idx == -1:
-        print("Error: Required columns not found.")
-        return
-    
-    # Filter rows
-    results = []
-    for row in rows_list:
-        if len(row) > max(urban_dev_idx, proximity_idx):
-            try:
-                urban_dev = float(row[urban_dev_idx])
-                proximity = float(row[proximity_idx])
-                
-                if urban_dev >= min_urban_dev_index and proximity >= min_proximity_to_water:
-                    results.append([
-                        row[activity_idx] if activity_idx >= 0 else "N/A",
-                        row[noise_idx] if noise_idx >= 0 else "N/A",
-                        row[light_idx] if light_idx >= 0 else "N/A",
-                        row[garbage_idx] if garbage_idx >= 0 else "N/A"
-                    ])
-            except (ValueError, IndexError):
-                continue
-    
-    # Display results
-    if results:
-        print(tabulate(results,
-                      headers=["HumanActivityLevel", "NoiseLevel_dB", "LightPollutionLevel", "GarbageManagementScore"],
-                      tablefmt="grid"))
-        print(f"\nTotal records found: {len(results)}")
-    else:
-        print(f"No records found matching criteria.")
-
-
-def task_a4_custom_duration_season(rows_list, header, min_duration, season):
-    """
-    Task A4 (Custom): Retrieve species sightings filtered by sighting duration and season.
-    Displays: Species, NumberOfSightings, Sighting Duration, Season
-    
-    This custom task is unique to Project 1.
-    
-    Args:
-        rows_list (list): List of data rows
-        header (list): Header row
-        min_duration (float): Minimum sighting duration in minutes
-        season (str): Season to filter by
-    """
-    print(f"\n=== Task A4: Custom Filter (Duration > {min_duration} min, Season = {season}) ===")
-    
-    # Find column indices
-    species_idx = find_column_index(header, "WildlifeSpecies")
-    sightings_idx = find_column_index(header, "NumberOfSightings")
-    duration_idx = find_column_index(header, "SightingDuration_Min")
-    season_idx = find_column_index(header, "Season")
-    
-    if duration_idx == -1 or season_idx == -1:
-        print("Error: Required columns not found.")
-        return
-    
-    # Filter rows
-    results = []
-    for row in rows_list:
-        if len(row) > max(duration_idx, season_idx):
-            try:
-                duration = float(row[duration_idx])
-                row_season = row[season_idx].strip()
-                
-                if duration > min_duration and row_season.lower() == season.strip().lower():
-                    results.append([
-                        row[species_idx] if species_idx >= 0 else "N/A",
-                        row[sightings_idx] if sightings_idx >= 0 else "N/A",
-                        row[duration_idx],
-                        row[season_idx]
-                    ])
-            except (ValueError, IndexError):
-                continue
-    
-    # Display results
-    if results:
-        print(tabulate(results,
-                      headers=["WildlifeSpecies", "NumberOfSightings", "SightingDuration_Min", "Season"],
-                      tablefmt="grid"))
-        print(f"\nTotal records found: {len(results)}")
-    else:
-        print(f"No records found matching criteria.")
-
-
-def display_available_columns(header):
-    """
-    Display all available column names for reference.
-    
-    Args:
-        header (list): Header row from CSV
-    """
-    print("\n=== Available Columns ===")
-    for i, col in enumerate(header, 1):
-        print(f"{i}. {col}")
+
+
+from tabulate import tabulate
+
+import column_store
+import profiling
+import query
+import result_cache
+
+
+# Declarative retrieval tasks: filters use "$name" placeholders bound at run time
+RETRIEVAL_TASKS = {
+    "A1": {
+        'filters': [("City", "==", "$city")],
+        'columns': ["WildlifeSpecies", "SpeciesCategory", "NumberOfSightings", "IsEndangeredSpecies"]
+    },
+    "A2": {
+        'filters': [("TimeOfDay", "==", "$time_of_day"), ("AirQualityIndex", "<", "$aqi_threshold")],
+        'columns': ["Temperature", "Humidity", "AirQualityIndex", "WeatherCondition"]
+    },
+    "A3": {
+        'filters': [("UrbanDevelopmentIndex", ">=", "$min_urban_dev_index"),
+                    ("ProximityToWaterSource", ">=", "$min_proximity_to_water")],
+        'columns': ["HumanActivityLevel", "NoiseLevel_dB", "LightPollutionLevel", "GarbageManagementScore"]
+    },
+    "A4": {
+        'filters': [("SightingDuration_Min", ">", "$min_duration"), ("Season", "==", "$season")],
+        'columns': ["WildlifeSpecies", "NumberOfSightings", "SightingDuration_Min", "Season"]
+    }
+}
+
+# Matches printed in the terminal; the rest are only counted
+DISPLAY_LIMIT = 20
+
+
+def find_column_index(header, column_name):
+    """
+    Find the index of a column by its name.
+    
+    Args:
+        header (list): Header row from CSV
+        column_name (str): Name of the column to find
+        
+    Returns:
+        int: Index of the column, or -1 if not found
+    """
+    try:
+        return header.index(column_name)
+    except ValueError:
+        return -1
+
+
+def collect_rows(dataset, row_ids, column_names):
+    """
+    Build display rows for the selected row positions.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        row_ids (ndarray): Matching row positions
+        column_names (list): Columns to include, in display order
+        
+    Returns:
+        list: List of rows; missing columns are shown as "N/A"
+    """
+    columns = []
+    for column_name in column_names:
+        values = column_store.column_values(dataset, column_name, row_ids)
+        columns.append(values if values is not None else ["N/A"] * len(row_ids))
+    return [list(row) for row in zip(*columns)]
+
+
+def retrieve(dataset, task_id, **params):
+    """
+    Run a declared retrieval task against the columnar store.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        task_id (str): Key of RETRIEVAL_TASKS (e.g. "A1")
+        **params: Values for the task's "$name" placeholders
+        
+    Returns:
+        list: Display rows for the matching records, or None if a filter
+              column is missing from the dataset
+    """
+    row_ids = retrieve_ids(dataset, task_id, **params)
+    if row_ids is None:
+        return None
+    with profiling.stage('collect', len(row_ids)):
+        return collect_rows(dataset, row_ids, RETRIEVAL_TASKS[task_id]['columns'])
+
+
+def retrieve_ids(dataset, task_id, **params):
+    """
+    Find the rows matched by a declared retrieval task.
+    
+    Only row positions are computed (and cached); values are decoded when
+    the rows are shown or exported.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        task_id (str): Key of RETRIEVAL_TASKS (e.g. "A1")
+        **params: Values for the task's "$name" placeholders
+        
+    Returns:
+        ndarray: Matching row positions, or None if a filter column is
+                 missing from the dataset
+    """
+    return result_cache.cached(dataset, task_id, params, lambda: run_retrieval(dataset, task_id, params))
+
+
+def run_retrieval(dataset, task_id, params):
+    """
+    Run a declared retrieval task without the result cache.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        task_id (str): Key of RETRIEVAL_TASKS (e.g. "A1")
+        params (dict): Values for the task's "$name" placeholders
+        
+    Returns:
+        ndarray: See retrieve_ids
+    """
+    spec = RETRIEVAL_TASKS[task_id]
+    filters = query.bind_filters(spec['filters'], params)
+    
+    if query.missing_columns(dataset, filters):
+        return None
+    
+    with profiling.stage('filter', dataset['n_rows']):
+        return query.run_query(dataset, filters)
+
+
+def print_results(dataset, task_id, row_ids):
+    """
+    Print the first DISPLAY_LIMIT matches as a grid table, then the total.
+    
+    Only the rows shown are decoded and formatted; the full result can be
+    written to a file with export.py.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        task_id (str): Key of RETRIEVAL_TASKS
+        row_ids (ndarray): Matching row positions from retrieve_ids
+    """
+    headers = RETRIEVAL_TASKS[task_id]['columns']
+    shown = row_ids[:DISPLAY_LIMIT]
+    with profiling.stage('format', len(shown)):
+        print(tabulate(collect_rows(dataset, shown, headers), headers=headers, tablefmt="grid"))
+    if len(row_ids) > len(shown):
+        print(f"... {len(row_ids) - len(shown)} more records not shown (use export.py to write them all to a file)")
+    print(f"\nTotal records found: {len(row_ids)}")
+
+
+@profiling.profiled("A1")
+def task_a1_wildlife_by_city(dataset, city):
+    """
+    Task A1: Retrieve wildlife sighting details for a specified city.
+    Displays: WildlifeSpecies, SpeciesCategory, NumberOfSightings, IsEndangeredSpecies
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        city (str): City name to filter by
+    """
+    print(f"\n=== Task A1: Wildlife Sightings in {city} ===")
+    
+    row_ids = retrieve_ids(dataset, "A1", city=city)
+    
+    if row_ids is None:
+        print("Error: Column 'City' not found.")
+        return
+    
+    # Display results
+    if len(row_ids):
+        print_results(dataset, "A1", row_ids)
+    else:
+        print(f"No wildlife sightings found for city '{city}'.")
+
+
+@profiling.profiled("A2")
+def task_a2_environmental_context(dataset, time_of_day, aqi_threshold):
+    """
+    Task A2: Retrieve environmental context based on TimeOfDay and AQI threshold.
+    Displays: Temperature, Humidity, AirQualityIndex, WeatherCondition
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        time_of_day (str): TimeOfDay to filter (e.g., 'Morning', 'Night')
+        aqi_threshold (float): Maximum AQI value
+    """
+    print(f"\n=== Task A2: Environmental Context ({time_of_day}, AQI < {aqi_threshold}) ===")
+    
+    row_ids = retrieve_ids(dataset, "A2", time_of_day=time_of_day, aqi_threshold=aqi_threshold)
+    
+    if row_ids is None:
+        print("Error: Required columns not found.")
+        return
+    
+    # Display results
+    if len(row_ids):
+        print_results(dataset, "A2", row_ids)
+    else:
+        print(f"No records found matching criteria.")
+
+
+@profiling.profiled("A3")
+def task_a3_human_impact(dataset, min_urban_dev_index, min_proximity_to_water):
+    """
+    Task A3: Retrieve human impact indicators based on thresholds.
+    Displays: HumanActivityLevel, NoiseLevel_dB, LightPollutionLevel, GarbageManagementScore
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        min_urban_dev_index (float): Minimum UrbanDevelopmentIndex
+        min_proximity_to_water (float): Minimum ProximityToWaterSource
+    """
+    print(f"\n=== Task A3: Human Impact Indicators ===")
+    print(f"Filters: Urban Dev Index >= {min_urban_dev_index}, Proximity to Water >= {min_proximity_to_water}")
+    
+    row_ids = retrieve_ids(dataset, "A3", min_urban_dev_index=min_urban_dev_index,
+                           min_proximity_to_water=min_proximity_to_water)
+    
+    if row_ids is None:
+        print("Error: Required columns not found.")
+        return
+    
+    # Display results
+    if len(row_ids):
+        print_results(dataset, "A3", row_ids)
+    else:
+        print(f"No records found matching criteria.")
+
+
+@profiling.profiled("A4")
+def task_a4_custom_duration_season(dataset, min_duration, season):
+    """
+    Task A4 (Custom): Retrieve species sightings filtered by sighting duration and season.
+    Displays: Species, NumberOfSightings, Sighting Duration, Season
+    
+    This custom task is unique to Project 1.
+    
+    Args:
+        dataset (dict): Dataset returned by loader.load_dataset
+        min_duration (float): Minimum sighting duration in minutes
+        season (str): Season to filter by
+    """
+    print(f"\n=== Task A4: Custom Filter (Duration > {min_duration} min, Season = {season}) ===")
+    
+    row_ids = retrieve_ids(dataset, "A4", min_duration=min_duration, season=season)
+    
+    if row_ids is None:
+        print("Error: Required columns not found.")
+        return
+    
+    # Display results
+    if len(row_ids):
+        print_results(dataset, "A4", row_ids)
+    else:
+        print(f"No records found matching criteria.")
+
+
+def display_available_columns(header):
+    """
+    Display all available column names for reference.
+    
+    Args:
+        header (list): Header row from CSV
+    """
+    print("\n=== Available Columns ===")
+    for i, col in enumerate(header, 1):
+        print(f"{i}. {col}")
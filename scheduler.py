@@ -0,0 +1,203 @@
+"""
+Scheduler Module for Project 1 (Procedural Style)
+Runs independent Task A/B/C invocations concurrently on a process pool.
+Workers open the dataset's binary column cache memory-mapped, so the data
+is shared read-only through the page cache instead of being pickled to
+each worker, and reports are returned in submission order.
+Variable naming: snake_case
+"""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import analyzer
+import column_store
+import dataset_cache
+import loader
+import retriever
+import schema
+import visualizer_p1
+
+
+# Task id -> (function, [(parameter name, type)]) in call order
+TASKS = {
+    'A1': (retriever.task_a1_wildlife_by_city, [('city', str)]),
+    'A2': (retriever.task_a2_environmental_context, [('time_of_day', str), ('aqi_threshold', float)]),
+    'A3': (retriever.task_a3_human_impact, [('min_urban_dev_index', float), ('min_proximity_to_water', float)]),
+    'A4': (retriever.task_a4_custom_duration_season, [('min_duration', float), ('season', str)]),
+    'B1': (analyzer.task_b1_top_species_green, [('green_threshold', float), ('season', str)]),
+    'B2': (analyzer.task_b2_env_influence_by_city, [('city', str)]),
+    'B3': (analyzer.task_b3_interaction_analysis, [('interaction_type', str)]),
+    'B4': (analyzer.task_b4_custom_endangered_correlation, []),
+    'C1': (visualizer_p1.task_c1_temp_humidity_by_city, [('season', str)]),
+    'C2': (visualizer_p1.task_c2_species_trends, [('city', str)]),
+    'C3': (visualizer_p1.task_c3_awareness_pie, [('city', str)]),
+    'C4': (visualizer_p1.task_c4_custom_noise_scatter, [])
+}
+
+# Datasets smaller than this run in-process; a pool would cost more than it saves
+PARALLEL_MIN_ROWS = 1_000_000
+
+# Dataset opened by each worker process (see init_worker)
+_worker_dataset = None
+
+
+def run_invocation(dataset, task_id, params):
+    """
+    Run one task invocation and capture what it prints.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        task_id (str): Key of TASKS
+        params (dict): Task parameters
+        
+    Returns:
+        dict: 'report' (the task's printed text), 'error' (message, or None
+              on success) and 'seconds'
+    """
+    function = TASKS[task_id][0]
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    try:
+        task_input = dataset if task_id.startswith('A') else column_store.to_frame(dataset, schema.TASK_COLUMNS[task_id])
+        with contextlib.redirect_stdout(output):
+            function(task_input, **params)
+    except Exception as e:
+        error = str(e)
+    return {'report': output.getvalue(), 'error': error, 'seconds': time.perf_counter() - start}
+
+
+def init_worker(file_path):
+    """
+    Open the shared dataset in a worker process.
+    
+    Charts are rendered headless in workers (see visualizer_p1.set_headless).
+    
+    Args:
+        file_path (str): CSV whose binary column cache is memory-mapped
+    """
+    global _worker_dataset
+    visualizer_p1.set_headless(True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _worker_dataset = loader.load_mapped_dataset(file_path)
+
+
+def run_in_worker(task_id, params, work_dir=None):
+    """
+    Run one invocation against the worker's shared dataset.
+    
+    Args:
+        task_id (str): Key of TASKS
+        params (dict): Task parameters
+        work_dir (str): Directory charts are saved into (None for the
+                        current directory)
+        
+    Returns:
+        dict: See run_invocation
+    """
+    with contextlib.chdir(work_dir or os.getcwd()):
+        return run_invocation(_worker_dataset, task_id, params)
+
+
+def prepare_shared_columns(dataset):
+    """
+    Make sure the binary column cache workers map matches the dataset.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        
+    Returns:
+        bool: True if workers can open the dataset memory-mapped
+    """
+    if dataset.get('file_path') is None or dataset.get('fingerprint') is None:
+        return False
+    meta = dataset_cache.read_cache_meta(dataset['file_path'])
+    if dataset_cache.is_cache_fresh(meta, dataset['fingerprint']):
+        return True
+    if dataset['frame'] is None:
+        return False
+    try:
+        dataset_cache.save_cache(dataset, dataset['fingerprint'])
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+
+def run_tasks(dataset, invocations, workers=None, work_dir=None, min_rows=PARALLEL_MIN_ROWS):
+    """
+    Run task invocations, concurrently when the dataset is large enough.
+    
+    With a pool the total time is bounded by the slowest invocation per
+    worker rather than the sum of all of them; small datasets, a single
+    worker, or a dataset without a usable column cache run in-process.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        invocations (list): (task_id, params) pairs
+        workers (int): Worker processes (None for one per CPU)
+        work_dir (str): Directory charts are saved into (None for the
+                        current directory)
+        min_rows (int): Smallest dataset run on a pool
+        
+    Returns:
+        list: Result of each invocation (see run_invocation), in input order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(invocations))
+    parallel = workers > 1 and dataset['n_rows'] >= min_rows and prepare_shared_columns(dataset)
+    
+    if not parallel:
+        with contextlib.chdir(work_dir or os.getcwd()):
+            return [run_invocation(dataset, task_id, params) for task_id, params in invocations]
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(dataset['file_path'],)) as executor:
+        futures = [executor.submit(run_in_worker, task_id, params, work_dir) for task_id, params in invocations]
+        return [future.result() for future in futures]
+
+
+def chart_invocations(dataset):
+    """
+    List the Task C charts for every season and city in a dataset.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        
+    Returns:
+        list: (task_id, params) pairs: C1 per season, C2 and C3 per city, and C4
+    """
+    seasons = dataset['labels'].get('Season', [])
+    cities = dataset['labels'].get('City', [])
+    return ([('C1', {'season': season}) for season in seasons] +
+            [('C2', {'city': city}) for city in cities] +
+            [('C3', {'city': city}) for city in cities] +
+            [('C4', {})])
+
+
+def render_charts(dataset, invocations, output_dir, workers=None):
+    """
+    Render a batch of charts headless, spread over a process pool.
+    
+    Drawing costs the same whatever the dataset size, so the pool is used
+    even for small datasets. Charts whose PNG is already up to date for the
+    same parameters and dataset fingerprint are not drawn again.
+    
+    Args:
+        dataset (dict): Loaded dataset
+        invocations (list): Task C (task_id, params) pairs (see chart_invocations)
+        output_dir (str): Directory the PNGs are written to
+        workers (int): Worker processes (None for one per CPU)
+        
+    Returns:
+        list: Result of each invocation (see run_invocation), in input order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    was_headless = visualizer_p1.headless_mode
+    visualizer_p1.set_headless(True)
+    try:
+        return run_tasks(dataset, invocations, workers, output_dir, min_rows=0)
+    finally:
+        visualizer_p1.set_headless(was_headless)
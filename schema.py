@@ -0,0 +1,145 @@
+"""
+Schema Module for Project 1 (Procedural Style)
+Declares the dataset's columns and types and the columns each task needs,
+and builds the validation report from the parsed buffers, so validation
+never reopens or rescans the file.
+Variable naming: snake_case
+"""
+
+
+# Declared columns in file order: name -> 'numeric' or 'categorical'
+COLUMN_TYPES = {
+    "Date": "categorical",
+    "City": "categorical",
+    "Temperature": "numeric",
+    "Humidity": "numeric",
+    "AirQualityIndex": "numeric",
+    "NoiseLevel_dB": "numeric",
+    "HumanActivityLevel": "numeric",
+    "NearbyGreenSpaces": "numeric",
+    "RoadDensity": "numeric",
+    "WildlifeSpecies": "categorical",
+    "SpeciesCategory": "categorical",
+    "NumberOfSightings": "numeric",
+    "TimeOfDay": "categorical",
+    "WeatherCondition": "categorical",
+    "DayOfWeek": "categorical",
+    "Season": "categorical",
+    "ProximityToWaterSource": "numeric",
+    "UrbanDevelopmentIndex": "numeric",
+    "PublicAwarenessLevel": "numeric",
+    "ConservationEffortsLevel": "numeric",
+    "GarbageManagementScore": "numeric",
+    "LightPollutionLevel": "numeric",
+    "TypeOfSighting": "categorical",
+    "PhotographicEvidence": "categorical",
+    "CitizenReportReliability": "numeric",
+    "SightingDuration_Min": "numeric",
+    "InteractionType": "categorical",
+    "AnimalBehavior": "categorical",
+    "IsEndangeredSpecies": "categorical",
+    "DistanceFromCityCenter_km": "numeric",
+    "ResidentialAreaType": "categorical",
+    "NoiseToleranceLevel": "numeric",
+    "VegetationDensity": "numeric",
+    "ObservationMethod": "categorical"
+}
+
+# Columns each task reads (memory-mapped datasets page in only these)
+TASK_COLUMNS = {
+    'A1': ['City', 'WildlifeSpecies', 'SpeciesCategory', 'NumberOfSightings', 'IsEndangeredSpecies'],
+    'A2': ['TimeOfDay', 'AirQualityIndex', 'Temperature', 'Humidity', 'WeatherCondition'],
+    'A3': ['UrbanDevelopmentIndex', 'ProximityToWaterSource', 'HumanActivityLevel', 'NoiseLevel_dB',
+           'LightPollutionLevel', 'GarbageManagementScore'],
+    'A4': ['SightingDuration_Min', 'Season', 'WildlifeSpecies', 'NumberOfSightings'],
+    'B1': ['NearbyGreenSpaces', 'Season', 'WildlifeSpecies', 'NumberOfSightings'],
+    'B2': ['City', 'WeatherCondition', 'TimeOfDay', 'NumberOfSightings', 'SightingDuration_Min'],
+    'B3': ['InteractionType', 'SightingDuration_Min', 'ResidentialAreaType', 'NoiseLevel_dB',
+           'HumanActivityLevel', 'LightPollutionLevel'],
+    'B4': ['IsEndangeredSpecies', 'NearbyGreenSpaces', 'NumberOfSightings', 'WildlifeSpecies'],
+    'C1': ['Season', 'City', 'Temperature', 'Humidity'],
+    'C2': ['City', 'Date', 'SpeciesCategory', 'NumberOfSightings'],
+    'C3': ['City', 'ResidentialAreaType', 'PublicAwarenessLevel'],
+    'C4': ['IsEndangeredSpecies', 'NoiseLevel_dB', 'NumberOfSightings', 'WildlifeSpecies']
+}
+
+
+def columns_of_type(column_type):
+    """
+    List the declared columns of one type.
+    
+    Args:
+        column_type (str): 'numeric' or 'categorical'
+        
+    Returns:
+        tuple: Column names in file order
+    """
+    return tuple(name for name, declared in COLUMN_TYPES.items() if declared == column_type)
+
+
+def make_report(header, n_rows, invalid_counts, bad_rows):
+    """
+    Assemble a validation report from per-column invalid counts.
+    
+    Args:
+        header (list): Columns found in the file
+        n_rows (int): Number of data rows
+        invalid_counts (dict): column name -> values missing or failing to parse
+        bad_rows (int): Rows with at least one invalid declared column
+        
+    Returns:
+        dict: Report with 'n_rows', 'missing_columns', 'extra_columns',
+              'columns', 'bad_rows' and 'unavailable_tasks' keys
+    """
+    present = set(header)
+    columns = {}
+    for column_name in header:
+        invalid = int(invalid_counts.get(column_name, 0))
+        columns[column_name] = {
+            'type': COLUMN_TYPES.get(column_name, 'undeclared'),
+            'invalid': invalid,
+            'coverage': 1.0 - invalid / n_rows if n_rows else 1.0
+        }
+    
+    unavailable_tasks = {}
+    for task_id, task_columns in TASK_COLUMNS.items():
+        missing = [column_name for column_name in task_columns if column_name not in present]
+        if missing:
+            unavailable_tasks[task_id] = missing
+    
+    return {
+        'n_rows': n_rows,
+        'missing_columns': [column_name for column_name in COLUMN_TYPES if column_name not in present],
+        'extra_columns': [column_name for column_name in header if column_name not in COLUMN_TYPES],
+        'columns': columns,
+        'bad_rows': int(bad_rows),
+        'unavailable_tasks': unavailable_tasks
+    }
+
+
+def print_report(report, log=print):
+    """
+    Print a validation report summary.
+    
+    Only columns with invalid values are listed individually.
+    
+    Args:
+        report (dict): Report built by make_report
+        log (function): Called with each line (defaults to print)
+    """
+    declared_present = len(COLUMN_TYPES) - len(report['missing_columns'])
+    log(f"✓ Schema: {declared_present}/{len(COLUMN_TYPES)} declared columns present, "
+          f"{report['bad_rows']} of {report['n_rows']} rows with invalid values")
+    
+    if report['missing_columns']:
+        log(f"Warning: missing columns: {', '.join(report['missing_columns'])}")
+    if report['extra_columns']:
+        log(f"Note: undeclared columns: {', '.join(report['extra_columns'])}")
+    
+    for column_name, column in report['columns'].items():
+        if column['invalid']:
+            log(f"  {column_name} ({column['type']}): {column['invalid']} invalid, "
+                  f"{column['coverage']:.1%} coverage")
+    
+    for task_id, missing in report['unavailable_tasks'].items():
+        log(f"Warning: Task {task_id} unavailable (needs {', '.join(missing)})")
@@ -0,0 +1,139 @@
+"""
+Streaming Module for Project 1 (Procedural Style)
+Runs Task A retrievals and Task B aggregations over a stream of row chunks
+instead of a fully materialized dataset, so memory stays constant.
+Variable naming: snake_case
+"""
+
+import pandas as pd
+from tabulate import tabulate
+
+import column_store
+import retriever
+
+
+# Rows parsed per chunk when streaming a CSV
+CHUNK_ROWS = 100_000
+
+
+def csv_chunk_source(file_path, columns=None, chunk_rows=CHUNK_ROWS):
+    """
+    Create a re-iterable source of DataFrame chunks read from a CSV.
+    
+    Chunks keep a running RangeIndex, so index values are row numbers in
+    the whole file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        columns (list): Columns to read (None for all)
+        chunk_rows (int): Rows per chunk
+        
+    Returns:
+        function: Zero-argument function returning a fresh chunk iterator
+    """
+    def source():
+        return iter(pd.read_csv(file_path, usecols=columns, chunksize=chunk_rows))
+    return source
+
+
+def iter_frames(data):
+    """
+    Iterate over the frames of a task input.
+    
+    Args:
+        data: A DataFrame, a chunk source (see csv_chunk_source), or an
+              iterable of DataFrame chunks
+        
+    Returns:
+        iterator: DataFrames to aggregate
+    """
+    if isinstance(data, pd.DataFrame):
+        return iter([data])
+    if callable(data):
+        return data()
+    return iter(data)
+
+
+def is_streamed(data):
+    """
+    Check whether a task input is a stream of chunks rather than one frame.
+    
+    Args:
+        data: Task input (see iter_frames)
+        
+    Returns:
+        bool: True for chunk sources and iterables
+    """
+    return not isinstance(data, pd.DataFrame)
+
+
+def add_partials(total, partial):
+    """
+    Merge two additive partial aggregates (Series or DataFrames).
+    
+    Args:
+        total: Running aggregate, or None for the first chunk
+        partial: Aggregate of one chunk
+        
+    Returns:
+        Merged aggregate, aligned on the union of both indexes
+    """
+    if total is None:
+        return partial
+    return total.add(partial, fill_value=0)
+
+
+def stream_retrieval(data, task_id, **params):
+    """
+    Run a declared Task A retrieval chunk by chunk.
+    
+    Each chunk is turned into a columnar store and queried on its own, and
+    its matches are yielded right away, so output starts before the whole
+    file has been read.
+    
+    Args:
+        data: Task input (see iter_frames)
+        task_id (str): Key of retriever.RETRIEVAL_TASKS (e.g. "A1")
+        **params: Values for the task's "$name" placeholders
+        
+    Yields:
+        list: Display rows of the matches in one chunk, or None if a filter
+              column is missing
+    """
+    for chunk in iter_frames(data):
+        chunk_dataset = column_store.build_store(chunk, eager=False)
+        yield retriever.retrieve(chunk_dataset, task_id, **params)
+
+
+def run_streamed_retrieval(data, task_id, **params):
+    """
+    Print the results of a Task A retrieval as each chunk is processed.
+    
+    Matches are printed until retriever.DISPLAY_LIMIT have been shown;
+    later ones are only counted.
+    
+    Args:
+        data: Task input (see iter_frames)
+        task_id (str): Key of retriever.RETRIEVAL_TASKS (e.g. "A1")
+        **params: Values for the task's "$name" placeholders
+        
+    Returns:
+        int: Total number of matching records
+    """
+    print(f"\n=== Task {task_id}: Streaming Retrieval {params} ===")
+    headers = retriever.RETRIEVAL_TASKS[task_id]['columns']
+    
+    total = 0
+    for rows in stream_retrieval(data, task_id, **params):
+        if rows is None:
+            print("Error: Required columns not found.")
+            return total
+        shown = rows[:max(retriever.DISPLAY_LIMIT - total, 0)]
+        if shown:
+            print(tabulate(shown, headers=headers, tablefmt="grid"))
+        total += len(rows)
+    
+    if total > retriever.DISPLAY_LIMIT:
+        print(f"... {total - retriever.DISPLAY_LIMIT} more records not shown (use export.py to write them all to a file)")
+    print(f"\nTotal records found: {total}")
+    return total
@@ -0,0 +1,66 @@
+"""
+Analyzer Loading Tests for Project 1 (Procedural Style)
+Checks the optimized load_dataframe mode: compact dtypes, column pruning,
+and values identical to a plain pd.read_csv.
+Variable naming: snake_case
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyzer
+import schema
+
+
+def assert_same_values(frame, expected_frame):
+    """
+    Assert an optimized frame holds exactly the values of a plain one.
+    
+    Args:
+        frame (DataFrame): Frame from load_dataframe(optimize=True)
+        expected_frame (DataFrame): Frame from pd.read_csv
+    """
+    assert list(frame.columns) == list(expected_frame.columns)
+    for column_name in frame.columns:
+        series = frame[column_name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        pd.testing.assert_series_equal(series, expected_frame[column_name], check_dtype=False, check_exact=True)
+
+
+def test_optimized_load_matches_read_csv(wildlife_csv, wildlife_frame):
+    df = analyzer.load_dataframe(wildlife_csv, optimize=True)
+    assert_same_values(df, wildlife_frame)
+    for column_name in schema.columns_of_type('categorical'):
+        assert isinstance(df[column_name].dtype, pd.CategoricalDtype), column_name
+    for column_name in wildlife_frame.select_dtypes('integer').columns:
+        assert df[column_name].dtype.itemsize < 8, column_name
+    assert analyzer.estimate_plain_memory(df) > df.memory_usage(deep=True).sum()
+
+
+def test_optimized_load_of_the_bundled_csv():
+    path = os.path.join(os.path.dirname(__file__), "Urban_wildlife.csv")
+    assert_same_values(analyzer.load_dataframe(path, optimize=True), pd.read_csv(path))
+
+
+def test_task_columns_only(wildlife_csv, wildlife_frame):
+    df = analyzer.load_dataframe(wildlife_csv, tasks=['B1', 'C1'], optimize=True)
+    wanted = set(schema.TASK_COLUMNS['B1']) | set(schema.TASK_COLUMNS['C1'])
+    assert set(df.columns) == wanted
+    assert_same_values(df, wildlife_frame[list(df.columns)])
+
+
+@pytest.mark.parametrize("values, narrowed", [
+    ([0.5, np.nan, -3.0], True),
+    ([26.2, 0.1, 1.0], False),
+    ([16777217.0, 1.0, 2.0], False)
+])
+def test_floats_narrowed_only_when_exact(values, narrowed):
+    df = pd.DataFrame({'value': values, 'count': [1, 2, 300]})
+    analyzer.downcast_numeric(df)
+    assert (df['value'].dtype == np.float32) == narrowed
+    assert df['count'].dtype == np.int16
+    assert np.array_equal(df['value'].to_numpy(dtype=float), np.array(values), equal_nan=True)
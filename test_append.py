@@ -0,0 +1,183 @@
+"""
+Append Tests for Project 1 (Procedural Style)
+Checks that a dataset grown by appends answers queries, roll-ups and
+group-bys like one loaded from the whole file, and that following a CSV
+picks up exactly the complete lines added to it.
+Variable naming: snake_case
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import append
+import column_store
+import cube
+import groupby
+import loader
+import query
+
+
+# Rows loaded before appending the rest of the synthetic CSV
+INITIAL_ROWS = 1000
+
+
+def decoded(dataset):
+    """
+    Decode a dataset to plain values, independent of label order.
+    
+    Args:
+        dataset (dict): Dataset built by column_store.build_store
+        
+    Returns:
+        DataFrame: Categorical columns as objects, numeric ones as floats
+    """
+    frame = column_store.to_frame(dataset)
+    return pd.DataFrame({column_name: frame[column_name].astype(object)
+                         if isinstance(frame[column_name].dtype, pd.CategoricalDtype)
+                         else frame[column_name].astype(float) for column_name in frame.columns})
+
+
+def grown_dataset(frame, batch_rows):
+    """
+    Load the first INITIAL_ROWS rows with every structure built, then append the rest.
+    
+    Args:
+        frame (DataFrame): Rows as parsed by pd.read_csv
+        batch_rows (int): Rows per append
+        
+    Returns:
+        dict: Dataset after the appends
+    """
+    dataset = column_store.build_store(frame.iloc[:INITIAL_ROWS].copy(),
+                                       fingerprint={'size': 0, 'mtime_ns': 0, 'hash': "initial"})
+    for column_name in column_store.RANGE_INDEXED_COLUMNS:
+        column_store.range_index(dataset, column_name)
+    cube.build_cube(dataset)
+    dataset['report'] = column_store.validation_report(dataset)
+    for start in range(INITIAL_ROWS, len(frame), batch_rows):
+        append.append_rows(dataset, frame.iloc[start:start + batch_rows])
+    return dataset
+
+
+@pytest.fixture(scope="module", params=[17, 500])
+def grown(request, wildlife_csv):
+    """Dataset grown by small or large appends, and the full dataset (tests must not modify them)."""
+    frame = pd.read_csv(wildlife_csv)
+    return grown_dataset(frame, request.param), column_store.build_store(frame.copy())
+
+
+def test_appended_values_match_full_load(grown):
+    dataset, full = grown
+    assert dataset['n_rows'] == full['n_rows']
+    pd.testing.assert_frame_equal(decoded(dataset), decoded(full))
+    assert dataset['report'] == column_store.validation_report(full)
+
+
+@pytest.mark.parametrize("filters", [
+    [("City", "==", "karachi")],
+    [("City", "in", ["Lahore", "Quetta"]), ("Season", "==", "Winter")],
+    [("AirQualityIndex", "<", 120)],
+    [("SightingDuration_Min", ">", 30), ("Season", "==", "summer")],
+    [("UrbanDevelopmentIndex", ">=", 0.5), ("ProximityToWaterSource", "==", 5)]
+])
+def test_appended_queries_match_full_load(grown, filters):
+    dataset, full = grown
+    assert np.array_equal(query.run_query(dataset, filters), query.run_query(full, filters))
+    assert np.array_equal(query.select_frame_rows(dataset['frame'], filters), query.run_query(full, filters))
+
+
+def test_appended_cube_matches_full_load(grown):
+    dataset, full = grown
+    for measures, group_by, filters in [(["NumberOfSightings"], ["WildlifeSpecies"], [("Season", "==", "Spring")]),
+                                        (["Temperature", "Humidity"], ["City"], [])]:
+        table, total_rows = cube.rollup(dataset, measures, group_by, filters)
+        expected_table, expected_rows = cube.rollup(full, measures, group_by, filters)
+        assert total_rows == expected_rows
+        pd.testing.assert_frame_equal(table, expected_table, check_dtype=False)
+
+
+def test_appended_group_by_matches_full_load(grown):
+    dataset, full = grown
+    aggregations = [("NumberOfSightings", "sum"), ("HumanActivityLevel", "mode"), ("WildlifeSpecies", "mode")]
+    pd.testing.assert_frame_equal(groupby.group_by(dataset, ["City", "Season"], aggregations),
+                                  groupby.group_by(full, ["City", "Season"], aggregations), check_dtype=False)
+
+
+def test_new_labels_are_indexed(dataset):
+    n_rows = dataset['n_rows']
+    rows = dataset['frame'].iloc[:2].astype(object).assign(City=["Multan", " multan"])
+    assert append.append_rows(dataset, rows) == 2
+    assert column_store.index_rows(dataset, "City", ["MULTAN"]).tolist() == [n_rows, n_rows + 1]
+    assert query.run_query(dataset, [("City", "==", "multan")]).tolist() == [n_rows, n_rows + 1]
+
+
+def test_append_changes_the_fingerprint(dataset):
+    fingerprint = dataset['fingerprint']
+    frame = dataset['frame']
+    append.append_rows(dataset, frame.iloc[:3].astype(object), n_bytes=100)
+    assert dataset['fingerprint']['hash'] != fingerprint['hash']
+    assert dataset['fingerprint']['size'] == fingerprint['size'] + 100
+    assert len(frame) == dataset['n_rows'] - 3
+
+
+def test_empty_append(dataset):
+    fingerprint = dataset['fingerprint']
+    assert append.append_rows(dataset, dataset['frame'].iloc[:0]) == 0
+    assert dataset['fingerprint'] == fingerprint
+
+
+def test_mapped_datasets_cannot_grow(dataset):
+    mapped = column_store.build_mapped_store(dataset['columns'], dataset['labels'], dataset['header'],
+                                             dataset['n_rows'])
+    with pytest.raises(ValueError):
+        append.append_rows(mapped, dataset['frame'].iloc[:1])
+
+
+@pytest.fixture
+def followed(wildlife_csv, tmp_path):
+    """A copy of the first INITIAL_ROWS rows of the CSV, loaded, and the remaining lines."""
+    with open(wildlife_csv, 'rb') as file:
+        lines = file.readlines()
+    path = str(tmp_path / "followed.csv")
+    with open(path, 'wb') as file:
+        file.writelines(lines[:INITIAL_ROWS + 1])
+    dataset = loader.load_dataset(path, use_cache=False, log=lambda line: None)
+    return path, dataset, lines[INITIAL_ROWS + 1:]
+
+
+def test_poll_reads_complete_lines_only(followed, wildlife_frame):
+    path, dataset, rest = followed
+    state = {}
+    assert append.poll_csv(dataset, state) == 0
+    
+    with open(path, 'ab') as file:
+        file.writelines(rest[:10])
+        file.write(rest[10][:5])
+    assert append.poll_csv(dataset, state) == 10
+    
+    with open(path, 'ab') as file:
+        file.write(rest[10][5:])
+        file.writelines(rest[11:])
+    assert append.poll_csv(dataset, state) == len(rest) - 10
+    assert append.poll_csv(dataset, state) == 0
+    
+    full = column_store.build_store(wildlife_frame.copy())
+    pd.testing.assert_frame_equal(decoded(dataset), decoded(full))
+
+
+def test_rewritten_file_stops_following(followed, wildlife_csv):
+    path, dataset, _ = followed
+    state = {}
+    with open(path, 'r+b') as file:
+        file.truncate(100)
+    with pytest.raises(ValueError):
+        append.poll_csv(dataset, state)
+    
+    shutil.copy(wildlife_csv, path)
+    with open(path, 'r+b') as file:
+        file.write(b"X")
+    with pytest.raises(ValueError):
+        append.read_new_rows(dataset, path, state['offset'])
@@ -0,0 +1,119 @@
+"""
+Columnar Store Tests for Project 1 (Procedural Style)
+Checks the equality (hash + bitmap) and range indexes against plain
+pandas lookups.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import column_store
+import query
+
+
+def pandas_label_rows(frame, column_name, values):
+    """
+    Row positions whose label matches any of the values, case-insensitively.
+    
+    Args:
+        frame (DataFrame): Data as parsed by pd.read_csv
+        column_name (str): Categorical column
+        values (list): Labels to match
+        
+    Returns:
+        ndarray: Sorted row positions
+    """
+    labels = frame[column_name].str.strip().str.lower()
+    return np.flatnonzero(labels.isin([value.strip().lower() for value in values]).to_numpy())
+
+
+@pytest.mark.parametrize("column_name", column_store.INDEXED_COLUMNS)
+def test_equality_index_matches_pandas(dataset, wildlife_frame, column_name):
+    for label in wildlife_frame[column_name].dropna().unique():
+        for value in (label, label.upper(), f" {label.lower()} "):
+            rows = column_store.index_rows(dataset, column_name, [value])
+            assert np.array_equal(rows, pandas_label_rows(wildlife_frame, column_name, [label]))
+
+
+def test_index_rows_or_and_unknown_labels(dataset, wildlife_frame):
+    rows = column_store.index_rows(dataset, "City", ["Karachi", "quetta", "Atlantis"])
+    assert np.array_equal(rows, pandas_label_rows(wildlife_frame, "City", ["Karachi", "Quetta"]))
+    assert len(column_store.index_rows(dataset, "City", ["Atlantis"])) == 0
+
+
+def test_missing_values_are_not_indexed(dataset, wildlife_frame):
+    index = column_store.equality_index(dataset, "City")
+    indexed = np.concatenate(list(index['rows'].values()))
+    assert len(indexed) == wildlife_frame["City"].notna().sum()
+    assert not np.isin(np.flatnonzero(wildlife_frame["City"].isna().to_numpy()), indexed).any()
+
+
+def test_labels_differing_in_case_share_an_entry():
+    dataset = column_store.build_store(pd.DataFrame({"City": ["Karachi", "karachi ", "Lahore", None]}))
+    assert list(column_store.index_rows(dataset, "City", ["KARACHI"])) == [0, 1]
+    assert column_store.bitmap_to_rows(column_store.index_bitmap(dataset, "City", ["karachi"]), 4).tolist() == [0, 1]
+
+
+def test_bitmap_and_matches_pandas(dataset, wildlife_frame):
+    bitmap = (column_store.index_bitmap(dataset, "City", ["Karachi", "Lahore"])
+              & column_store.index_bitmap(dataset, "Season", ["Winter"])
+              & column_store.index_bitmap(dataset, "TimeOfDay", ["night"]))
+    expected = np.intersect1d(
+        np.intersect1d(pandas_label_rows(wildlife_frame, "City", ["Karachi", "Lahore"]),
+                       pandas_label_rows(wildlife_frame, "Season", ["Winter"])),
+        pandas_label_rows(wildlife_frame, "TimeOfDay", ["Night"]))
+    assert np.array_equal(column_store.bitmap_to_rows(bitmap, dataset['n_rows']), expected)
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 7, 8, 9, 1000])
+def test_bitmap_round_trip(n_rows):
+    row_ids = np.arange(0, n_rows, 3)
+    bitmap = column_store.rows_to_bitmap(row_ids, n_rows)
+    assert len(bitmap) == (n_rows + 7) // 8
+    assert np.array_equal(column_store.bitmap_to_rows(bitmap, n_rows), row_ids)
+
+
+def test_unindexed_columns(dataset):
+    assert column_store.equality_index(dataset, "WildlifeSpecies") is None
+    assert column_store.index_rows(dataset, "AirQualityIndex", [100]) is None
+    assert column_store.index_bitmap(dataset, "Humidity", [50]) is None
+
+
+def test_empty_dataset_indexes(wildlife_frame):
+    empty = column_store.build_store(wildlife_frame.iloc[:0].copy())
+    assert len(column_store.index_rows(empty, "City", ["Karachi"])) == 0
+    assert len(column_store.index_bitmap(empty, "City", ["Karachi"])) == 0
+
+
+@pytest.mark.parametrize("column_name", column_store.RANGE_INDEXED_COLUMNS)
+@pytest.mark.parametrize("op", ["<", "<=", ">", ">=", "=="])
+def test_range_bounds_match_pandas(dataset, wildlife_frame, column_name, op):
+    series = wildlife_frame[column_name]
+    thresholds = [series.min() - 1, series.min(), series.median(), series.iloc[0], series.max(), series.max() + 1]
+    for value in thresholds:
+        if pd.isna(value):
+            continue
+        bounds = column_store.range_bounds(dataset, column_name, op, value)
+        rows = np.sort(np.concatenate([run['rows'][start:stop] for run, start, stop in bounds]))
+        expected = np.flatnonzero((series.notna() & query.NUMERIC_OPERATORS[op](series, value)).to_numpy())
+        assert np.array_equal(rows, expected)
+
+
+def test_range_index_skips_missing_values(dataset, wildlife_frame):
+    index = column_store.range_index(dataset, "AirQualityIndex")
+    assert len(index['rows']) == wildlife_frame["AirQualityIndex"].notna().sum()
+    assert np.all(np.diff(index['values']) >= 0)
+
+
+def test_range_bounds_not_indexable(dataset):
+    assert column_store.range_bounds(dataset, "AirQualityIndex", "!=", 100) is None
+    assert column_store.range_bounds(dataset, "Humidity", "<", 50) is None
+    assert column_store.range_index(dataset, "City") is None
+
+
+def test_empty_range_index(wildlife_frame):
+    empty = column_store.build_store(wildlife_frame.iloc[:0].copy())
+    bounds = column_store.range_bounds(empty, "AirQualityIndex", ">=", 0)
+    assert [(start, stop) for _, start, stop in bounds] == [(0, 0)]
@@ -0,0 +1,119 @@
+"""
+Aggregate Cube Tests for Project 1 (Procedural Style)
+Checks cube roll-ups against a plain pandas filter and group-by.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import column_store
+import cube
+import query
+
+
+# (measures, group_by, filters) answered by the cube
+ROLLUP_CASES = [
+    (["NumberOfSightings"], ["WildlifeSpecies"], [("Season", "==", "spring"), ("NearbyGreenSpaces", ">", 2)]),
+    (["NumberOfSightings"], ["NearbyGreenSpaces"], [("Season", "==", "Autumn")]),
+    (["NumberOfSightings", "SightingDuration_Min"], ["WeatherCondition", "TimeOfDay"], [("City", "==", "Karachi")]),
+    (["SightingDuration_Min"], ["TimeOfDay", "WeatherCondition"], []),
+    (["Temperature", "Humidity"], ["City"], [("Season", "==", "Winter")]),
+    (["Temperature"], ["Season", "City"], []),
+    (["PublicAwarenessLevel"], ["ResidentialAreaType"], [("City", "in", ["lahore", "Quetta"])]),
+    (["Humidity"], ["City"], [("Season", "==", "Monsoon")])
+]
+
+
+def pandas_rollup(frame, measures, group_by, filters):
+    """
+    Filter and group with plain pandas, as the cube should.
+    
+    Args:
+        frame (DataFrame): Data as parsed by pd.read_csv
+        measures (list): Measure columns
+        group_by (list): Group columns
+        filters (list): (column, op, value) filters, combined with AND
+        
+    Returns:
+        tuple: (DataFrame like cube.rollup's, rows passing the filters)
+    """
+    mask = pd.Series(True, index=frame.index)
+    for column_name, op, value in filters:
+        series = frame[column_name]
+        if pd.api.types.is_numeric_dtype(series):
+            mask &= series.notna() & query.NUMERIC_OPERATORS[op](series, value)
+        else:
+            wanted = [str(item).strip().lower() for item in query.filter_values(op, value)]
+            mask &= series.str.strip().str.lower().isin(wanted)
+    selected = frame[mask]
+    
+    grouped = selected.groupby(group_by)
+    data = {}
+    for column_name in measures:
+        data[f"{column_name}_sum"] = grouped[column_name].sum()
+        data[f"{column_name}_count"] = grouped[column_name].count()
+        data[f"{column_name}_sumsq"] = (selected[column_name] ** 2).groupby([selected[key] for key in group_by]).sum()
+    data['rows'] = grouped.size()
+    return pd.DataFrame(data), len(selected)
+
+
+def assert_same_rollup(result, expected):
+    """
+    Assert a cube roll-up equals the pandas one.
+    
+    Args:
+        result (tuple): Result of cube.rollup
+        expected (tuple): Result of pandas_rollup
+    """
+    table, total_rows = result
+    expected_table, expected_rows = expected
+    assert total_rows == expected_rows
+    assert table.index.names == expected_table.index.names
+    assert table.index.tolist() == expected_table.index.tolist()
+    for column_name in expected_table.columns:
+        assert np.allclose(table[column_name].to_numpy(dtype=float),
+                           expected_table[column_name].to_numpy(dtype=float)), column_name
+
+
+@pytest.mark.parametrize("measures, group_by, filters", ROLLUP_CASES)
+def test_rollup_matches_pandas(dataset, wildlife_frame, measures, group_by, filters):
+    result = cube.rollup(dataset, measures, group_by, filters)
+    assert result is not None
+    assert_same_rollup(result, pandas_rollup(wildlife_frame, measures, group_by, filters))
+
+
+def test_rollup_frame_uses_the_store(dataset, wildlife_frame):
+    measures, group_by, filters = ROLLUP_CASES[0]
+    assert_same_rollup(cube.rollup_frame(dataset['frame'], measures, group_by, filters),
+                       pandas_rollup(wildlife_frame, measures, group_by, filters))
+    assert cube.rollup_frame(wildlife_frame, measures, group_by, filters) is None
+
+
+def test_rollup_falls_back(dataset):
+    # No cuboid holds the columns, or a filter the cube cannot evaluate
+    assert cube.rollup(dataset, ["Humidity"], ["WildlifeSpecies"], []) is None
+    assert cube.rollup(dataset, ["Temperature"], ["City"], [("Season", "!=", "Winter")]) is None
+
+
+def test_rollup_of_empty_dataset(wildlife_frame):
+    empty = column_store.build_store(wildlife_frame.iloc[:0].copy())
+    table, total_rows = cube.rollup(empty, ["Temperature"], ["City"], [])
+    assert total_rows == 0
+    assert table.empty
+
+
+@pytest.mark.parametrize("measures, group_by, filters", ROLLUP_CASES)
+def test_grouped_sums_same_with_or_without_cube(dataset, wildlife_frame, measures, group_by, filters):
+    sums, counts, total_rows = cube.grouped_sums(dataset['frame'], measures, group_by, filters)
+    chunks = [wildlife_frame.iloc[start:start + 700] for start in range(0, len(wildlife_frame), 700)]
+    for source in (wildlife_frame, chunks):
+        scanned_sums, scanned_counts, scanned_rows = cube.grouped_sums(source, measures, group_by, filters)
+        assert scanned_rows == total_rows
+        if total_rows == 0:
+            assert scanned_sums is None and sums is None
+            continue
+        pd.testing.assert_frame_equal(scanned_sums, sums, check_dtype=False, check_index_type=False,
+                                      check_exact=False, rtol=1e-12)
+        pd.testing.assert_frame_equal(scanned_counts, counts, check_dtype=False, check_index_type=False)
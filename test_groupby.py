@@ -0,0 +1,117 @@
+"""
+Group-By Engine Tests for Project 1 (Procedural Style)
+Checks group_by and group_arrays against pandas' DataFrame.groupby.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import benchmark
+import column_store
+import groupby
+import query
+
+
+# Aggregations pandas computes under the same name
+PANDAS_AGGREGATIONS = ('count', 'sum', 'mean', 'min', 'max', 'var')
+
+
+def assert_same_groups(result, expected):
+    """
+    Assert an engine result equals a pandas group-by.
+    
+    Args:
+        result (DataFrame): Result of group_by or group_arrays
+        expected (DataFrame): pandas result with the same columns
+    """
+    assert result.index.names == expected.index.names
+    assert result.index.tolist() == expected.index.tolist()
+    for column_name in expected.columns:
+        values = result[column_name].to_numpy()
+        expected_values = expected[column_name].to_numpy()
+        if values.dtype == object or expected_values.dtype == object:
+            assert values.tolist() == expected_values.tolist(), column_name
+        else:
+            assert np.allclose(values.astype(float), expected_values.astype(float),
+                               equal_nan=True, rtol=1e-12), column_name
+
+
+@pytest.mark.parametrize("case", sorted(benchmark.GROUPBY_CASES))
+def test_group_by_matches_pandas(dataset, wildlife_frame, case):
+    keys, aggregations = benchmark.GROUPBY_CASES[case]
+    result = groupby.group_by(dataset, keys, aggregations)
+    assert_same_groups(result, benchmark.pandas_group_by(wildlife_frame, keys, aggregations))
+    assert result['rows'].tolist() == wildlife_frame.groupby(keys).size().tolist()
+
+
+@pytest.mark.parametrize("key", ["City", "NearbyGreenSpaces", "AirQualityIndex"])
+def test_every_aggregation_matches_pandas(dataset, wildlife_frame, key):
+    aggregations = [("NoiseLevel_dB", op) for op in PANDAS_AGGREGATIONS]
+    result = groupby.group_by(dataset, [key], aggregations + [("NoiseLevel_dB", "sumsq")])
+    assert_same_groups(result, benchmark.pandas_group_by(wildlife_frame, [key], aggregations))
+    sumsq = (wildlife_frame["NoiseLevel_dB"] ** 2).groupby(wildlife_frame[key]).sum()
+    assert np.allclose(result["NoiseLevel_dB_sumsq"].to_numpy(), sumsq.to_numpy())
+
+
+def test_categorical_mode(dataset, wildlife_frame):
+    aggregations = [("WeatherCondition", "mode")]
+    result = groupby.group_by(dataset, ["Season"], aggregations)
+    assert_same_groups(result, benchmark.pandas_group_by(wildlife_frame, ["Season"], aggregations))
+
+
+def test_group_selected_rows(dataset, wildlife_frame):
+    filters = [("AirQualityIndex", "<", 150), ("TimeOfDay", "==", "Morning")]
+    row_ids = query.run_query(dataset, filters)
+    aggregations = [("NumberOfSightings", "sum"), ("Humidity", "mean")]
+    result = groupby.group_by(dataset, ["City", "Season"], aggregations, row_ids=row_ids)
+    expected = benchmark.pandas_group_by(wildlife_frame.iloc[row_ids], ["City", "Season"], aggregations)
+    assert_same_groups(result, expected)
+
+
+def test_keep_missing_keys(dataset, wildlife_frame):
+    result = groupby.group_by(dataset, ["City"], [("Temperature", "sum")], dropna=False)
+    expected = wildlife_frame.groupby("City", dropna=False)["Temperature"].sum()
+    assert result['rows'].sum() == len(wildlife_frame)
+    assert pd.isna(result.index[-1])
+    assert np.allclose(result["Temperature_sum"].to_numpy(), expected.to_numpy())
+
+
+def test_compacted_group_ids(dataset, wildlife_frame, monkeypatch):
+    monkeypatch.setattr(groupby, "MAX_DENSE_GROUPS", 4)
+    keys, aggregations = benchmark.GROUPBY_CASES['city_season_area']
+    assert_same_groups(groupby.group_by(dataset, keys, aggregations),
+                       benchmark.pandas_group_by(wildlife_frame, keys, aggregations))
+
+
+def test_group_by_empty_dataset(wildlife_frame):
+    empty = column_store.build_store(wildlife_frame.iloc[:0].copy())
+    result = groupby.group_by(empty, ["City"], [("Temperature", "mean")])
+    assert result.empty
+    assert list(result.columns) == ["Temperature_mean", "rows"]
+
+
+def test_group_arrays_matches_pandas():
+    frame = pd.DataFrame({
+        'bin': pd.cut([0.1, 0.5, 0.9, np.nan, 0.55, 0.3], [0, 0.25, 0.5, 1.0]),
+        'year': [2020, 2021, 2020, 2021, np.nan, 2020],
+        'value': [1.0, np.nan, 3.0, 4.0, 5.0, 6.0]
+    })
+    aggregations = [("value", op) for op in PANDAS_AGGREGATIONS]
+    result = groupby.group_arrays({'bin': frame['bin'], 'year': frame['year'].to_numpy()},
+                                  {'value': frame['value'].to_numpy()}, aggregations)
+    expected = benchmark.pandas_group_by(frame, ['bin', 'year'], aggregations)
+    assert result.index.tolist() == expected.index.tolist()
+    assert np.allclose(result.drop(columns='rows').to_numpy(float), expected.to_numpy(float), equal_nan=True)
+
+
+def test_group_arrays_empty_input():
+    result = groupby.group_arrays({'key': np.empty(0)}, {'value': np.empty(0)}, [("value", "sum")])
+    assert result.empty
+    assert list(result.columns) == ["value_sum", "rows"]
+
+
+def test_unknown_aggregation(dataset):
+    with pytest.raises(ValueError):
+        groupby.group_by(dataset, ["City"], [("Temperature", "median")])
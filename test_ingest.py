@@ -0,0 +1,100 @@
+"""
+Parallel Ingestion Tests for Project 1 (Procedural Style)
+Checks that byte-range parsing gives the same store as a plain
+pd.read_csv of the whole file.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import column_store
+import ingest
+import loader
+
+
+def assert_same_store(frame, expected_frame):
+    """
+    Assert two frames give identical columnar stores.
+    
+    Args:
+        frame (DataFrame): Frame under test
+        expected_frame (DataFrame): Frame parsed by pd.read_csv
+    """
+    dataset = column_store.build_store(frame)
+    expected = column_store.build_store(expected_frame)
+    assert dataset['header'] == expected['header']
+    for column_name in expected['header']:
+        values = dataset['columns'][column_name]
+        expected_values = expected['columns'][column_name]
+        assert values.dtype.kind == expected_values.dtype.kind, column_name
+        assert np.array_equal(values, expected_values, equal_nan=values.dtype.kind == 'f'), column_name
+        assert dataset['labels'].get(column_name) == expected['labels'].get(column_name), column_name
+
+
+def read_ranges(file_path, n_parts):
+    """
+    Parse a CSV range by range in this process, as the workers would.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        n_parts (int): Desired number of ranges
+        
+    Returns:
+        DataFrame: Stitched frame
+    """
+    header, ranges = ingest.split_byte_ranges(file_path, n_parts)
+    chunks = [ingest.parse_byte_range(file_path, header, start, end) for start, end in ranges]
+    return pd.DataFrame({column_name: ingest.concat_column_chunks(chunks, column_name)
+                         for column_name in chunks[0]})
+
+
+@pytest.mark.parametrize("n_parts", [1, 2, 3, 7, 64])
+def test_byte_ranges_cover_whole_lines(wildlife_csv, n_parts):
+    header, ranges = ingest.split_byte_ranges(wildlife_csv, n_parts)
+    with open(wildlife_csv, 'rb') as file:
+        content = file.read()
+    assert content.startswith(header)
+    assert ranges[0][0] == len(header)
+    assert ranges[-1][1] == len(content)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert content[end - 1:end] == b"\n"
+
+
+@pytest.mark.parametrize("n_parts", [1, 3, 7, 64])
+def test_ranges_match_read_csv(wildlife_csv, wildlife_frame, n_parts):
+    assert_same_store(read_ranges(wildlife_csv, n_parts), wildlife_frame)
+
+
+def test_parallel_read_csv_matches_read_csv(wildlife_csv, wildlife_frame):
+    assert_same_store(ingest.parallel_read_csv(wildlife_csv, workers=2), wildlife_frame)
+
+
+def test_label_only_in_one_range(tmp_path):
+    path = str(tmp_path / "cities.csv")
+    pd.DataFrame({"City": ["Lahore"] * 50 + ["Karachi"] * 50 + [None, "Quetta"],
+                  "Temperature": np.arange(102.0)}).to_csv(path, index=False)
+    assert_same_store(read_ranges(path, 4), pd.read_csv(path))
+
+
+def test_header_only_file(tmp_path):
+    path = str(tmp_path / "empty.csv")
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("City,Temperature\n")
+    _, ranges = ingest.split_byte_ranges(path, 4)
+    assert ranges == []
+    frame = ingest.parallel_read_csv(path, workers=4)
+    assert list(frame.columns) == ["City", "Temperature"]
+    assert len(frame) == 0
+
+
+@pytest.mark.parametrize("column_name", ["Extra", "City"])
+def test_ranges_typing_a_column_differently(tmp_path, column_name):
+    # Numbers in the first half of the file, text in the second
+    path = str(tmp_path / "mixed.csv")
+    values = [str(i) for i in range(200)] + [f"site {i}" for i in range(200)]
+    pd.DataFrame({column_name: values, "Temperature": np.arange(400.0)}).to_csv(path, index=False)
+    assert_same_store(ingest.parallel_read_csv(path, workers=4), pd.read_csv(path))
+    assert loader.load_dataset(path, use_cache=False, workers=4, log=lambda line: None) is not None
@@ -0,0 +1,104 @@
+"""
+Query Engine Tests for Project 1 (Procedural Style)
+Checks the compiled predicates and the index-driven planner against a
+plain pandas evaluation of the same filters.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import column_store
+import query
+import retriever
+
+
+# Filter conjunctions covering equality, "in", "!=", ranges and the bitmap path
+FILTER_CASES = [
+    [("City", "==", "karachi")],
+    [("City", "==", "  LAHORE ")],
+    [("City", "in", ["Karachi", "quetta"])],
+    [("City", "!=", "Karachi")],
+    [("City", "==", "Atlantis")],
+    [("TimeOfDay", "==", "Morning"), ("AirQualityIndex", "<", 100)],
+    [("UrbanDevelopmentIndex", ">=", 0.5), ("ProximityToWaterSource", ">=", 6)],
+    [("SightingDuration_Min", ">", 30), ("Season", "==", "summer")],
+    [("AirQualityIndex", ">", 120), ("AirQualityIndex", "<=", 180)],
+    [("NearbyGreenSpaces", "==", 3)],
+    [("AirQualityIndex", "!=", 156)],
+    [("AirQualityIndex", ">", 1000)],
+    [("City", "==", "Karachi"), ("Season", "==", "Winter"), ("TimeOfDay", "==", "Night")],
+    [("City", "in", ["Peshawar", "Islamabad"]), ("InteractionType", "==", "fed")]
+]
+
+
+def pandas_rows(frame, filters):
+    """
+    Evaluate filters with plain pandas; missing values never match.
+    
+    Args:
+        frame (DataFrame): Data as parsed by pd.read_csv
+        filters (list): (column, op, value) tuples, combined with AND
+        
+    Returns:
+        ndarray: Sorted matching row positions
+    """
+    mask = pd.Series(True, index=frame.index)
+    for column_name, op, value in filters:
+        series = frame[column_name]
+        present = series.notna()
+        if pd.api.types.is_numeric_dtype(series):
+            mask &= present & query.NUMERIC_OPERATORS[op](series, value)
+            continue
+        labels = series.str.strip().str.lower()
+        wanted = [str(item).strip().lower() for item in query.filter_values(op, value)]
+        matched = labels.isin(wanted)
+        mask &= present & (~matched if op == "!=" else matched)
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_run_query_matches_pandas(dataset, wildlife_frame, filters):
+    assert np.array_equal(query.run_query(dataset, filters), pandas_rows(wildlife_frame, filters))
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_store_frame_uses_the_store(dataset, wildlife_frame, filters):
+    rows = query.select_frame_rows(dataset['frame'], filters)
+    assert np.array_equal(rows, pandas_rows(wildlife_frame, filters))
+
+
+def test_planner_starts_from_an_index(dataset):
+    candidates, remaining = query.plan_query(dataset, [("City", "==", "Karachi"), ("Humidity", ">", 50)])
+    assert candidates is not None
+    assert remaining == [("Humidity", ">", 50)]
+
+
+def test_unindexed_filters_scan(dataset):
+    candidates, remaining = query.plan_query(dataset, [("Humidity", ">", 50)])
+    assert candidates is None
+    assert remaining == [("Humidity", ">", 50)]
+
+
+def test_unsupported_operator_raises(dataset):
+    with pytest.raises(ValueError):
+        query.run_query(dataset, [("City", "<", "Karachi")])
+    with pytest.raises(ValueError):
+        query.run_query(dataset, [("AirQualityIndex", "in", [100])])
+
+
+def test_empty_dataset(wildlife_frame):
+    empty = column_store.build_store(wildlife_frame.iloc[:0].copy())
+    for filters in FILTER_CASES:
+        assert len(query.run_query(empty, filters)) == 0
+
+
+def test_bind_filters_substitutes_parameters():
+    spec = retriever.RETRIEVAL_TASKS["A2"]['filters']
+    assert query.bind_filters(spec, {'time_of_day': "Night", 'aqi_threshold': 60.0}) == [
+        ("TimeOfDay", "==", "Night"), ("AirQualityIndex", "<", 60.0)]
+
+
+def test_missing_columns(dataset):
+    assert query.missing_columns(dataset, [("City", "==", "Karachi"), ("Nope", "==", 1)]) == ["Nope"]
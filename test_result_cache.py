@@ -0,0 +1,146 @@
+"""
+Result Cache Tests for Project 1 (Procedural Style)
+Checks cache keys, hits and invalidation, eviction and persistence.
+Variable naming: snake_case
+"""
+
+import numpy as np
+import pytest
+
+import result_cache
+import retriever
+
+
+def counting(result):
+    """
+    Wrap a result in a compute function that counts its calls.
+    
+    Args:
+        result: Value the compute function returns
+        
+    Returns:
+        tuple: (compute function, list whose length is the number of calls)
+    """
+    calls = []
+    
+    def compute():
+        calls.append(1)
+        return result
+    
+    return compute, calls
+
+
+def test_nearby_thresholds_get_their_own_keys():
+    version = (1, 2, "abc")
+    key = result_cache.make_key("A2", {'time_of_day': "Night", 'aqi_threshold': 60.0}, version)
+    near = result_cache.make_key("A2", {'time_of_day': "Night", 'aqi_threshold': 60.0000001}, version)
+    assert key != near
+
+
+@pytest.mark.parametrize("value", [60, np.int64(60), np.float64(60.0), np.float32(60.0)])
+def test_equal_numbers_share_a_key(value):
+    assert result_cache.normalize_param(value) == result_cache.normalize_param(60.0)
+    assert hash(result_cache.normalize_param(value)) == hash(60.0)
+
+
+def test_strings_are_case_folded():
+    version = (1, 2, "abc")
+    assert (result_cache.make_key("A1", {'city': " Karachi"}, version)
+            == result_cache.make_key("A1", {'city': "KARACHI "}, version))
+
+
+def test_booleans_stay_booleans():
+    assert result_cache.normalize_param(True) is True
+    assert result_cache.normalize_param(np.bool_(False)) == np.bool_(False)
+
+
+def test_a2_thresholds_a_hair_apart(dataset, wildlife_frame):
+    # Records at exactly AQI 60 separate "< 60.0" from "< 60.0000001"
+    assert (wildlife_frame["AirQualityIndex"] == 60).any()
+    below = retriever.retrieve_ids(dataset, "A2", time_of_day="Morning", aqi_threshold=60.0)
+    near = retriever.retrieve_ids(dataset, "A2", time_of_day="Morning", aqi_threshold=60.0000001)
+    
+    morning = wildlife_frame["TimeOfDay"].str.lower() == "morning"
+    aqi = wildlife_frame["AirQualityIndex"]
+    assert np.array_equal(below, np.flatnonzero((morning & (aqi < 60.0)).to_numpy()))
+    assert np.array_equal(near, np.flatnonzero((morning & (aqi < 60.0000001)).to_numpy()))
+    assert len(near) > len(below)
+    assert result_cache.cache_stats()['misses'] == 2
+
+
+def test_hits_return_the_cached_result(dataset):
+    compute, calls = counting([1, 2, 3])
+    first = result_cache.cached(dataset, "B1", {'season': "Spring"}, compute)
+    second = result_cache.cached(dataset, "B1", {'season': "spring"}, compute)
+    assert second is first
+    assert len(calls) == 1
+    stats = result_cache.cache_stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+
+def test_new_fingerprint_misses(dataset):
+    compute, calls = counting([1])
+    result_cache.cached(dataset, "B1", {}, compute)
+    dataset['fingerprint'] = dict(dataset['fingerprint'], hash="changed")
+    result_cache.cached(dataset, "B1", {}, compute)
+    assert len(calls) == 2
+
+
+def test_inputs_without_a_version_are_not_cached(wildlife_frame):
+    compute, calls = counting([1])
+    result_cache.cached(wildlife_frame, "B1", {}, compute)
+    result_cache.cached(wildlife_frame, "B1", {}, compute)
+    result_cache.cached(iter([wildlife_frame]), "B1", {}, compute)
+    assert len(calls) == 3
+    assert result_cache.cache_stats()['entries'] == 0
+
+
+def test_store_frames_are_cached(dataset):
+    compute, calls = counting([1])
+    result_cache.cached(dataset['frame'], "C1", {}, compute)
+    result_cache.cached(dataset, "C1", {}, compute)
+    assert len(calls) == 1
+
+
+def test_least_recently_used_is_evicted(dataset, monkeypatch):
+    monkeypatch.setattr(result_cache, "MAX_ENTRIES", 2)
+    compute, calls = counting([1])
+    for task_id in ("A1", "A2", "A1", "A3"):
+        result_cache.cached(dataset, task_id, {}, compute)
+    assert result_cache.cache_stats()['evictions'] == 1
+    result_cache.cached(dataset, "A1", {}, compute)
+    assert len(calls) == 3
+
+
+def test_large_results_are_not_kept(dataset, monkeypatch):
+    monkeypatch.setattr(result_cache, "MAX_RESULT_ROWS", 2)
+    compute, calls = counting({'rows': [1, 2], 'more': np.arange(3)})
+    result_cache.cached(dataset, "B1", {}, compute)
+    result_cache.cached(dataset, "B1", {}, compute)
+    assert len(calls) == 2
+
+
+def test_empty_results_are_cached(dataset):
+    compute, calls = counting(np.empty(0, dtype=np.intp))
+    result_cache.cached(dataset, "A1", {'city': "Atlantis"}, compute)
+    result_cache.cached(dataset, "A1", {'city': "atlantis"}, compute)
+    assert len(calls) == 1
+
+
+def test_save_and_load_results(dataset, tmp_path):
+    path = str(tmp_path / "results.pkl")
+    result_cache.cached(dataset, "A1", {'city': "Karachi"}, lambda: [1])
+    result_cache.cached(dataset, "A2", {}, lambda: [2])
+    result_cache.save_results(path)
+    
+    result_cache.clear_results()
+    assert result_cache.load_results(path, version=("other",)) == 0
+    assert result_cache.load_results(path, version=result_cache.dataset_version(dataset)) == 2
+    assert result_cache.cached(dataset, "A1", {'city': "karachi"}, lambda: None) == [1]
+
+
+def test_load_missing_or_corrupt_file(tmp_path):
+    assert result_cache.load_results(str(tmp_path / "missing.pkl")) == 0
+    path = tmp_path / "corrupt.pkl"
+    path.write_bytes(b"")
+    assert result_cache.load_results(str(path)) == 0
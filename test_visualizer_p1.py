@@ -0,0 +1,106 @@
+"""
+Visualizer Tests for Project 1 (Procedural Style)
+Checks the Task C4 density path, including inputs with nothing to plot.
+Variable naming: snake_case
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import column_store
+import visualizer_p1
+
+
+def endangered_frame(n_rows, noise_missing, seed=11):
+    """
+    Build endangered-species records with some noise levels missing.
+    
+    Args:
+        n_rows (int): Records to build (all endangered)
+        noise_missing (float): Share of NoiseLevel_dB values left empty
+        seed (int): Random seed
+        
+    Returns:
+        DataFrame: IsEndangeredSpecies, NoiseLevel_dB, NumberOfSightings and
+                   WildlifeSpecies columns
+    """
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(40, 100, n_rows).astype(float)
+    noise[rng.random(n_rows) < noise_missing] = np.nan
+    return pd.DataFrame({
+        'IsEndangeredSpecies': "Yes",
+        'NoiseLevel_dB': noise,
+        'NumberOfSightings': rng.integers(1, 10, n_rows),
+        'WildlifeSpecies': rng.choice(["Owl", "Fox", "Bat"], n_rows)
+    })
+
+
+@pytest.fixture
+def headless(tmp_path, monkeypatch):
+    """Render headless into a temporary directory."""
+    monkeypatch.setattr(visualizer_p1, "headless_mode", True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_density_edges_rejects_empty_input():
+    with pytest.raises(ValueError):
+        visualizer_p1.density_edges(np.empty(0), visualizer_p1.DENSITY_BINS)
+    with pytest.raises(ValueError):
+        visualizer_p1.density_grid(np.empty(0), np.empty(0))
+
+
+def test_density_edges():
+    # One bin per integer over a small range, even bins otherwise
+    assert np.array_equal(visualizer_p1.density_edges(np.array([1.0, 3.0, 9.0]), 60), np.arange(0.5, 10.0))
+    assert np.array_equal(visualizer_p1.density_edges(np.array([2.5, 2.5]), 60), [2.0, 3.0])
+    edges = visualizer_p1.density_edges(np.array([0.0, 0.25, 1.0]), 4)
+    assert np.array_equal(edges, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_c4_all_noise_missing(headless, capsys):
+    # Above DENSITY_THRESHOLD with no record that has both coordinates
+    df = endangered_frame(600, noise_missing=1.0)
+    chart_data = visualizer_p1.compute_c4_custom_noise_scatter(df)
+    assert chart_data['records'] == 600
+    assert chart_data['density'] is None and chart_data['centroids'] is None
+    
+    visualizer_p1.task_c4_custom_noise_scatter(df)
+    assert "No endangered species records have both" in capsys.readouterr().out
+    assert os.listdir(headless) == []
+
+
+def test_c4_density_matches_pandas(headless):
+    df = endangered_frame(600, noise_missing=0.1)
+    chart_data = visualizer_p1.compute_c4_custom_noise_scatter(df)
+    located = df.dropna(subset=['NoiseLevel_dB'])
+    
+    counts, x_edges, y_edges = chart_data['density']
+    expected, _, _ = np.histogram2d(located['NoiseLevel_dB'], located['NumberOfSightings'], bins=[x_edges, y_edges])
+    assert counts.sum() == len(located)
+    assert np.array_equal(counts, expected)
+    
+    centroids = located.groupby('WildlifeSpecies')[['NoiseLevel_dB', 'NumberOfSightings']].mean()
+    assert np.allclose(chart_data['centroids'].loc[centroids.index].to_numpy(), centroids.to_numpy())
+    
+    visualizer_p1.task_c4_custom_noise_scatter(df)
+    assert os.path.isfile(headless / "project_1_c4_noise_scatter_endangered.png")
+
+
+def test_c4_small_input_keeps_points():
+    df = endangered_frame(visualizer_p1.DENSITY_THRESHOLD, noise_missing=1.0)
+    chart_data = visualizer_p1.compute_c4_custom_noise_scatter(df)
+    assert len(chart_data['points']) == visualizer_p1.DENSITY_THRESHOLD
+    assert chart_data['density'] is None
+
+
+def test_c4_without_endangered_records(capsys):
+    df = endangered_frame(10, noise_missing=0.0).assign(IsEndangeredSpecies="No")
+    assert visualizer_p1.compute_c4_custom_noise_scatter(df) is None
+    store_frame = column_store.build_store(df.copy())['frame']
+    assert visualizer_p1.compute_c4_custom_noise_scatter(store_frame) is None
+    visualizer_p1.task_c4_custom_noise_scatter(df)
+    assert "No endangered species found" in capsys.readouterr().out
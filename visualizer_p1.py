@@ -1,188 +1,505 @@
-"""
-Visualization Module for Project 1 (Procedural Style)
-Implements Task C (C1-C4) using matplotlib.
-Variable naming: snake_case
-"""
-
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
-
-
-def task_c1_temp_humidity_by_city(df, season):
-    """
-    Task C1: Compare average temperature and humidity across cities for a given season.
-    Creates a grouped bar chart.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        season (str): Season to filter by
-    """
-    print(f"\n=== Task C1: Temperature & Humidity by City ({season}) ===")
-    
-    # Filter by season
-    season_df = df[df['Season'].str.lower() == season.lower()]
-    
-    if season_df.empty:
-        print(f"No data found for season '{season}'.")
-        return
-    
-    # Group by city and calculate averages
-    city_stats = season_df.groupby('City').agg({
-        'Temperature': 'mean',
-        'Humidity': 'mean'
-    }).round(2)
-    
-    # Prepare data for plotting
-    cities = city_stats.index.tolist()
-    avg_temp = city_stats['Temperature'].tolist()
-    avg_humidity = city_stats['Humidity'].tolist()
-    
-    # Create grouped bar chart
-    x_pos = np.arange(len(cities))
-    width = 0.35
-    
-    plt.figure(figsize=(10, 6))
-    plt.bar(x_pos - width/2, avg_temp, width, label='Avg Temperature (°C)', color='orangered')
-    plt.bar(x_pos + width/2, avg_humidity, width, label='Avg Humidity (%)', color='steelblue')
-    
-    plt.xlabel('City')
-    plt.ylabel('Value')
-    plt.title(f'Average Temperature and Humidity by City - {season}')
-    plt.xticks(x_pos, cities)
-    plt.legend()
-    plt.tight_layout()
-    
-    # Save figure
-    filename = f'project_1_c1_temp_humidity_{season}.png'
-    plt.savefig(filename)
-    print(f"✓ Chart saved as '{filename}'")
-    plt.show()
-
-
-def task_c2_species_trends(df, city):
-    """
-    Task C2: Plot yearly trend of average sightings for each SpeciesCategory in a city.
-    Creates line plots.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        city (str): City name to filter by
-    """
-    print(f"\n=== Task C2: SpeciesCategory Trends in {city} ===")
-    
-    # Filter by city
-    city_df = df[df['City'].str.lower() == city.lower()]
-    
-    if city_df.empty:
-        print(f"No data found for city '{city}'.")
-        return
-    
-    # Group by year and SpeciesCategory
-    trends = city_df.groupby(['Year', 'SpeciesCategory'])['NumberOfSightings'].mean().unstack(fill_value=0)
-    
-    # Create line plot
-    plt.figure(figsize=(10, 6))
-    
-    for category in trends.columns:
-        plt.plot(trends.index, trends[category], marker='o', label=category)
-    
-    plt.xlabel('Year')
-    plt.ylabel('Average NumberOfSightings')
-    plt.title(f'Wildlife Sighting Trends by SpeciesCategory - {city}')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Save figure
-    filename = f'project_1_c2_species_trends_{city}.png'
-    plt.savefig(filename)
-    print(f"✓ Chart saved as '{filename}'")
-    plt.show()
-
-
-def task_c3_awareness_pie(df, city):
-    """
-    Task C3: Create pie chart showing proportion of average public awareness 
-    by ResidentialAreaType for a city.
-    
-    Args:
-        df (DataFrame): Wildlife data
-        city (str): City name to filter by
-    """
-    print(f"\n=== Task C3: Public Awareness Distribution in {city} ===")
-    
-    # Filter by city
-    city_df = df[df['City'].str.lower() == city.lower()]
-    
-    if city_df.empty:
-        print(f"No data found for city '{city}'.")
-        return
-    
-    # Group by ResidentialAreaType
-    awareness_by_area = city_df.groupby('ResidentialAreaType')['PublicAwarenessLevel'].mean()
-    
-    # Create pie chart
-    plt.figure(figsize=(8, 8))
-    plt.pie(awareness_by_area.values, 
-            labels=awareness_by_area.index, 
-            autopct='%1.1f%%',
-            startangle=90,
-            colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99'])
-    
-    plt.title(f'PublicAwarenessLevel by ResidentialAreaType - {city}')
-    plt.tight_layout()
-    
-    # Save figure
-    filename = f'project_1_c3_awareness_{city}.png'
-    plt.savefig(filename)
-    print(f"✓ Chart saved as '{filename}'")
-    plt.show()
-
-
-def task_c4_custom_noise_scatter(df):
-    """
-    Task C4 (Custom): Scatter plot of Noise Level vs NumberOfSightings 
-    for endangered species only.
-    
-    This custom task is unique to Project 1.
-    
-    Args:
-        df (DataFrame): Wildlife data
-    """
-    print(f"\n=== Task C4: Noise Level vs Sightings (Endangered Species) ===")
-    
-    # Filter for endangered species
-    endangered_df = df[df['IsEndangeredSpecies'].str.lower() == 'yes']
-    
-    if endangered_df.empty:
-        print("No endangered species found in dataset.")
-        return
-    
-    # Extract data for scatter plot
-    noise_levels = endangered_df['NoiseLevel_dB']
-    sightings = endangered_df['NumberOfSightings']
-    species_names = endangered_df['WildlifeSpecies']
-    
-    # Create scatter plot
-    plt.figure(figsize=(10, 6))
-    plt.scatter(noise_levels, sightings, alpha=0.6, s=100, color='coral', edgecolors='black')
-    
-    # Add labels for each point
-    for i, species in enumerate(species_names):
-        plt.annotate(species, (noise_levels.iloc[i], sightings.iloc[i]), 
-                    fontsize=8, alpha=0.7, xytext=(5, 5), textcoords='offset points')
-    
-    plt.xlabel('NoiseLevel_dB')
-    plt.ylabel('NumberOfSightings')
-    plt.title('Noise Level vs NumberOfSightings (Endangered Species Only)')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
-    # Save figure
-    filename = 'project_1_c4_noise_scatter_endangered.png'
-    plt.savefig(filename)
-    print(f"✓ Chart saved as '{filename}'")
-    plt.show()
-    
-    print(f"\nTotal endangered species records plotted: {len(endangered_df)}")
+"""
+Visualization Module for Project 1 (Procedural Style)
+Implements Task C (C1-C4) using matplotlib, interactively through pyplot
+or headless on standalone Agg figures (see set_headless).
+Variable naming: snake_case
+"""
+
+import json
+import os
+
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import pandas as pd
+import numpy as np
+
+import column_store
+import cube
+import groupby
+import profiling
+import result_cache
+
+
+# Headless mode draws on standalone Agg figures and never calls plt.show()
+headless_mode = False
+
+# Suffix of the file recording the parameters and data a chart was drawn from
+CHART_KEY_SUFFIX = ".key"
+
+# C4 draws a density grid instead of one labelled point per record above this many records
+DENSITY_THRESHOLD = 500
+
+# Most bins per axis of the C4 density grid
+DENSITY_BINS = 60
+
+
+def set_headless(enabled):
+    """
+    Switch headless rendering on or off.
+    
+    In headless mode charts are drawn on matplotlib.figure.Figure objects
+    that pyplot never sees, so no display is needed, nothing blocks, and a
+    chart whose PNG is already up to date is not drawn again.
+    
+    Args:
+        enabled (bool): Render headless
+    """
+    global headless_mode
+    headless_mode = enabled
+
+
+def new_figure(figsize):
+    """
+    Create a figure for one chart.
+    
+    Args:
+        figsize (tuple): Width and height in inches
+        
+    Returns:
+        Figure: Standalone figure in headless mode, else a pyplot figure
+    """
+    if headless_mode:
+        return Figure(figsize=figsize)
+    return plt.figure(figsize=figsize)
+
+
+def chart_key(df, task_id, params):
+    """
+    Identify the data and parameters a chart is drawn from.
+    
+    Args:
+        df (DataFrame): Task input
+        task_id (str): Task id (e.g. "C1")
+        params (dict): Task parameters
+        
+    Returns:
+        str: Key (see result_cache.make_key), or None when the input has no
+             dataset fingerprint
+    """
+    version = result_cache.dataset_version(df)
+    if version is None:
+        return None
+    return json.dumps(result_cache.make_key(task_id, params, version))
+
+
+def chart_is_current(filename, key):
+    """
+    Check whether a saved chart was drawn from the same parameters and data.
+    
+    Args:
+        filename (str): Chart PNG path
+        key (str): Key from chart_key
+        
+    Returns:
+        bool: True in headless mode when the PNG exists and its key matches
+    """
+    if not headless_mode or key is None or not os.path.isfile(filename):
+        return False
+    try:
+        with open(filename + CHART_KEY_SUFFIX, 'r', encoding='utf-8') as file:
+            return file.read() == key
+    except OSError:
+        return False
+
+
+def finish_figure(fig, filename, key):
+    """
+    Save a chart, show it when interactive, and close its figure.
+    
+    Args:
+        fig (Figure): Figure from new_figure
+        filename (str): Chart PNG path
+        key (str): Key from chart_key, recorded next to the PNG in headless mode
+    """
+    with profiling.stage('render'):
+        fig.tight_layout()
+        fig.savefig(filename)
+    print(f"✓ Chart saved as '{filename}'")
+    
+    if headless_mode:
+        if key is not None:
+            with open(filename + CHART_KEY_SUFFIX, 'w', encoding='utf-8') as file:
+                file.write(key)
+    else:
+        plt.show()
+    plt.close(fig)
+
+
+@profiling.profiled("C1")
+def task_c1_temp_humidity_by_city(df, season):
+    """
+    Task C1: Compare average temperature and humidity across cities for a given season.
+    Creates a grouped bar chart.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        season (str): Season to filter by
+    """
+    print(f"\n=== Task C1: Temperature & Humidity by City ({season}) ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        city_stats = result_cache.cached(df, 'C1', {'season': season}, lambda: compute_c1_temp_humidity_by_city(df, season))
+    
+    if city_stats is None:
+        print(f"No data found for season '{season}'.")
+        return
+    
+    filename = f'project_1_c1_temp_humidity_{season}.png'
+    key = chart_key(df, 'C1', {'season': season})
+    if chart_is_current(filename, key):
+        print(f"✓ Chart '{filename}' is up to date")
+        return
+    
+    # Prepare data for plotting
+    cities = city_stats.index.tolist()
+    avg_temp = city_stats['Temperature'].tolist()
+    avg_humidity = city_stats['Humidity'].tolist()
+    
+    # Create grouped bar chart
+    x_pos = np.arange(len(cities))
+    width = 0.35
+    
+    fig = new_figure((10, 6))
+    ax = fig.add_subplot()
+    ax.bar(x_pos - width/2, avg_temp, width, label='Avg Temperature (°C)', color='orangered')
+    ax.bar(x_pos + width/2, avg_humidity, width, label='Avg Humidity (%)', color='steelblue')
+    
+    ax.set_xlabel('City')
+    ax.set_ylabel('Value')
+    ax.set_title(f'Average Temperature and Humidity by City - {season}')
+    ax.set_xticks(x_pos, cities)
+    ax.legend()
+    
+    # Save figure
+    finish_figure(fig, filename, key)
+
+
+def compute_c1_temp_humidity_by_city(df, season):
+    """
+    Compute the Task C1 chart data.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        season (str): Season to filter by
+        
+    Returns:
+        DataFrame: Rounded average Temperature and Humidity per City, or
+                   None if no rows match the season
+    """
+    measures = ['Temperature', 'Humidity']
+    
+    # Average by city, from per-city sums and counts
+    sums, counts, records_found = cube.grouped_sums(df, measures, ['City'], [('Season', '==', season)])
+    if records_found == 0:
+        return None
+    return (sums / counts).round(2)
+
+
+@profiling.profiled("C2")
+def task_c2_species_trends(df, city):
+    """
+    Task C2: Plot yearly trend of average sightings for each SpeciesCategory in a city.
+    Creates line plots.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        city (str): City name to filter by
+    """
+    print(f"\n=== Task C2: SpeciesCategory Trends in {city} ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        trends = result_cache.cached(df, 'C2', {'city': city}, lambda: compute_c2_species_trends(df, city))
+    
+    if trends is None:
+        print(f"No data found for city '{city}'.")
+        return
+    
+    filename = f'project_1_c2_species_trends_{city}.png'
+    key = chart_key(df, 'C2', {'city': city})
+    if chart_is_current(filename, key):
+        print(f"✓ Chart '{filename}' is up to date")
+        return
+    
+    # Create line plot
+    fig = new_figure((10, 6))
+    ax = fig.add_subplot()
+    
+    for category in trends.columns:
+        ax.plot(trends.index, trends[category], marker='o', label=category)
+    
+    ax.set_xlabel('Year')
+    ax.set_ylabel('Average NumberOfSightings')
+    ax.set_title(f'Wildlife Sighting Trends by SpeciesCategory - {city}')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    # Save figure
+    finish_figure(fig, filename, key)
+
+
+def compute_c2_species_trends(df, city):
+    """
+    Compute the Task C2 chart data.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        city (str): City name to filter by
+        
+    Returns:
+        DataFrame: Average NumberOfSightings by Year (rows) and
+                   SpeciesCategory (columns), or None if no rows match the city
+    """
+    # Filter by city
+    city_df = df.iloc[column_store.select_rows(df, 'City', city)]
+    
+    if city_df.empty:
+        return None
+    
+    # Group by year (derived from Date) and SpeciesCategory
+    grouped = groupby.group_arrays(
+        {'Year': sighting_years(city_df['Date']), 'SpeciesCategory': city_df['SpeciesCategory']},
+        {'NumberOfSightings': city_df['NumberOfSightings'].to_numpy(dtype=float)},
+        [('NumberOfSightings', 'mean')])
+    return grouped['NumberOfSightings_mean'].rename('NumberOfSightings').unstack(fill_value=0)
+
+
+def sighting_years(dates):
+    """
+    Extract the year from Date values formatted as dd-mm-yy.
+    
+    Args:
+        dates (Series): Date column (categorical or string)
+        
+    Returns:
+        Series: Year of each sighting (NaN where the date does not parse)
+    """
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        # Parse each distinct label once, then map through the codes
+        label_years = pd.to_datetime(pd.Series(dates.cat.categories), format='%d-%m-%y', errors='coerce').dt.year
+        years = label_years.to_numpy(dtype=float)[dates.cat.codes.to_numpy()]
+        years[dates.cat.codes.to_numpy() < 0] = np.nan
+        return pd.Series(years, index=dates.index)
+    return pd.to_datetime(dates, format='%d-%m-%y', errors='coerce').dt.year
+
+
+@profiling.profiled("C3")
+def task_c3_awareness_pie(df, city):
+    """
+    Task C3: Create pie chart showing proportion of average public awareness 
+    by ResidentialAreaType for a city.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        city (str): City name to filter by
+    """
+    print(f"\n=== Task C3: Public Awareness Distribution in {city} ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        awareness_by_area = result_cache.cached(df, 'C3', {'city': city}, lambda: compute_c3_awareness_pie(df, city))
+    
+    if awareness_by_area is None:
+        print(f"No data found for city '{city}'.")
+        return
+    
+    filename = f'project_1_c3_awareness_{city}.png'
+    key = chart_key(df, 'C3', {'city': city})
+    if chart_is_current(filename, key):
+        print(f"✓ Chart '{filename}' is up to date")
+        return
+    
+    # Create pie chart
+    fig = new_figure((8, 8))
+    ax = fig.add_subplot()
+    ax.pie(awareness_by_area.values, 
+           labels=awareness_by_area.index, 
+           autopct='%1.1f%%',
+           startangle=90,
+           colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99'])
+    
+    ax.set_title(f'PublicAwarenessLevel by ResidentialAreaType - {city}')
+    
+    # Save figure
+    finish_figure(fig, filename, key)
+
+
+def compute_c3_awareness_pie(df, city):
+    """
+    Compute the Task C3 chart data.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        city (str): City name to filter by
+        
+    Returns:
+        Series: Average PublicAwarenessLevel per ResidentialAreaType, or
+                None if no rows match the city
+    """
+    # Average by ResidentialAreaType, from per-group sums and counts
+    sums, counts, records_found = cube.grouped_sums(df, ['PublicAwarenessLevel'], ['ResidentialAreaType'],
+                                                    [('City', '==', city)])
+    if records_found == 0:
+        return None
+    return sums['PublicAwarenessLevel'] / counts['PublicAwarenessLevel']
+
+
+@profiling.profiled("C4")
+def task_c4_custom_noise_scatter(df):
+    """
+    Task C4 (Custom): Scatter plot of Noise Level vs NumberOfSightings 
+    for endangered species only.
+    
+    Above DENSITY_THRESHOLD points the chart switches to a 2D histogram of
+    the points with only the per-species centroids labelled, so drawing
+    time and PNG size stay flat as the data grows.
+    
+    This custom task is unique to Project 1.
+    
+    Args:
+        df (DataFrame): Wildlife data
+    """
+    print(f"\n=== Task C4: Noise Level vs Sightings (Endangered Species) ===")
+    
+    with profiling.stage('aggregate', profiling.input_rows(df)):
+        chart_data = result_cache.cached(df, 'C4', {}, lambda: compute_c4_custom_noise_scatter(df))
+    
+    if chart_data is None:
+        print("No endangered species found in dataset.")
+        return
+    if chart_data['points'] is None and chart_data['density'] is None:
+        print("No endangered species records have both NoiseLevel_dB and NumberOfSightings.")
+        return
+    
+    filename = 'project_1_c4_noise_scatter_endangered.png'
+    key = chart_key(df, 'C4', {})
+    if chart_is_current(filename, key):
+        print(f"✓ Chart '{filename}' is up to date")
+        print(f"\nTotal endangered species records plotted: {chart_data['records']}")
+        return
+    
+    fig = new_figure((10, 6))
+    ax = fig.add_subplot()
+    
+    if chart_data['points'] is not None:
+        # Extract data for scatter plot
+        noise_levels = chart_data['points']['NoiseLevel_dB']
+        sightings = chart_data['points']['NumberOfSightings']
+        species_names = chart_data['points']['WildlifeSpecies']
+        
+        # Create scatter plot
+        ax.scatter(noise_levels, sightings, alpha=0.6, s=100, color='coral', edgecolors='black')
+        
+        # Add labels for each point
+        for i, species in enumerate(species_names):
+            ax.annotate(species, (noise_levels.iloc[i], sightings.iloc[i]), 
+                        fontsize=8, alpha=0.7, xytext=(5, 5), textcoords='offset points')
+    else:
+        # Density of points per cell, empty cells left blank
+        counts, x_edges, y_edges = chart_data['density']
+        mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), cmap='OrRd')
+        fig.colorbar(mesh, ax=ax, label='Records per cell')
+        
+        # Label each species at its centroid
+        centroids = chart_data['centroids']
+        ax.scatter(centroids['NoiseLevel_dB'], centroids['NumberOfSightings'],
+                   marker='X', s=80, color='black')
+        for species, centroid in centroids.iterrows():
+            ax.annotate(species, (centroid['NoiseLevel_dB'], centroid['NumberOfSightings']),
+                        fontsize=8, xytext=(5, 5), textcoords='offset points')
+    
+    ax.set_xlabel('NoiseLevel_dB')
+    ax.set_ylabel('NumberOfSightings')
+    ax.set_title('Noise Level vs NumberOfSightings (Endangered Species Only)')
+    ax.grid(True, alpha=0.3)
+    
+    # Save figure
+    finish_figure(fig, filename, key)
+    
+    print(f"\nTotal endangered species records plotted: {chart_data['records']}")
+
+
+def compute_c4_custom_noise_scatter(df):
+    """
+    Compute the Task C4 chart data.
+    
+    Up to DENSITY_THRESHOLD records the points themselves are kept; above
+    it they are reduced to a 2D histogram and per-species centroids.
+    
+    Args:
+        df (DataFrame): Wildlife data
+        
+    Returns:
+        dict: 'records', and either 'points' (NoiseLevel_dB,
+              NumberOfSightings and WildlifeSpecies of each record) or
+              'density' ((counts, x_edges, y_edges), see density_grid) and
+              'centroids' (mean position per species), both None when no
+              record has both coordinates; None if there are no endangered
+              species records
+    """
+    # Filter for endangered species
+    endangered_df = df.iloc[column_store.select_rows(df, 'IsEndangeredSpecies', 'yes')]
+    
+    if endangered_df.empty:
+        return None
+    
+    points = endangered_df[['NoiseLevel_dB', 'NumberOfSightings', 'WildlifeSpecies']]
+    chart_data = {'records': len(points), 'points': None, 'density': None, 'centroids': None}
+    if len(points) <= DENSITY_THRESHOLD:
+        chart_data['points'] = points
+        return chart_data
+    
+    # Records missing either coordinate cannot be placed on the grid
+    located = points.dropna(subset=['NoiseLevel_dB', 'NumberOfSightings'])
+    if located.empty:
+        return chart_data
+    chart_data['density'] = density_grid(located['NoiseLevel_dB'].to_numpy(dtype=float),
+                                         located['NumberOfSightings'].to_numpy(dtype=float))
+    chart_data['centroids'] = located.groupby('WildlifeSpecies', observed=True)[
+        ['NoiseLevel_dB', 'NumberOfSightings']].mean()
+    return chart_data
+
+
+def density_edges(values, bins):
+    """
+    Choose histogram bin edges along one axis.
+    
+    Integer-valued data with a small range gets one bin per integer, so
+    counts such as NumberOfSightings do not alias into empty stripes.
+    
+    Args:
+        values (ndarray): Finite values
+        bins (int): Most bins to use
+        
+    Returns:
+        ndarray: Bin edges
+        
+    Raises:
+        ValueError: If values is empty
+    """
+    if len(values) == 0:
+        raise ValueError("Cannot choose histogram bins for an empty axis.")
+    low, high = values.min(), values.max()
+    if np.all(values == np.round(values)) and high - low + 1 <= bins:
+        return np.arange(low - 0.5, high + 1.5)
+    if low == high:
+        return np.array([low - 0.5, high + 0.5])
+    return np.linspace(low, high, bins + 1)
+
+
+def density_grid(x, y):
+    """
+    Count points per cell of a 2D grid.
+    
+    Args:
+        x (ndarray): Horizontal coordinates (finite, at least one)
+        y (ndarray): Vertical coordinates (finite, at least one)
+        
+    Returns:
+        tuple: (counts shaped (len(x_edges) - 1, len(y_edges) - 1), x_edges, y_edges)
+        
+    Raises:
+        ValueError: If there are no points (see density_edges)
+    """
+    x_edges = density_edges(x, DENSITY_BINS)
+    y_edges = density_edges(y, DENSITY_BINS)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    return counts, x_edges, y_edges